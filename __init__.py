@@ -32,6 +32,8 @@ from . import properties
 from . import operators
 from . import panel
 from . import shape_key_utility
+from . import shape_key_stats
+from . import shape_key_prefetch
 
 def register():
     """Register all modules and translations"""
@@ -103,9 +105,45 @@ def register():
             default=True
         )
         
+        bpy.types.WindowManager.show_shape_key_stats = bpy.props.BoolProperty(
+            name="Show Shape Key Statistics",
+            description="Show displacement statistics of the active mesh's shape keys",
+            default=False
+        )
+        
+        bpy.types.WindowManager.shape_key_stats_sort = bpy.props.EnumProperty(
+            name="Sort By",
+            description="Column used to order the shape key statistics",
+            items=shape_key_stats.STAT_SORT_ITEMS,
+            default='NAME'
+        )
+        
+        bpy.types.WindowManager.shape_key_stats_descending = bpy.props.BoolProperty(
+            name="Descending",
+            description="Sort the shape key statistics in descending order",
+            default=False
+        )
+        
+        bpy.types.WindowManager.shape_key_history_limit = bpy.props.IntProperty(
+            name="History Memory Limit",
+            description="Memory in MB the shape key adjustment history may use before dropping the oldest steps",
+            default=512,
+            min=1,
+            max=65536
+        )
+        
         # Register handlers
         if utils.transform_handler not in bpy.app.handlers.depsgraph_update_post:
             bpy.app.handlers.depsgraph_update_post.append(utils.transform_handler)
+        if shape_key_stats.stats_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(shape_key_stats.stats_depsgraph_handler)
+        if shape_key_prefetch.group_weights_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(shape_key_prefetch.group_weights_depsgraph_handler)
+        for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if shape_key_stats.stats_undo_handler not in handlers:
+                handlers.append(shape_key_stats.stats_undo_handler)
+            if shape_key_prefetch.group_weights_undo_handler not in handlers:
+                handlers.append(shape_key_prefetch.group_weights_undo_handler)
         
         print("Shape Key Control Creator: Registration successful")
         
@@ -118,8 +156,23 @@ def unregister():
         # Unregister handlers
         if utils.transform_handler in bpy.app.handlers.depsgraph_update_post:
             bpy.app.handlers.depsgraph_update_post.remove(utils.transform_handler)
+        if shape_key_stats.stats_depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(shape_key_stats.stats_depsgraph_handler)
+        if shape_key_prefetch.group_weights_depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(shape_key_prefetch.group_weights_depsgraph_handler)
+        for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if shape_key_stats.stats_undo_handler in handlers:
+                handlers.remove(shape_key_stats.stats_undo_handler)
+            if shape_key_prefetch.group_weights_undo_handler in handlers:
+                handlers.remove(shape_key_prefetch.group_weights_undo_handler)
+        shape_key_prefetch.shutdown()
+        shape_key_utility.clear_redo_state()
         
         # Unregister properties
+        del bpy.types.WindowManager.shape_key_history_limit
+        del bpy.types.WindowManager.shape_key_stats_descending
+        del bpy.types.WindowManager.shape_key_stats_sort
+        del bpy.types.WindowManager.show_shape_key_stats
         del bpy.types.WindowManager.show_shape_key_adjustments
         del bpy.types.Scene.is_sync_enabled
         del bpy.types.Scene.metarig
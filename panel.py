@@ -3,6 +3,7 @@ import math
 import mathutils
 
 from . import properties
+from . import shape_key_stats
 from . import utils
 from bpy.types import Panel, Operator
 from bpy.props import EnumProperty, StringProperty, BoolProperty, FloatProperty
@@ -234,6 +235,29 @@ class SHAPEKEY_PT_tools_creator(Panel):
         if context.window_manager.get("show_shape_key_adjustments", True):
             row = box.row()
             row.operator("object.shape_key_adjustments", text="Adjustments Shape Key")
+            row = box.row()
+            row.operator("mesh.set_symmetry_center_edge", text="Set Symmetry Centre Edge", icon='MOD_MIRROR')
+            row = box.row(align=True)
+            row.operator("object.shape_key_interactive_adjust", text="Smooth", icon='MOD_SMOOTH').action = 'SMOOTH'
+            row.operator("object.shape_key_interactive_adjust", text="Normalize", icon='NORMALIZE_FCURVES').action = 'NORMALIZE'
+            row.operator("object.shape_key_interactive_adjust", text="Split", icon='MOD_EDGESPLIT').action = 'SPLIT'
+            row = box.row(align=True)
+            row.operator("object.shape_key_history_undo", text="Undo", icon='LOOP_BACK')
+            row.operator("object.shape_key_history_redo", text="Redo", icon='LOOP_FORWARDS')
+            row.prop(context.window_manager, "shape_key_history_limit", text="MB")
+            row = box.row()
+            row.operator("object.create_corrective_shape_key", text="Create Corrective Shape Key", icon='SHAPEKEY_DATA')
+            row = box.row()
+            row.operator("object.bake_pose_to_shape_key", text="Bake Pose to Shape Key", icon='ARMATURE_DATA')
+            row = box.row()
+            row.operator("object.bulk_transfer_shape_keys", text="Bulk Transfer Shape Keys", icon='TRANSFER_DATA')
+            row = box.row()
+            row.operator("object.find_duplicate_shape_keys", text="Find Duplicate Shape Keys", icon='DUPLICATE')
+            row = box.row()
+            row.operator("object.clean_all_shape_keys", text="Clean All Shape Keys", icon='BRUSH_DATA')
+            row = box.row(align=True)
+            row.operator("object.export_shape_key_library", text="Export Library", icon='EXPORT')
+            row.operator("object.import_shape_key_library", text="Import Library", icon='IMPORT')
                                 
 class SHAPE_OT_adjust_driver_value(Operator):
     """Adjust driver multiplier value"""
@@ -549,6 +573,66 @@ class SHAPEKEY_PT_sync_settings(Panel):
         if not is_rigify_bone:
             box.label(text="Select a Rigify bone in Edit mode", icon='INFO')
 
+class SHAPEKEY_PT_shape_key_stats(Panel):
+    """Shape Key Statistics Panel"""
+    bl_label = "Shape Key Statistics"
+    bl_idname = "SHAPEKEY_PT_shape_key_stats"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Shape Key Tools'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.active_object
+        wm = context.window_manager
+
+        row = layout.row(align=True)
+        is_expanded = wm.show_shape_key_stats
+        row.prop(wm, "show_shape_key_stats",
+                icon='DOWNARROW_HLT' if is_expanded else 'RIGHTARROW',
+                icon_only=True, emboss=False)
+        row.prop(wm, "shape_key_stats_sort", text="")
+        row.prop(wm, "shape_key_stats_descending", text="",
+                icon='SORT_DESC' if wm.shape_key_stats_descending else 'SORT_ASC')
+        row.operator("object.refresh_shape_key_stats", text="", icon='FILE_REFRESH').mesh_name = obj.name
+
+        if not is_expanded:
+            return
+
+        # 그리기 중에는 계산하지 않고 캐시된 값만 표시
+        key_blocks = obj.data.shape_keys.key_blocks
+        stats = {name: key_stats for name, key_stats in shape_key_stats.get_cached_stats(obj.data).items()
+                 if name in key_blocks}
+        if not stats:
+            layout.label(text="Press refresh to compute statistics", icon='INFO')
+            return
+
+        box = layout.box()
+        col = box.column(align=True)
+        header = col.row()
+        header.label(text="Shape Key")
+        header.label(text="Max")
+        header.label(text="Mean")
+        header.label(text="Affected")
+
+        for name in shape_key_stats.sorted_key_names(stats, wm.shape_key_stats_sort, wm.shape_key_stats_descending):
+            key_stats = stats[name]
+            row = col.row()
+            row.label(text=name, icon='SHAPEKEY_DATA')
+            row.label(text=f"{key_stats['max']:.4f}")
+            row.label(text=f"{key_stats['mean']:.4f}")
+            row.label(text=str(key_stats['affected']))
+
+        missing = len(key_blocks) - 1 - len(stats)
+        if missing > 0:
+            layout.label(text=f"{missing} shape keys not computed yet", icon='ERROR')
+
 classes = (
     OBJECT_OT_recreate_slider_templates,
     SHAPEKEY_PT_tools_creator,
@@ -558,4 +642,5 @@ classes = (
     SHAPE_OT_adjust_driver_value,
     OBJECT_OT_assign_shape_key_widget,
     SHAPEKEY_PT_sync_settings,
+    SHAPEKEY_PT_shape_key_stats,
 )
\ No newline at end of file
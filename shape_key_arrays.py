@@ -0,0 +1,757 @@
+import hashlib
+import itertools
+import numpy as np
+
+AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2}
+
+# 메쉬에 저장되는 캐시 이름
+SYMMETRY_ATTRIBUTE = ".skc_symmetry_{axis}"
+SYMMETRY_FINGERPRINT = "skc_symmetry_{axis}_fingerprint"
+
+def read_coords(data):
+    """Read every ``co`` of a vertex / shape key data collection as an (N, 3) float32 array"""
+    coords = np.empty(len(data) * 3, dtype=np.float32)
+    data.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+def write_coords(data, coords):
+    """Write an (N, 3) array back into a vertex / shape key data collection in one call"""
+    data.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32).ravel())
+
+def read_evaluated_coords(obj, depsgraph):
+    """Read the modifier / armature evaluated vertex positions of an object in one call
+
+    Returns:
+        numpy.ndarray: (N, 3) float32 coordinates in object space
+    """
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        return read_coords(mesh.vertices)
+    finally:
+        obj_eval.to_mesh_clear()
+
+def read_edge_vertices(mesh):
+    """Read mesh edges as an (E, 2) int32 array of vertex indices"""
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    return edges.reshape(-1, 2)
+
+def boundary_vertex_mask(mesh):
+    """Mark vertices that lie on an open boundary (edges used by exactly one face)"""
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    face_count = np.bincount(loop_edges, minlength=len(mesh.edges))
+
+    edges = read_edge_vertices(mesh)
+    mask = np.zeros(len(mesh.vertices), dtype=bool)
+    mask[edges[face_count == 1].ravel()] = True
+    return mask
+
+# data_type: (foreach 속성 이름, dtype, 성분 수)
+ATTRIBUTE_LAYOUT = {
+    'INT': ("value", np.int32, 1),
+    'FLOAT': ("value", np.float32, 1),
+    'FLOAT_VECTOR': ("vector", np.float32, 3),
+}
+
+def read_vertex_group_weights(mesh_obj, group_name):
+    """Read a vertex group as a dense (N,) float32 weight array (0 outside the group)"""
+    weights = np.zeros(len(mesh_obj.data.vertices), dtype=np.float32)
+    vertex_group = mesh_obj.vertex_groups.get(group_name)
+    if vertex_group is None:
+        raise KeyError(f"Vertex group not found: {group_name}")
+
+    group_index = vertex_group.index
+    for vertex in mesh_obj.data.vertices:
+        for element in vertex.groups:
+            if element.group == group_index:
+                weights[vertex.index] = element.weight
+                break
+    return weights
+
+def read_point_attribute(mesh, name, data_type='INT'):
+    """Read a point attribute as an array, or None if it is missing or of another type"""
+    attribute = mesh.attributes.get(name)
+    if attribute is None or attribute.data_type != data_type or attribute.domain != 'POINT':
+        return None
+    field, dtype, width = ATTRIBUTE_LAYOUT[data_type]
+    values = np.empty(len(attribute.data) * width, dtype=dtype)
+    attribute.data.foreach_get(field, values)
+    return values.reshape(-1, width) if width > 1 else values
+
+def write_point_attribute(mesh, name, values, data_type='INT'):
+    """Store an array as a point attribute, replacing one of another type"""
+    attribute = mesh.attributes.get(name)
+    if attribute is not None and (attribute.data_type != data_type or attribute.domain != 'POINT'):
+        mesh.attributes.remove(attribute)
+        attribute = None
+    if attribute is None:
+        attribute = mesh.attributes.new(name=name, type=data_type, domain='POINT')
+    field, dtype, _ = ATTRIBUTE_LAYOUT[data_type]
+    attribute.data.foreach_set(field, np.ascontiguousarray(values, dtype=dtype).ravel())
+
+def mesh_fingerprint(mesh, basis_co, *extra):
+    """Hash vertex count, basis coordinates and edges into a short hex string
+
+    Any extra values (e.g. axis, tolerance) are mixed into the hash as well.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.int64(len(basis_co)).tobytes())
+    digest.update(np.ascontiguousarray(basis_co, dtype=np.float32).tobytes())
+    digest.update(read_edge_vertices(mesh).tobytes())
+    for value in extra:
+        digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+def topology_fingerprint(mesh):
+    """Hash vertex count and edges only, so edited basis shapes still match"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.int64(len(mesh.vertices)).tobytes())
+    digest.update(read_edge_vertices(mesh).tobytes())
+    return digest.hexdigest()
+
+def read_key_deltas(key_block, basis):
+    """Return (basis_co, deltas) for a shape key relative to its basis"""
+    basis_co = read_coords(basis.data)
+    return basis_co, read_coords(key_block.data) - basis_co
+
+def read_keys_deltas(key_blocks, basis):
+    """Return (basis_co, deltas) for several shape keys as one (K, N, 3) array"""
+    basis_co = read_coords(basis.data)
+    return basis_co, read_keys_relative(key_blocks, basis_co)
+
+def read_keys_relative(key_blocks, basis_co):
+    """(K, N, 3) deltas of several shape keys against basis coordinates the caller already has"""
+    deltas = np.empty((len(key_blocks),) + basis_co.shape, dtype=np.float32)
+    for k, key_block in enumerate(key_blocks):
+        key_block.data.foreach_get("co", deltas[k].ravel())
+    deltas -= basis_co
+    return deltas
+
+def accumulate_key_deltas(key_blocks, basis_co, weights=None):
+    """Weighted sum of several shape key deltas, streamed one key at a time
+
+    Only one read buffer and one accumulator are allocated regardless of
+    how many keys are summed.
+
+    Args:
+        key_blocks: Shape keys to sum
+        basis_co: (N, 3) basis coordinates
+        weights: Optional weight per key, negative values subtract
+    """
+    merged = np.zeros_like(basis_co, dtype=np.float32)
+    buffer = np.empty_like(merged)
+    weights = weights if weights is not None else [1.0] * len(key_blocks)
+
+    for key_block, weight in zip(key_blocks, weights):
+        key_block.data.foreach_get("co", buffer.ravel())
+        buffer -= basis_co
+        buffer *= np.float32(weight)
+        merged += buffer
+    return merged
+
+# 이 개수 이하의 정점만 바뀌면 foreach_set 대신 정점별로 기록
+SPARSE_WRITE_LIMIT = 512
+
+class SparseDeltas:
+    """Displacements of the moving vertices only
+
+    ``indices`` is an (M,) int32 array of vertex indices shared by every key,
+    ``deltas`` an (M, 3) or (K, M, 3) float32 array and ``count`` the
+    vertex count N of the dense form. Element-wise actions (invert, flip,
+    normalize, clean) give the same result on ``deltas`` as on the dense
+    array, because vertices left out have a zero displacement.
+    """
+
+    def __init__(self, indices, deltas, count):
+        self.indices = indices
+        self.deltas = deltas
+        self.count = count
+
+    @classmethod
+    def from_dense(cls, deltas, threshold=0.0):
+        """Keep vertices displaced by more than threshold in any key, in one pass"""
+        moving = delta_lengths(deltas) > threshold
+        if moving.ndim > 1:
+            moving = moving.any(axis=0)
+        indices = np.nonzero(moving)[0].astype(np.int32)
+        return cls(indices, deltas[..., indices, :], deltas.shape[-2])
+
+    def to_dense(self):
+        dense = np.zeros(self.deltas.shape[:-2] + (self.count, 3), dtype=np.float32)
+        dense[..., self.indices, :] = self.deltas
+        return dense
+
+    def take(self, keep):
+        """Subset of the vertices selected by a boolean mask over ``indices``"""
+        return SparseDeltas(self.indices[keep], self.deltas[..., keep, :], self.count)
+
+    def apply(self, function):
+        """Run an element-wise delta function on the stored vertices only"""
+        return SparseDeltas(self.indices, function(self.deltas), self.count)
+
+    def __len__(self):
+        return len(self.indices)
+
+def write_sparse_deltas(key_block, basis_co, indices, deltas):
+    """Write (M, 3) deltas at the given vertex indices of a shape key
+
+    Other vertices keep what the key holds. Small edits are assigned per
+    vertex; larger ones are scattered into the key's current coordinates
+    and go through one foreach_set.
+    """
+    data = key_block.data
+    if len(indices) <= SPARSE_WRITE_LIMIT:
+        coords = basis_co[indices] + deltas
+        for index, co in zip(indices.tolist(), coords.tolist()):
+            data[index].co = co
+        return
+    coords = read_coords(data)
+    coords[indices] = basis_co[indices] + deltas
+    write_coords(data, coords)
+
+def delta_lengths(deltas):
+    """Per-vertex displacement length of an (..., N, 3) delta array"""
+    return np.sqrt(np.einsum('...j,...j->...', deltas, deltas))
+
+def max_delta_length(deltas):
+    """Largest displacement per key: a float for (N, 3), an array for (K, N, 3)"""
+    lengths = delta_lengths(deltas)
+    if lengths.shape[-1] == 0:
+        return np.zeros(lengths.shape[:-1], dtype=np.float32)
+    return lengths.max(axis=-1)
+
+def invert_deltas(deltas):
+    """Negate every displacement"""
+    return -deltas
+
+def flip_deltas(deltas, axes):
+    """Negate the displacement components of the given axes ('X', 'Y', 'Z')"""
+    flipped = deltas.copy()
+    for axis in axes:
+        flipped[..., AXIS_INDEX[axis]] *= -1
+    return flipped
+
+def normalize_deltas(deltas, target=1.0, max_deform=None):
+    """Scale deltas so the largest displacement of each key is ``target``
+
+    Keys without any displacement are left unchanged. ``max_deform`` skips
+    the length pass when the maximum per key is already known.
+
+    Returns:
+        tuple: (normalized deltas, max displacement before scaling)
+    """
+    if max_deform is None:
+        max_deform = max_delta_length(deltas)
+    scale = np.where(max_deform > 0, target / np.where(max_deform > 0, max_deform, 1.0), 1.0)
+    return deltas * np.asarray(scale, dtype=np.float32)[..., None, None], max_deform
+
+def clean_deltas(deltas, threshold):
+    """Snap displacements at or below threshold back to the basis
+
+    Returns:
+        tuple: (cleaned deltas, number of snapped vertices)
+    """
+    small = delta_lengths(deltas) <= threshold
+    cleaned = deltas.copy()
+    cleaned[small] = 0.0
+    return cleaned, int(np.count_nonzero(small))
+
+# 중복 검사 시그니처 차원 수
+SIGNATURE_DIMS = 32
+
+def sketch_projection(count, dims=SIGNATURE_DIMS, seed=0):
+    """Sparse random projection (count sketch) for deltas of ``count`` vertices
+
+    Every coordinate is added to one of ``dims`` buckets with a random sign.
+    Distances between sketches approximate distances between the full
+    deltas with the same variance bound as a dense Gaussian projection,
+    while the projection itself takes only two small arrays.
+
+    Returns:
+        tuple: ((count * 3,) bucket indices, (count * 3,) signs)
+    """
+    rng = np.random.default_rng(seed)
+    buckets = rng.integers(0, dims, size=count * 3, dtype=np.int32)
+    signs = rng.choice(np.array([-1.0, 1.0], dtype=np.float32), size=count * 3)
+    return buckets, signs
+
+def delta_signature(deltas, projection, dims=SIGNATURE_DIMS):
+    """(dims,) float64 signature of one key's (N, 3) deltas"""
+    buckets, signs = projection
+    return np.bincount(buckets, weights=deltas.ravel() * signs, minlength=dims)
+
+def delta_signatures(deltas, dims=SIGNATURE_DIMS, seed=0):
+    """Signatures of each key of (K, N, 3) deltas, see sketch_projection
+
+    Returns:
+        np.ndarray: (K, dims) float64 signatures
+    """
+    projection = sketch_projection(deltas.shape[-2], dims, seed)
+    return np.stack([delta_signature(key_deltas, projection, dims) for key_deltas in deltas])
+
+def relative_distances(a, b):
+    """||a - b|| / max(||a||, ||b||) between matching rows of two (M, ...) arrays"""
+    a = a.reshape(len(a), -1)
+    b = b.reshape(len(b), -1)
+    norm = np.maximum(np.linalg.norm(a, axis=1), np.linalg.norm(b, axis=1))
+    return np.linalg.norm(a - b, axis=1) / np.maximum(norm, 1e-12)
+
+def find_duplicate_groups(signatures, load_rows, tolerance=0.01, slack=2.0, batch_size=16):
+    """Group keys whose deltas are nearly identical
+
+    Signatures are compared first to collect candidate pairs, which are then
+    confirmed with the exact relative distance. Full deltas are only loaded
+    for candidates, one representative and a batch of its candidates at a
+    time. Groups are built greedily: the earliest key becomes the
+    representative and only keys confirmed against it join, so a group
+    never chains beyond the tolerance. Keys without any displacement are
+    left out.
+
+    Args:
+        signatures: (K, dims) signatures from delta_signature
+        load_rows: Callable returning (len(indices), N, 3) deltas for a list of key indices
+        tolerance: Largest relative distance still counted as a duplicate
+        slack: Candidate threshold as a multiple of tolerance, absorbing
+            projection error
+
+    Returns:
+        list: (representative index, [(member index, similarity), ...]) per group,
+        similarity being 1 - relative distance
+    """
+    norms = np.linalg.norm(signatures, axis=1)
+    active = norms > 0
+
+    # 시그니처 거리 행렬 (K가 작으므로 전체 계산)
+    gram = signatures @ signatures.T
+    squared = np.maximum(norms[:, None] ** 2 + norms[None, :] ** 2 - 2.0 * gram, 0.0)
+    scale = np.maximum(np.maximum(norms[:, None], norms[None, :]), 1e-12)
+    candidate = (np.sqrt(squared) / scale <= tolerance * slack) & active[:, None] & active[None, :]
+    candidate = np.triu(candidate, k=1)
+
+    rows, cols = np.nonzero(candidate)
+    assigned = np.zeros(len(signatures), dtype=bool)
+    groups = []
+    for representative in np.unique(rows):
+        if assigned[representative]:
+            continue
+        candidates = [int(col) for col in cols[rows == representative] if not assigned[col]]
+        if not candidates:
+            continue
+
+        reference = load_rows([int(representative)])
+        members = []
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            distances = relative_distances(np.broadcast_to(reference, (len(batch),) + reference.shape[1:]),
+                                           load_rows(batch))
+            members.extend((member, float(1.0 - distance))
+                           for member, distance in zip(batch, distances) if distance <= tolerance)
+        if not members:
+            continue
+        assigned[representative] = True
+        for member, _ in members:
+            assigned[member] = True
+        groups.append((int(representative), members))
+    return groups
+
+def _mix_bits(h):
+    """splitmix64 finalizer on a uint64 array"""
+    h = h ^ (h >> np.uint64(30))
+    h = h * np.uint64(0xBF58476D1CE4E5B9)
+    h = h ^ (h >> np.uint64(27))
+    h = h * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+def lattice_values(cells, seed):
+    """Random vectors in [-1, 1] for integer lattice points, hashed instead of stored
+
+    Args:
+        cells: (N, 3) int64 lattice coordinates
+        seed: Integer mixed into the hash
+
+    Returns:
+        numpy.ndarray: (N, 3) float32 values, the same for equal cells and seed
+    """
+    cells = cells.astype(np.uint64)
+    h = _mix_bits(cells[:, 0] * np.uint64(0x9E3779B97F4A7C15)
+                  ^ cells[:, 1] * np.uint64(0xC2B2AE3D27D4EB4F)
+                  ^ cells[:, 2] * np.uint64(0x165667B19E3779F9)
+                  ^ np.uint64(seed))
+    values = np.empty((len(cells), 3), dtype=np.float32)
+    for component in range(3):
+        bits = _mix_bits(h + np.uint64((component + 1) * 0x9E3779B97F4A7C15 % (1 << 64))) >> np.uint64(40)
+        values[:, component] = bits.astype(np.float32) * np.float32(2.0 / (1 << 24)) - np.float32(1.0)
+    return values
+
+def lattice_noise(coords, cell_size, rng):
+    """Smooth noise in [-1, 1]: random values on a grid, trilinearly interpolated
+
+    Grid values are hashed from the integer cell coordinates, so memory
+    stays proportional to the vertex count however fine the grid is.
+
+    Args:
+        coords: (N, 3) sample positions
+        cell_size: Grid spacing; larger values give broader features
+        rng: numpy.random.Generator, only used to draw the hash seed
+
+    Returns:
+        numpy.ndarray: (N, 3) float32 noise vectors
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    seed = int(rng.integers(0, 2 ** 63))
+    origin = coords.min(axis=0)
+    relative = (coords - origin) / max(cell_size, 1e-9)
+    base = np.floor(relative).astype(np.int64)
+    fraction = (relative - base).astype(np.float32)
+
+    noise = np.zeros((len(coords), 3), dtype=np.float32)
+    for corner in itertools.product((0, 1), repeat=3):
+        weight = np.prod(np.where(corner, fraction, 1.0 - fraction), axis=1)
+        noise += weight[:, None] * lattice_values(base + np.array(corner), seed)
+    return noise
+
+def randomize_deltas(deltas, strength, rng=None, coords=None, noise_scale=0.0, mask=None):
+    """Add random variation of up to ``strength`` to every component
+
+    Args:
+        deltas: (N, 3) displacements
+        strength: Maximum offset per component
+        rng: numpy.random.Generator, seed it for reproducible results
+        coords: (N, 3) basis coordinates, required for smooth noise
+        noise_scale: Grid spacing of smooth noise; 0 gives independent per-vertex noise
+        mask: Optional (N,) weights scaling the variation per vertex
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if noise_scale > 0:
+        noise = lattice_noise(coords, noise_scale, rng)
+    else:
+        noise = rng.uniform(-1.0, 1.0, size=deltas.shape).astype(np.float32)
+
+    noise *= np.float32(strength)
+    if mask is not None:
+        noise *= mask[:, None]
+    return deltas + noise
+
+def smoothstep(x):
+    """Hermite step from 0 to 1 over x in [0, 1]"""
+    x = np.clip(x, 0.0, 1.0)
+    return x * x * (3.0 - 2.0 * x)
+
+def band_split_deltas(deltas, boundaries, falloff=0.0, max_deform=None):
+    """Split deltas into magnitude bands relative to each key's maximum displacement
+
+    Each vertex is assigned to bands by its displacement ratio to the
+    maximum. Around every boundary the assignment blends over ``falloff``
+    (a ratio width), and the band weights always sum to one, so the bands
+    add back up to the original deltas.
+
+    Args:
+        deltas: (N, 3) or (K, N, 3) displacements
+        boundaries: Increasing ratios in (0, 1) separating the bands
+        falloff: Width of the blend around each boundary, 0 for a hard split
+        max_deform: Known maximum displacement per key, computed if None
+
+    Returns:
+        numpy.ndarray: (len(boundaries) + 1, ...) band deltas, lowest band first
+    """
+    lengths = delta_lengths(deltas)
+    if max_deform is None:
+        max_deform = lengths.max(axis=-1) if lengths.shape[-1] else np.zeros(lengths.shape[:-1])
+    max_deform = np.asarray(max_deform, dtype=np.float32)[..., None]
+    ratio = np.where(max_deform > 0, lengths / np.where(max_deform > 0, max_deform, 1.0), 0.0)
+
+    # 경계마다 위쪽 밴드에 속하는 정도
+    above = []
+    for boundary in boundaries:
+        if falloff > 0:
+            above.append(smoothstep((ratio - boundary) / falloff + 0.5))
+        else:
+            above.append((ratio > boundary).astype(np.float64))
+
+    weights = [1.0 - above[0]] if above else [np.ones_like(ratio)]
+    for lower, upper in zip(above, above[1:] + [np.zeros_like(ratio)]):
+        weights.append(lower - upper)
+
+    return np.stack([deltas * weight[..., None].astype(np.float32) for weight in weights])
+
+def split_deltas(deltas, threshold, falloff=0.0, max_deform=None):
+    """Split deltas into high / low parts by displacement ratio to each key's maximum
+
+    Returns:
+        tuple: (high deltas, low deltas)
+    """
+    low, high = band_split_deltas(deltas, [threshold], falloff, max_deform)
+    return high, low
+
+def side_weights(coords, axis, falloff=0.0):
+    """Weight of the positive side of the axis per vertex, blended across the centre line
+
+    Vertices exactly on the centre line get 0.5 with a hard split so the two
+    sides always add back up to one.
+
+    Args:
+        coords: (N, 3) basis coordinates
+        axis: Axis ('X', 'Y' or 'Z') whose positive side is weighted
+        falloff: Total width of the blend band around the centre line
+    """
+    position = np.asarray(coords[:, AXIS_INDEX[axis]], dtype=np.float64)
+    if falloff > 0:
+        weights = smoothstep(position / falloff + 0.5)
+    else:
+        weights = np.where(position > 0, 1.0, np.where(position < 0, 0.0, 0.5))
+    return weights.astype(np.float32)
+
+def split_sides_deltas(deltas, weights):
+    """Split (N, 3) or (K, N, 3) deltas into positive and negative side halves
+
+    Returns:
+        tuple: (positive side deltas, negative side deltas)
+    """
+    positive = deltas * weights[:, None]
+    return positive, deltas - positive
+
+def build_adjacency(edges, count):
+    """Build compressed sparse row vertex adjacency from an (E, 2) edge array
+
+    Returns:
+        tuple: (offsets, neighbors) where the neighbours of vertex i are
+        neighbors[offsets[i]:offsets[i + 1]]
+    """
+    rows = np.concatenate((edges[:, 0], edges[:, 1]))
+    cols = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.argsort(rows, kind='stable')
+
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=count), out=offsets[1:])
+    return offsets, cols[order].astype(np.int32)
+
+def smooth_deltas(deltas, adjacency, strength=0.5, iterations=1, pinned=None, weights=None):
+    """Laplacian smoothing of displacements over a CSR adjacency
+
+    Each iteration moves every vertex toward the average displacement of
+    its neighbours by ``strength``, using the previous iteration's values.
+    Only the neighbour lists of vertices that can move are gathered, so a
+    small mask costs time in proportion to its size.
+
+    Args:
+        deltas: (N, 3) or (K, N, 3) displacements
+        adjacency: (offsets, neighbors) from build_adjacency
+        strength: Interpolation factor toward the neighbour average
+        iterations: Number of smoothing passes
+        pinned: Optional (N,) bool mask of vertices that must not move
+        weights: Optional (N,) per-vertex strength multiplier (e.g. vertex group weights)
+    """
+    offsets, neighbors = adjacency
+    degree = np.diff(offsets)
+
+    movable = degree > 0
+    if pinned is not None:
+        movable &= ~pinned
+    if weights is not None:
+        movable &= weights > 0
+    rows = np.nonzero(movable)[0]
+
+    result = np.array(deltas, dtype=np.float32)
+    if not len(rows):
+        return result
+
+    # 움직이는 정점의 이웃 목록만 모음
+    counts = degree[rows]
+    row_starts = np.zeros(len(rows), dtype=np.int64)
+    np.cumsum(counts[:-1], out=row_starts[1:])
+    gather = np.repeat(offsets[rows] - row_starts, counts) + np.arange(int(counts.sum()))
+    row_neighbors = neighbors[gather]
+
+    inverse_degree = (1.0 / counts).astype(np.float32)[:, None]
+    factor = np.full((len(rows), 1), strength, dtype=np.float32)
+    if weights is not None:
+        factor *= weights[rows, None]
+
+    for _ in range(iterations):
+        average = np.add.reduceat(result[..., row_neighbors, :], row_starts, axis=-2) * inverse_degree
+        result[..., rows, :] += (average - result[..., rows, :]) * factor
+    return result
+
+def _cell_keys(cells, dims):
+    """Encode non-negative integer grid cells into one int64 key per row"""
+    return (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+def drain(job):
+    """Run a progress generator to completion and return its result"""
+    while True:
+        try:
+            next(job)
+        except StopIteration as stop:
+            return stop.value
+
+def build_symmetry_map(coords, axis, tolerance=0.0001):
+    """Pair every vertex with its mirror partner across the given axis
+
+    Uses a sorted hash grid whose cells are wider than the tolerance, so each
+    vertex is only compared against the few cells its mirrored tolerance box
+    overlaps. Vertices on the mirror plane are paired with themselves.
+
+    Args:
+        coords: (N, 3) basis coordinates
+        axis: Mirror axis ('X', 'Y' or 'Z')
+        tolerance: Maximum per-component distance between partners
+
+    Returns:
+        numpy.ndarray: (N,) int32 mirror index per vertex, -1 where unmatched
+    """
+    return drain(iter_symmetry_map(coords, axis, tolerance))
+
+def iter_symmetry_map(coords, axis, tolerance=0.0001, chunk_size=None):
+    """Generator form of build_symmetry_map
+
+    Query vertices are processed in chunks of ``chunk_size`` (all at once
+    by default), yielding the number of vertices done after each chunk.
+    The map is the generator's return value.
+    """
+    axis_index = AXIS_INDEX[axis]
+    count = len(coords)
+    mirror_map = np.full(count, -1, dtype=np.int32)
+    if count == 0:
+        return mirror_map
+
+    coords = np.asarray(coords, dtype=np.float64)
+    mirrored = coords.copy()
+    mirrored[:, axis_index] *= -1
+
+    cell_size = max(tolerance, 1e-9) * 4.0
+    cells = np.floor(coords / cell_size).astype(np.int64)
+    query_lo = np.floor((mirrored - tolerance) / cell_size).astype(np.int64)
+    query_hi = np.floor((mirrored + tolerance) / cell_size).astype(np.int64)
+
+    # 격자 원점을 0 이상으로 맞춤
+    origin = np.minimum(cells.min(axis=0), query_lo.min(axis=0))
+    cells -= origin
+    query_lo -= origin
+    query_hi -= origin
+    dims = np.maximum(cells.max(axis=0), query_hi.max(axis=0)) + 1
+    if int(dims[0]) * int(dims[1]) * int(dims[2]) >= 2 ** 62:
+        raise ValueError("Symmetry tolerance is too small for the mesh size")
+
+    keys = _cell_keys(cells, dims)
+    order = np.argsort(keys, kind='stable')
+    unique_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+    best_dist = np.full(count, np.inf)
+    spans_next = query_hi > query_lo
+    chunk_size = chunk_size or count
+    for start in range(0, count, chunk_size):
+        stop = min(start + chunk_size, count)
+        for offset in itertools.product((0, 1), repeat=3):
+            needed = np.ones(stop - start, dtype=bool)
+            for i, step in enumerate(offset):
+                if step:
+                    needed &= spans_next[start:stop, i]
+            rows = np.nonzero(needed)[0] + start
+            if not len(rows):
+                continue
+
+            query_keys = _cell_keys(query_lo[rows] + np.array(offset, dtype=np.int64), dims)
+            slot = np.minimum(np.searchsorted(unique_keys, query_keys), len(unique_keys) - 1)
+            found = unique_keys[slot] == query_keys
+            rows, slot = rows[found], slot[found]
+            lo, span = starts[slot], counts[slot]
+
+            for k in range(int(span.max()) if len(span) else 0):
+                has = span > k
+                sub_rows = rows[has]
+                candidates = order[lo[has] + k]
+                dist = np.abs(coords[candidates] - mirrored[sub_rows]).max(axis=1)
+                better = (dist < tolerance) & (dist < best_dist[sub_rows])
+                best_dist[sub_rows[better]] = dist[better]
+                mirror_map[sub_rows[better]] = candidates[better]
+        yield stop
+
+    # 서로를 가리키는 쌍만 유지
+    matched = np.nonzero(mirror_map >= 0)[0]
+    mutual = mirror_map[mirror_map[matched]] == matched
+    mirror_map[matched[~mutual]] = -1
+    return mirror_map
+
+def mirror_deltas(deltas, mirror_map, axis):
+    """Swap each displacement with its mirror partner's, reflected across the axis
+
+    Unmatched vertices keep their own displacement.
+    """
+    axis_index = AXIS_INDEX[axis]
+    mirrored = deltas.copy()
+    matched = np.nonzero(mirror_map >= 0)[0]
+    mirrored[..., matched, :] = deltas[..., mirror_map[matched], :]
+    mirrored[..., matched, axis_index] *= -1
+    return mirrored
+
+def symmetrize_deltas(deltas, coords, mirror_map, axis, positive=True, tolerance=0.0001, topological=False):
+    """Copy the displacement of one side onto the other, reflected across the axis
+
+    Vertices on the mirror plane lose their displacement along the axis.
+    """
+    result = deltas.copy()
+    symmetrize_rows(result, deltas, coords, mirror_map, axis, positive, tolerance, topological=topological)
+    return result
+
+def symmetrize_rows(result, deltas, coords, mirror_map, axis, positive=True, tolerance=0.0001, start=0, stop=None,
+                    topological=False):
+    """Apply symmetrize_deltas for the source vertices in [start, stop) into ``result``
+
+    ``result`` must start as a copy of ``deltas``. Chunks may be processed
+    in any order since every vertex is written by at most one source.
+
+    With a ``topological`` map the basis need not be symmetric: a vertex is
+    a source when it lies further on the chosen side than its partner, and
+    the centre line is the set of vertices paired with themselves.
+    """
+    axis_index = AXIS_INDEX[axis]
+    side = coords[start:stop, axis_index] if positive else -coords[start:stop, axis_index]
+    partners = mirror_map[start:stop]
+    matched = partners >= 0
+
+    if topological:
+        rows = np.arange(start, start + len(partners))
+        partner_side = coords[np.maximum(partners, 0), axis_index] * (1 if positive else -1)
+        is_source = matched & (partners != rows) & (side > partner_side)
+        is_center = partners == rows
+    else:
+        is_source = (side > tolerance) & matched
+        is_center = (np.abs(side) <= tolerance) & matched
+
+    sources = np.nonzero(is_source)[0] + start
+    targets = mirror_map[sources]
+    result[..., targets, :] = deltas[..., sources, :]
+    result[..., targets, axis_index] *= -1
+
+    center = np.nonzero(is_center)[0] + start
+    result[..., center, axis_index] = 0.0
+
+def get_cached_symmetry_map(mesh, basis_co, axis, tolerance=0.0001):
+    """Return the symmetry map stored on the mesh, rebuilding it if the mesh changed
+
+    The map is kept as a hidden INT point attribute per axis so it survives
+    save/reload. It is rebuilt only when the fingerprint of the vertex count,
+    basis coordinates, edges and tolerance no longer matches.
+
+    Returns:
+        numpy.ndarray: (N,) int32 mirror index per vertex, -1 where unmatched
+    """
+    return drain(iter_cached_symmetry_map(mesh, basis_co, axis, tolerance))
+
+def iter_cached_symmetry_map(mesh, basis_co, axis, tolerance=0.0001, chunk_size=None):
+    """Generator form of get_cached_symmetry_map, yielding progress while rebuilding"""
+    attribute_name = SYMMETRY_ATTRIBUTE.format(axis=axis.lower())
+    fingerprint_key = SYMMETRY_FINGERPRINT.format(axis=axis.lower())
+    fingerprint = mesh_fingerprint(mesh, basis_co, axis, float(tolerance))
+
+    if mesh.get(fingerprint_key) == fingerprint:
+        mirror_map = read_point_attribute(mesh, attribute_name)
+        if mirror_map is not None and len(mirror_map) == len(basis_co):
+            return mirror_map
+
+    mirror_map = yield from iter_symmetry_map(basis_co, axis, tolerance, chunk_size)
+    write_point_attribute(mesh, attribute_name, mirror_map)
+    mesh[fingerprint_key] = fingerprint
+    return mirror_map
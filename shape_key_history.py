@@ -0,0 +1,236 @@
+import zlib
+import bpy
+import numpy as np
+
+from . import shape_key_arrays
+from . import shape_key_stats
+
+# 오래된 단계부터 제거 (undo 스택 앞쪽이 가장 오래됨)
+_undo_stack = []
+_redo_stack = []
+
+def _pack(array):
+    return zlib.compress(np.ascontiguousarray(array).tobytes(), 1)
+
+def _unpack(data, dtype, shape):
+    return np.frombuffer(zlib.decompress(data), dtype=dtype).reshape(shape)
+
+class KeyRecord:
+    """Changed vertices of one shape key, stored compressed
+
+    Indices are delta-encoded before compression since they are sorted.
+    ``created`` keys did not exist before the step; their old values are
+    the basis coordinates.
+    """
+
+    def __init__(self, name, indices, old_co, new_co, created=False):
+        self.name = name
+        self.count = len(indices)
+        self.created = created
+        self.indices = _pack(np.diff(indices, prepend=0).astype(np.int32))
+        self.old_co = _pack(old_co.astype(np.float32))
+        self.new_co = _pack(new_co.astype(np.float32))
+
+    @property
+    def nbytes(self):
+        return len(self.indices) + len(self.old_co) + len(self.new_co)
+
+    def read(self):
+        """Return (indices, old coordinates, new coordinates)"""
+        indices = np.cumsum(_unpack(self.indices, np.int32, (self.count,)), dtype=np.int64)
+        return (indices,
+                _unpack(self.old_co, np.float32, (self.count, 3)),
+                _unpack(self.new_co, np.float32, (self.count, 3)))
+
+class HistoryStep:
+    """One recorded edit: KeyRecords grouped per object name"""
+
+    def __init__(self, label):
+        self.label = label
+        self.records = {}
+
+    @property
+    def nbytes(self):
+        return sum(record.nbytes for records in self.records.values() for record in records)
+
+class HistoryRecorder:
+    """Snapshot the keys an edit may touch, then diff them once it finished
+
+    Usage:
+        recorder = HistoryRecorder("Smooth")
+        recorder.track(mesh_obj, key_names)
+        ... run the edit ...
+        recorder.commit(limit_bytes)
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self._snapshots = {}
+
+    def track(self, mesh_obj, key_names=(), known_coords=None, deferred=False):
+        """Remember the current coordinates of the keys and which keys exist
+
+        ``known_coords`` maps key names to coordinates the caller already
+        holds, which are used instead of reading those keys again. With
+        ``deferred`` the other keys are not read here; the edit has to pass
+        their pre-edit deltas to track_deltas() before writing them.
+        """
+        shape_keys = mesh_obj.data.shape_keys
+        existing = {key_block.name for key_block in shape_keys.key_blocks} if shape_keys else set()
+        known_coords = known_coords or {}
+        coords = {}
+        for name in key_names:
+            if name not in existing:
+                continue
+            if name in known_coords:
+                coords[name] = known_coords[name]
+            elif deferred:
+                coords[name] = None
+            else:
+                coords[name] = shape_key_arrays.read_coords(shape_keys.key_blocks[name].data)
+        self._snapshots[mesh_obj.name] = (existing, coords)
+
+    def track_deltas(self, mesh_obj, key_names, basis_co, deltas):
+        """Fill deferred snapshots from (K, N, 3) pre-edit deltas the edit already read
+
+        The arrays are kept by reference and only turned into coordinates
+        one key at a time in commit(), so they must not be modified.
+        """
+        snapshot = self._snapshots.get(mesh_obj.name)
+        if snapshot is None:
+            return
+        coords = snapshot[1]
+        for name, key_deltas in zip(key_names, deltas):
+            if name in coords and coords[name] is None:
+                coords[name] = (basis_co, key_deltas)
+
+    def commit(self, limit_bytes):
+        """Push the differences as one undo step; returns the step or None if nothing changed"""
+        step = HistoryStep(self.label)
+        for object_name, (existing, coords) in self._snapshots.items():
+            mesh_obj = bpy.data.objects.get(object_name)
+            if not mesh_obj or not mesh_obj.data.shape_keys:
+                continue
+            key_blocks = mesh_obj.data.shape_keys.key_blocks
+            basis_co = shape_key_arrays.read_coords(key_blocks[0].data)
+
+            records = []
+            for key_block in key_blocks:
+                created = key_block.name not in existing
+                if not created and coords.get(key_block.name) is None:
+                    continue
+                old_co = basis_co if created else coords[key_block.name]
+                if isinstance(old_co, tuple):
+                    old_co = old_co[0] + old_co[1]
+                new_co = shape_key_arrays.read_coords(key_block.data)
+                indices = np.nonzero((old_co != new_co).any(axis=1))[0]
+                if len(indices) or created:
+                    records.append(KeyRecord(key_block.name, indices, old_co[indices], new_co[indices], created))
+            if records:
+                step.records[object_name] = records
+
+        self._snapshots.clear()
+        if not step.records:
+            return None
+        _undo_stack.append(step)
+        _redo_stack.clear()
+        trim(limit_bytes)
+        return step
+
+def trim(limit_bytes):
+    """Evict the oldest steps until the history fits in limit_bytes"""
+    while _undo_stack and memory_usage() > limit_bytes:
+        _undo_stack.pop(0)
+    while _redo_stack and memory_usage() > limit_bytes:
+        _redo_stack.pop()
+
+def memory_usage():
+    return sum(step.nbytes for step in _undo_stack + _redo_stack)
+
+def clear():
+    _undo_stack.clear()
+    _redo_stack.clear()
+
+def peek_undo():
+    return _undo_stack[-1] if _undo_stack else None
+
+def peek_redo():
+    return _redo_stack[-1] if _redo_stack else None
+
+def _apply(step, undo):
+    """Write old (undo) or new (redo) coordinates of every record of the step
+
+    Raises:
+        ValueError: If an object or key is gone, or the key was edited outside
+        the history since the step was recorded
+    """
+    # 먼저 모두 검증한 뒤 기록 (일부만 적용되는 것을 방지)
+    plans = []
+    for object_name, records in step.records.items():
+        mesh_obj = bpy.data.objects.get(object_name)
+        if not mesh_obj or not mesh_obj.data.shape_keys:
+            raise ValueError(f"Object {object_name} no longer has shape keys")
+        key_blocks = mesh_obj.data.shape_keys.key_blocks
+
+        for record in records:
+            indices, old_co, new_co = record.read()
+            expected, target = (new_co, old_co) if undo else (old_co, new_co)
+            key_block = key_blocks.get(record.name)
+
+            if record.created and not undo:
+                if key_block is not None:
+                    raise ValueError(f"Shape key {record.name} already exists")
+            else:
+                if key_block is None:
+                    raise ValueError(f"Shape key {record.name} no longer exists")
+                coords = shape_key_arrays.read_coords(key_block.data)
+                if not np.array_equal(coords[indices], expected):
+                    raise ValueError(f"Shape key {record.name} was edited since this step")
+            plans.append((mesh_obj, record, indices, target))
+
+    for mesh_obj, record, indices, target in plans:
+        key_blocks = mesh_obj.data.shape_keys.key_blocks
+        if record.created and undo:
+            mesh_obj.shape_key_remove(key_blocks[record.name])
+        else:
+            if record.created:
+                key_block = mesh_obj.shape_key_add(name=record.name, from_mix=False)
+                coords = shape_key_arrays.read_coords(key_blocks[0].data)
+            else:
+                key_block = key_blocks[record.name]
+                coords = shape_key_arrays.read_coords(key_block.data)
+            coords[indices] = target
+            shape_key_arrays.write_coords(key_block.data, coords)
+        mesh_obj.data.update()
+        shape_key_stats.invalidate(mesh_obj.data, [record.name])
+
+def undo():
+    """Revert the latest step and move it to the redo stack"""
+    step = _undo_stack[-1]
+    try:
+        _apply(step, undo=True)
+    except ValueError:
+        # 외부에서 바뀐 상태에는 적용할 수 없으므로 기록을 버림
+        clear()
+        raise
+    _redo_stack.append(_undo_stack.pop())
+    return step
+
+def redo():
+    """Re-apply the latest undone step and move it back to the undo stack"""
+    step = _redo_stack[-1]
+    try:
+        _apply(step, undo=False)
+    except ValueError:
+        clear()
+        raise
+    _undo_stack.append(_redo_stack.pop())
+    return step
+
+def rollback(recorder):
+    """Revert whatever a cancelled edit already wrote, leaving no step behind"""
+    step = recorder.commit(float('inf'))
+    if step is None:
+        return
+    _apply(step, undo=True)
+    _undo_stack.remove(step)
@@ -0,0 +1,115 @@
+import json
+import numpy as np
+
+# 파일 구조: [매직 8바이트][푸터 위치 uint64][16바이트 정렬된 델타 블록...][JSON 푸터]
+LIBRARY_MAGIC = b"SKCLIB01"
+LIBRARY_VERSION = 1
+BLOCK_ALIGNMENT = 16
+
+LIBRARY_DTYPES = {
+    'FLOAT32': np.float32,
+    'FLOAT16': np.float16,
+}
+
+def _pad(file):
+    padding = -file.tell() % BLOCK_ALIGNMENT
+    if padding:
+        file.write(b"\0" * padding)
+
+def _write_block(file, array):
+    _pad(file)
+    offset = file.tell()
+    file.write(np.ascontiguousarray(array).tobytes())
+    return offset
+
+def write_library(filepath, vertex_count, fingerprint, keys, precision='FLOAT32', threshold=0.0):
+    """Stream shape keys into a library file one key at a time
+
+    Each key is stored sparse (int32 indices + deltas of the moving
+    vertices) when that is smaller than the dense block. The header lives
+    at the end of the file, so offsets are known without a second pass.
+
+    Args:
+        filepath: Output path
+        vertex_count: Vertex count N of the mesh
+        fingerprint: Topology fingerprint of the mesh
+        keys: Iterable of (name, (N, 3) deltas, metadata dict)
+        precision: 'FLOAT32' or 'FLOAT16' delta storage
+        threshold: Vertices moving this distance or less are left out
+
+    Returns:
+        int: Number of keys written
+    """
+    dtype = np.dtype(LIBRARY_DTYPES[precision])
+    entries = []
+
+    with open(filepath, "wb") as file:
+        file.write(LIBRARY_MAGIC)
+        file.write(np.uint64(0).tobytes())
+
+        for name, deltas, metadata in keys:
+            lengths = np.sqrt(np.einsum('ij,ij->i', deltas, deltas))
+            indices = np.nonzero(lengths > threshold)[0].astype(np.int32)
+            entry = dict(metadata, name=name, count=len(indices))
+
+            sparse_size = len(indices) * (4 + 3 * dtype.itemsize)
+            if sparse_size < vertex_count * 3 * dtype.itemsize:
+                entry["storage"] = "SPARSE"
+                entry["indices_offset"] = _write_block(file, indices)
+                entry["offset"] = _write_block(file, deltas[indices].astype(dtype))
+            else:
+                entry["storage"] = "DENSE"
+                entry["offset"] = _write_block(file, deltas.astype(dtype))
+            entries.append(entry)
+
+        header = {
+            "version": LIBRARY_VERSION,
+            "vertex_count": int(vertex_count),
+            "fingerprint": fingerprint,
+            "dtype": dtype.name,
+            "keys": entries,
+        }
+        header_offset = file.tell()
+        file.write(json.dumps(header).encode("utf-8"))
+        file.seek(len(LIBRARY_MAGIC))
+        file.write(np.uint64(header_offset).tobytes())
+
+    return len(entries)
+
+def read_library_header(filepath):
+    """Read only the header of a library file (key names, ranges, fingerprint)"""
+    with open(filepath, "rb") as file:
+        if file.read(len(LIBRARY_MAGIC)) != LIBRARY_MAGIC:
+            raise ValueError("Not a shape key library file")
+        header_offset = int(np.frombuffer(file.read(8), dtype=np.uint64)[0])
+        file.seek(header_offset)
+        header = json.loads(file.read().decode("utf-8"))
+
+    if header.get("version", 0) > LIBRARY_VERSION:
+        raise ValueError(f"Library version {header['version']} is newer than supported")
+    return header
+
+def load_library_keys(filepath, header, names):
+    """Yield (entry, (N, 3) float32 deltas) for the named keys
+
+    The file is memory-mapped, so only the blocks of the requested keys
+    are read from disk.
+    """
+    data = np.memmap(filepath, dtype=np.uint8, mode='r')
+    dtype = np.dtype(header["dtype"])
+    vertex_count = header["vertex_count"]
+    entries = {entry["name"]: entry for entry in header["keys"]}
+
+    for name in names:
+        entry = entries[name]
+        deltas = np.zeros((vertex_count, 3), dtype=np.float32)
+        if entry["storage"] == "SPARSE":
+            count = entry["count"]
+            start = entry["indices_offset"]
+            indices = data[start:start + count * 4].view(np.int32)
+            start = entry["offset"]
+            deltas[indices] = data[start:start + count * 3 * dtype.itemsize].view(dtype).reshape(-1, 3)
+        else:
+            start = entry["offset"]
+            deltas[:] = data[start:start + vertex_count * 3 * dtype.itemsize].view(dtype).reshape(-1, 3)
+        yield entry, deltas
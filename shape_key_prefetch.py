@@ -0,0 +1,208 @@
+import bpy
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from . import shape_key_arrays
+
+# 결과 확인 주기 (초)
+DELIVER_INTERVAL = 0.1
+MAX_WORKERS = 2
+
+_executor = None
+
+# (mesh session_uid, 종류, 축, 허용 오차) -> (메쉬 이름, 지문, future)
+# 메인 스레드에서만 수정
+_pending = {}
+
+# mesh session_uid -> (topology fingerprint, adjacency)
+_adjacency_index = {}
+
+# (mesh session_uid, vertex group index) -> (vertex count, sample indices, sampled weights, (N,) weights)
+_group_weight_index = {}
+
+# 웨이트 페인트/에딧 모드에서 수정된 메쉬 (모드 종료 시 무효화)
+_painted_meshes = set()
+
+# 오브젝트 모드 웨이트 연산 감지용 샘플 정점 수
+GROUP_WEIGHT_SAMPLES = 16
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="skc_prefetch")
+    return _executor
+
+def _submit(key, mesh, fingerprint, function, *args):
+    if key in _pending and _pending[key][1] == fingerprint:
+        return
+    _pending[key] = (mesh.name, fingerprint, _get_executor().submit(function, *args))
+    if not bpy.app.timers.is_registered(_deliver):
+        bpy.app.timers.register(_deliver, first_interval=DELIVER_INTERVAL)
+
+def request(mesh_obj, axes=('X',), tolerance=0.0001, adjacency=True):
+    """Queue symmetry maps of the given axes and optionally the adjacency for background computation
+
+    Coordinates and edges are copied out with foreach_get here on the main
+    thread; the workers only see NumPy arrays. Structures that are already
+    cached and up to date are skipped.
+    """
+    mesh = mesh_obj.data
+    if not mesh.shape_keys:
+        return
+    uid = mesh.session_uid
+    basis_co = shape_key_arrays.read_coords(mesh.shape_keys.key_blocks["Basis"].data)
+
+    for axis in axes:
+        fingerprint = shape_key_arrays.mesh_fingerprint(mesh, basis_co, axis, float(tolerance))
+        if mesh.get(shape_key_arrays.SYMMETRY_FINGERPRINT.format(axis=axis.lower())) == fingerprint:
+            continue
+        _submit((uid, "symmetry", axis, tolerance), mesh, fingerprint,
+                shape_key_arrays.build_symmetry_map, basis_co, axis, tolerance)
+
+    if not adjacency:
+        return
+    topology = shape_key_arrays.topology_fingerprint(mesh)
+    if _adjacency_index.get(uid, (None,))[0] != topology:
+        _submit((uid, "adjacency", None, None), mesh, topology,
+                shape_key_arrays.build_adjacency, shape_key_arrays.read_edge_vertices(mesh), len(basis_co))
+
+def _store(key, mesh, fingerprint, result):
+    """Hand a finished result to the caches, if the mesh still matches the snapshot"""
+    uid, kind, axis, tolerance = key
+    if kind == "adjacency":
+        if shape_key_arrays.topology_fingerprint(mesh) == fingerprint:
+            _adjacency_index[uid] = (fingerprint, result)
+        return
+
+    if not mesh.shape_keys:
+        return
+    basis_co = shape_key_arrays.read_coords(mesh.shape_keys.key_blocks["Basis"].data)
+    if shape_key_arrays.mesh_fingerprint(mesh, basis_co, axis, float(tolerance)) != fingerprint:
+        return
+    shape_key_arrays.write_point_attribute(mesh, shape_key_arrays.SYMMETRY_ATTRIBUTE.format(axis=axis.lower()), result)
+    mesh[shape_key_arrays.SYMMETRY_FINGERPRINT.format(axis=axis.lower())] = fingerprint
+
+def _find_mesh(name, uid):
+    mesh = bpy.data.meshes.get(name)
+    return mesh if mesh is not None and mesh.session_uid == uid else None
+
+def _collect(keys, wait=False):
+    for key in keys:
+        name, fingerprint, future = _pending[key]
+        if not wait and not future.done():
+            continue
+        del _pending[key]
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Shape key prefetch failed: {str(e)}")
+            continue
+        mesh = _find_mesh(name, key[0])
+        if mesh is not None:
+            _store(key, mesh, fingerprint, result)
+
+def _deliver():
+    """bpy.app.timers callback: store finished results on the main thread"""
+    try:
+        _collect(list(_pending))
+    except Exception as e:
+        print(f"Error delivering shape key prefetch results: {str(e)}")
+    return DELIVER_INTERVAL if _pending else None
+
+def finish_pending(mesh):
+    """Wait for the mesh's in-flight jobs and store their results
+
+    Called before a structure is needed, so a running job is reused
+    instead of building the same structure again inline.
+    """
+    _collect([key for key in _pending if key[0] == mesh.session_uid], wait=True)
+
+def get_adjacency(mesh):
+    """Adjacency of the mesh from the background result, building it inline if missing"""
+    finish_pending(mesh)
+    topology = shape_key_arrays.topology_fingerprint(mesh)
+    cached = _adjacency_index.get(mesh.session_uid)
+    if cached is not None and cached[0] == topology:
+        return cached[1]
+
+    adjacency = shape_key_arrays.build_adjacency(shape_key_arrays.read_edge_vertices(mesh), len(mesh.vertices))
+    _adjacency_index[mesh.session_uid] = (topology, adjacency)
+    return adjacency
+
+def _sample_weights(vertex_group, indices):
+    values = []
+    for index in indices.tolist():
+        try:
+            values.append(vertex_group.weight(index))
+        except RuntimeError:
+            # 그룹에 없는 정점
+            values.append(0.0)
+    return values
+
+def get_group_weights(mesh_obj, group_name):
+    """Dense weights of a vertex group, scanning every vertex only when not cached
+
+    Painting in weight paint / edit mode and Blender undo drop the entry.
+    Object mode weight tools are caught by re-checking a few sampled
+    vertices, half of them inside the group.
+    """
+    vertex_group = mesh_obj.vertex_groups.get(group_name)
+    if vertex_group is None:
+        raise KeyError(f"Vertex group not found: {group_name}")
+    key = (mesh_obj.data.session_uid, vertex_group.index)
+    count = len(mesh_obj.data.vertices)
+    cached = _group_weight_index.get(key)
+    if cached is not None and cached[0] == count and _sample_weights(vertex_group, cached[1]) == cached[2]:
+        return cached[3]
+
+    weights = shape_key_arrays.read_vertex_group_weights(mesh_obj, group_name)
+    inside = np.nonzero(weights)[0]
+    half = GROUP_WEIGHT_SAMPLES // 2
+    indices = np.unique(np.concatenate((
+        inside[np.linspace(0, len(inside) - 1, min(half, len(inside))).astype(np.int64)],
+        np.linspace(0, count - 1, min(half, count)).astype(np.int64),
+    )))
+    _group_weight_index[key] = (count, indices, _sample_weights(vertex_group, indices), weights)
+    return weights
+
+def _forget_group_weights(uid):
+    for key in [key for key in _group_weight_index if key[0] == uid]:
+        del _group_weight_index[key]
+
+@bpy.app.handlers.persistent
+def group_weights_depsgraph_handler(scene, depsgraph):
+    """Drop cached vertex group weights of meshes edited in weight paint or edit mode"""
+    try:
+        for update in depsgraph.updates:
+            obj = update.id
+            if not isinstance(obj, bpy.types.Object) or obj.type != 'MESH' or not update.is_updated_geometry:
+                continue
+            obj = obj.original
+            uid = obj.data.session_uid
+            if obj.mode in {'WEIGHT_PAINT', 'EDIT'}:
+                _painted_meshes.add(uid)
+                _forget_group_weights(uid)
+            elif uid in _painted_meshes:
+                _painted_meshes.discard(uid)
+                _forget_group_weights(uid)
+    except Exception as e:
+        print(f"Error in vertex group weight handler: {str(e)}")
+
+@bpy.app.handlers.persistent
+def group_weights_undo_handler(scene, *args):
+    """Blender undo / redo may restore other weights"""
+    _group_weight_index.clear()
+    _painted_meshes.clear()
+
+def shutdown():
+    """Stop the workers and drop pending results (add-on unregister)"""
+    global _executor
+    if bpy.app.timers.is_registered(_deliver):
+        bpy.app.timers.unregister(_deliver)
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    _pending.clear()
+    _adjacency_index.clear()
+    _group_weight_index.clear()
+    _painted_meshes.clear()
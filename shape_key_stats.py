@@ -0,0 +1,167 @@
+import bpy
+import numpy as np
+
+from . import shape_key_arrays
+
+# 이 거리보다 많이 움직인 정점을 영향받은 정점으로 셈
+AFFECTED_THRESHOLD = 0.00001
+
+STAT_SORT_ITEMS = [
+    ('NAME', "Name", "Sort by shape key name"),
+    ('MAX', "Max", "Sort by maximum displacement"),
+    ('MEAN', "Mean", "Sort by mean displacement of affected vertices"),
+    ('AFFECTED', "Affected", "Sort by number of affected vertices"),
+]
+
+# 지문에 쓰는 샘플 정점 수
+FINGERPRINT_SAMPLES = 8
+
+# session_uid -> {shape key name: (key fingerprint, stats dict)}
+_stats_index = {}
+
+# 에딧/스컬프트 모드에서 수정된 메쉬 (모드 종료 시 무효화)
+_edited_meshes = set()
+
+def compute_key_stats(basis_co, deltas, threshold=AFFECTED_THRESHOLD):
+    """Displacement statistics for (K, N, 3) deltas in one vectorized pass
+
+    Returns:
+        list: One dict per key with max, mean, affected, bbox_min, bbox_max and
+        centroid (displacement-weighted, in basis space)
+    """
+    lengths = shape_key_arrays.delta_lengths(deltas)
+    affected = lengths > threshold
+    affected_count = affected.sum(axis=-1)
+
+    max_length = shape_key_arrays.max_delta_length(deltas)
+    mean_length = np.where(affected_count > 0,
+                           (lengths * affected).sum(axis=-1) / np.maximum(affected_count, 1), 0.0)
+
+    total = lengths.sum(axis=-1)
+    centroid = (lengths @ basis_co) / np.maximum(total, 1e-12)[:, None]
+
+    stats = []
+    for k in range(len(deltas)):
+        key_stats = {
+            "max": float(max_length[k]),
+            "mean": float(mean_length[k]),
+            "affected": int(affected_count[k]),
+            "bbox_min": (0.0, 0.0, 0.0),
+            "bbox_max": (0.0, 0.0, 0.0),
+            "centroid": (0.0, 0.0, 0.0),
+        }
+        if affected_count[k]:
+            region = basis_co[affected[k]]
+            key_stats["bbox_min"] = tuple(region.min(axis=0).tolist())
+            key_stats["bbox_max"] = tuple(region.max(axis=0).tolist())
+            key_stats["centroid"] = tuple(centroid[k].tolist())
+        stats.append(key_stats)
+    return stats
+
+def key_fingerprint(key_block):
+    """Cheap identity of a shape key's data, safe to compute in draw code
+
+    The key's address, size and a few sampled coordinates. A key removed and
+    added again under the same name, or edited without invalidation, no
+    longer matches its entry.
+    """
+    data = key_block.data
+    step = max(len(data) // FINGERPRINT_SAMPLES, 1)
+    samples = tuple(tuple(data[i].co) for i in range(0, len(data), step)[:FINGERPRINT_SAMPLES])
+    return (key_block.as_pointer(), len(data), samples)
+
+def _valid_entries(mesh):
+    """Entries of the mesh whose key still exists with the same fingerprint; stale ones are dropped"""
+    entries = _stats_index.get(mesh.session_uid)
+    if not entries:
+        return {}
+    key_blocks = mesh.shape_keys.key_blocks if mesh.shape_keys else {}
+    for name in list(entries):
+        key_block = key_blocks.get(name)
+        if key_block is None or key_fingerprint(key_block) != entries[name][0]:
+            del entries[name]
+    return entries
+
+def update_stats(mesh, key_names, basis_co, deltas):
+    """Store statistics for deltas the caller already has in memory"""
+    key_blocks = mesh.shape_keys.key_blocks
+    entries = _stats_index.setdefault(mesh.session_uid, {})
+    for name, key_stats in zip(key_names, compute_key_stats(basis_co, np.asarray(deltas))):
+        entries[name] = (key_fingerprint(key_blocks[name]), key_stats)
+
+def invalidate(mesh, key_names=None):
+    """Forget statistics of the given keys, or of every key of the mesh"""
+    if key_names is None:
+        _stats_index.pop(mesh.session_uid, None)
+        return
+    entries = _stats_index.get(mesh.session_uid, {})
+    for name in key_names:
+        entries.pop(name, None)
+
+def get_cached_stats(mesh):
+    """Statistics currently in the index, without computing anything (safe in draw code)"""
+    return {name: key_stats for name, (_, key_stats) in _valid_entries(mesh).items()}
+
+def get_stats(mesh_obj, key_names=None):
+    """Statistics for the mesh's shape keys, computing only those missing from the index
+
+    Args:
+        mesh_obj: Mesh object with shape keys
+        key_names: Keys to return, defaults to all non-basis keys
+
+    Returns:
+        dict: shape key name -> stats dict
+    """
+    mesh = mesh_obj.data
+    key_blocks = mesh.shape_keys.key_blocks
+    if key_names is None:
+        key_names = [key_block.name for key_block in key_blocks[1:]]
+
+    # 이름이 바뀌거나 삭제, 재생성된 키 정리
+    entries = _valid_entries(mesh)
+
+    missing = [name for name in key_names if name not in entries]
+    if missing:
+        basis_co, deltas = shape_key_arrays.read_keys_deltas(
+            [key_blocks[name] for name in missing], key_blocks["Basis"]
+        )
+        update_stats(mesh, missing, basis_co, deltas)
+        entries = _stats_index[mesh.session_uid]
+
+    return {name: entries[name][1] for name in key_names}
+
+def sorted_key_names(stats, sort_by='NAME', descending=False):
+    """Shape key names ordered by one of the STAT_SORT_ITEMS columns"""
+    if sort_by == 'NAME':
+        return sorted(stats, key=str.lower, reverse=descending)
+    column = sort_by.lower()
+    return sorted(stats, key=lambda name: stats[name][column], reverse=descending)
+
+@bpy.app.handlers.persistent
+def stats_depsgraph_handler(scene, depsgraph):
+    """Invalidate statistics of meshes whose shape keys were edited in edit or sculpt mode
+
+    Changing shape key values also updates geometry, so updates outside
+    those modes are ignored.
+    """
+    try:
+        for update in depsgraph.updates:
+            obj = update.id
+            if not isinstance(obj, bpy.types.Object) or obj.type != 'MESH' or not update.is_updated_geometry:
+                continue
+            obj = obj.original
+            uid = obj.data.session_uid
+            if obj.mode in {'EDIT', 'SCULPT'}:
+                _edited_meshes.add(uid)
+                _stats_index.pop(uid, None)
+            elif uid in _edited_meshes:
+                _edited_meshes.discard(uid)
+                _stats_index.pop(uid, None)
+    except Exception as e:
+        print(f"Error in shape key stats handler: {str(e)}")
+
+@bpy.app.handlers.persistent
+def stats_undo_handler(scene, *args):
+    """Blender undo / redo restores key data behind the index, so forget everything"""
+    _stats_index.clear()
+    _edited_meshes.clear()
@@ -0,0 +1,158 @@
+import numpy as np
+
+from . import shape_key_arrays
+
+# 메쉬에 저장되는 토폴로지 대칭 캐시 이름
+TOPOLOGY_ATTRIBUTE = ".skc_symmetry_topology"
+TOPOLOGY_FINGERPRINT = "skc_symmetry_topology_fingerprint"
+TOPOLOGY_CONFLICTS = "skc_symmetry_topology_conflicts"
+CENTER_EDGE_PROPERTY = "skc_symmetry_center_edge"
+
+def read_face_arrays(mesh):
+    """Read loop / face connectivity as arrays
+
+    Returns:
+        tuple: (loop vertex, loop edge, loop face, face loop start, face loop total)
+    """
+    loop_vertex = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_edge = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertex)
+    mesh.loops.foreach_get("edge_index", loop_edge)
+
+    face_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    face_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", face_start)
+    mesh.polygons.foreach_get("loop_total", face_total)
+
+    loop_face = np.repeat(np.arange(len(face_start), dtype=np.int32), face_total)
+    return loop_vertex, loop_edge, loop_face, face_start, face_total
+
+def _edge_loop_pairs(loop_edge, edge_count):
+    """The two loops using each manifold edge, -1 for boundary / non-manifold edges"""
+    order = np.argsort(loop_edge, kind='stable').astype(np.int32)
+    counts = np.bincount(loop_edge, minlength=edge_count)
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    manifold = counts == 2
+    pairs = np.full((edge_count, 2), -1, dtype=np.int32)
+    pairs[manifold, 0] = order[first[manifold]]
+    pairs[manifold, 1] = order[first[manifold] + 1]
+    return pairs
+
+def build_topology_symmetry_map(loop_vertex, loop_edge, loop_face, face_start, face_total,
+                                vertex_count, edge_count, center_edge):
+    """Pair vertices by walking faces outward from a centre-line edge
+
+    The two faces sharing the centre edge are mirror images of each other.
+    Every matched face pair is walked corner by corner in opposite winding,
+    pairing its vertices, and the faces across each pair of matching edges
+    form the next breadth-first frontier. Each frontier is processed as one
+    batch of array operations, so the Python loop only runs once per ring.
+    Faces must be consistently oriented.
+
+    Returns:
+        tuple: ((N,) int32 mirror index per vertex, -1 where unmatched,
+                number of vertices with conflicting partners)
+    """
+    mirror_map = np.full(vertex_count, -1, dtype=np.int32)
+    edge_loops = _edge_loop_pairs(loop_edge, edge_count)
+    if not 0 <= center_edge < edge_count or edge_loops[center_edge, 0] < 0:
+        raise ValueError("The centre edge must be shared by exactly two faces")
+
+    def next_loop(loops):
+        faces = loop_face[loops]
+        return face_start[faces] + (loops - face_start[faces] + 1) % face_total[faces]
+
+    # 중심 엣지의 두 면: 한쪽 루프의 시작 정점은 다른 쪽 루프의 다음 정점
+    loop_a, loop_b = edge_loops[center_edge]
+    faces_a = loop_face[[loop_a]]
+    faces_b = loop_face[[loop_b]]
+    anchors_a = np.array([loop_a], dtype=np.int32)
+    anchors_b = next_loop(np.array([loop_b], dtype=np.int32))
+
+    visited = np.zeros(len(face_start), dtype=bool)
+    visited[faces_a] = True
+    visited[faces_b] = True
+    conflicts = np.zeros(vertex_count, dtype=bool)
+
+    while len(faces_a):
+        sizes = face_total[faces_a]
+        same = sizes == face_total[faces_b]
+        faces_a, faces_b = faces_a[same], faces_b[same]
+        anchors_a, anchors_b, sizes = anchors_a[same], anchors_b[same], sizes[same]
+        if not len(faces_a):
+            break
+
+        # 면마다 모서리 k를 펼침: A는 정방향, B는 역방향으로 진행
+        pair = np.repeat(np.arange(len(faces_a)), sizes)
+        k = np.arange(len(pair)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        size = sizes[pair]
+        start_a = face_start[faces_a][pair]
+        start_b = face_start[faces_b][pair]
+        corner_a = start_a + (anchors_a[pair] - start_a + k) % size
+        corner_b = start_b + (anchors_b[pair] - start_b - k) % size
+
+        vertex_a = loop_vertex[corner_a]
+        vertex_b = loop_vertex[corner_b]
+        known = mirror_map[vertex_a] >= 0
+        conflicts[vertex_a[known & (mirror_map[vertex_a] != vertex_b)]] = True
+        new = ~known
+        mirror_map[vertex_a[new]] = vertex_b[new]
+        mirror_map[vertex_b[new]] = vertex_a[new]
+
+        # A의 모서리 k 엣지(k→k+1)는 B의 모서리 k+1 루프의 엣지와 대응
+        edge_corner_b = start_b + (anchors_b[pair] - start_b - k - 1) % size
+        edges_a = loop_edge[corner_a]
+        edges_b = loop_edge[edge_corner_b]
+
+        across_a = np.where(edge_loops[edges_a, 0] == corner_a, edge_loops[edges_a, 1], edge_loops[edges_a, 0])
+        across_b = np.where(edge_loops[edges_b, 0] == edge_corner_b, edge_loops[edges_b, 1], edge_loops[edges_b, 0])
+        valid = (across_a >= 0) & (across_b >= 0)
+        across_a, across_b = across_a[valid], across_b[valid]
+        valid = ~visited[loop_face[across_a]] & ~visited[loop_face[across_b]]
+        across_a, across_b = across_a[valid], across_b[valid]
+
+        # 같은 면에 여러 엣지로 도달하면 처음 것만 사용
+        _, first = np.unique(loop_face[across_a], return_index=True)
+        across_a, across_b = across_a[first], across_b[first]
+        _, first = np.unique(loop_face[across_b], return_index=True)
+        across_a, across_b = across_a[first], across_b[first]
+
+        faces_a = loop_face[across_a]
+        faces_b = loop_face[across_b]
+        visited[faces_a] = True
+        visited[faces_b] = True
+        # 건너편 루프는 엣지를 반대로 지나므로 B쪽 기준 정점은 다음 루프
+        anchors_a = across_a
+        anchors_b = next_loop(across_b)
+
+    return mirror_map, int(np.count_nonzero(conflicts))
+
+def get_cached_topology_map(mesh, center_edge=None):
+    """Return the topology symmetry map stored on the mesh, rebuilding it if stale
+
+    Args:
+        center_edge: Centre-line edge index, defaults to the one stored on the mesh
+
+    Returns:
+        tuple: ((N,) int32 mirror index per vertex, -1 where unmatched,
+                number of vertices with conflicting partners)
+    """
+    if center_edge is None:
+        center_edge = mesh.get(CENTER_EDGE_PROPERTY, -1)
+    if center_edge < 0:
+        raise ValueError("No symmetry centre edge set on the mesh")
+
+    fingerprint = f"{shape_key_arrays.topology_fingerprint(mesh)}:{int(center_edge)}"
+    if mesh.get(TOPOLOGY_FINGERPRINT) == fingerprint:
+        mirror_map = shape_key_arrays.read_point_attribute(mesh, TOPOLOGY_ATTRIBUTE)
+        if mirror_map is not None and len(mirror_map) == len(mesh.vertices):
+            return mirror_map, int(mesh.get(TOPOLOGY_CONFLICTS, 0))
+
+    mirror_map, conflicts = build_topology_symmetry_map(
+        *read_face_arrays(mesh), len(mesh.vertices), len(mesh.edges), int(center_edge)
+    )
+    shape_key_arrays.write_point_attribute(mesh, TOPOLOGY_ATTRIBUTE, mirror_map)
+    mesh[TOPOLOGY_FINGERPRINT] = fingerprint
+    mesh[TOPOLOGY_CONFLICTS] = conflicts
+    return mirror_map, conflicts
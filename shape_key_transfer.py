@@ -0,0 +1,172 @@
+import numpy as np
+from mathutils.bvhtree import BVHTree
+
+from . import shape_key_arrays
+
+# 대상 메쉬에 저장되는 대응 관계 캐시 이름 (슬롯 번호가 붙음)
+TRANSFER_TRIANGLE_ATTRIBUTE = ".skc_transfer_triangle_{}"
+TRANSFER_WEIGHTS_ATTRIBUTE = ".skc_transfer_weights_{}"
+TRANSFER_FINGERPRINT = "skc_transfer_fingerprint_{}"
+TRANSFER_SLOT_ORDER = "skc_transfer_slot_order"
+# 대상 메쉬 하나에 캐시해 두는 소스 수
+TRANSFER_SLOTS = 4
+
+def read_triangles(mesh):
+    """Read the mesh's loop triangles as a (T, 3) int32 array of vertex indices"""
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    return triangles.reshape(-1, 3)
+
+def relative_matrix(source_obj, target_obj):
+    """Matrix taking target local coordinates into source local space, as a 4x4 array"""
+    matrix = source_obj.matrix_world.inverted() @ target_obj.matrix_world
+    return np.array(matrix, dtype=np.float64)
+
+def transform_points(matrix, points):
+    """Apply a 4x4 matrix to (N, 3) points"""
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+def barycentric_weights(points, corners):
+    """Barycentric weights of points lying on (N, 3, 3) triangle corners
+
+    Degenerate triangles give all weight to their first corner.
+    """
+    a, b, c = corners[:, 0], corners[:, 1], corners[:, 2]
+    v0, v1, v2 = b - a, c - a, points - a
+    d00 = np.einsum('ij,ij->i', v0, v0)
+    d01 = np.einsum('ij,ij->i', v0, v1)
+    d11 = np.einsum('ij,ij->i', v1, v1)
+    d20 = np.einsum('ij,ij->i', v2, v0)
+    d21 = np.einsum('ij,ij->i', v2, v1)
+    denom = d00 * d11 - d01 * d01
+
+    valid = np.abs(denom) > 1e-20
+    safe = np.where(valid, denom, 1.0)
+    v = np.where(valid, (d11 * d20 - d01 * d21) / safe, 0.0)
+    w = np.where(valid, (d00 * d21 - d01 * d20) / safe, 0.0)
+    weights = np.clip(np.stack((1.0 - v - w, v, w), axis=1), 0.0, None)
+    weights /= np.maximum(weights.sum(axis=1, keepdims=True), 1e-12)
+    return weights.astype(np.float32)
+
+def build_correspondence(source_co, triangles, target_co):
+    """Project target points onto the source surface
+
+    Args:
+        source_co: (Ns, 3) source coordinates
+        triangles: (T, 3) source triangle vertex indices
+        target_co: (Nt, 3) target coordinates in source space
+
+    Returns:
+        tuple: ((Nt,) triangle index, -1 where nothing was found,
+                (Nt, 3) barycentric weights)
+    """
+    return shape_key_arrays.drain(iter_correspondence(source_co, triangles, target_co))
+
+def iter_correspondence(source_co, triangles, target_co, chunk_size=None):
+    """Generator form of build_correspondence, yielding target vertices done per chunk"""
+    bvh = BVHTree.FromPolygons(source_co.tolist(), triangles.tolist(), all_triangles=True)
+
+    count = len(target_co)
+    chunk_size = chunk_size or max(count, 1)
+    triangle_index = np.full(count, -1, dtype=np.int32)
+    nearest = np.zeros((count, 3), dtype=np.float64)
+    for start in range(0, count, chunk_size):
+        for i, co in enumerate(target_co[start:start + chunk_size].tolist(), start):
+            location, _, index, _ = bvh.find_nearest(co)
+            if index is not None:
+                triangle_index[i] = index
+                nearest[i] = location
+        yield min(start + chunk_size, count)
+
+    found = triangle_index >= 0
+    weights = np.zeros((count, 3), dtype=np.float32)
+    corners = np.asarray(source_co, dtype=np.float64)[triangles[triangle_index[found]]]
+    weights[found] = barycentric_weights(nearest[found], corners)
+    return triangle_index, weights
+
+def _find_slot(target_mesh, fingerprint):
+    """Return (slot, hit) for a fingerprint, evicting the least recently used slot on a miss"""
+    for slot in range(TRANSFER_SLOTS):
+        if target_mesh.get(TRANSFER_FINGERPRINT.format(slot)) == fingerprint:
+            return slot, True
+    for slot in range(TRANSFER_SLOTS):
+        if TRANSFER_FINGERPRINT.format(slot) not in target_mesh:
+            return slot, False
+    order = [slot for slot in target_mesh.get(TRANSFER_SLOT_ORDER, ()) if 0 <= slot < TRANSFER_SLOTS]
+    return (order[-1] if order else 0), False
+
+def _touch_slot(target_mesh, slot):
+    """Mark a slot as the most recently used one"""
+    order = [other for other in target_mesh.get(TRANSFER_SLOT_ORDER, ()) if other != slot]
+    target_mesh[TRANSFER_SLOT_ORDER] = [slot] + order[:TRANSFER_SLOTS - 1]
+
+def get_correspondence(source_obj, target_obj):
+    """Return the cached source-surface correspondence of the target, rebuilding if stale
+
+    The triangle index and barycentric weights are stored as hidden point
+    attributes on the target mesh, one slot per source so that alternating
+    between a few sources does not rebuild every time. A slot is reused as
+    long as neither mesh's basis / topology nor the relative object
+    transform changed.
+
+    Returns:
+        tuple: (source triangles, triangle index per target vertex, barycentric weights)
+    """
+    return shape_key_arrays.drain(iter_get_correspondence(source_obj, target_obj))
+
+def iter_get_correspondence(source_obj, target_obj, chunk_size=None):
+    """Generator form of get_correspondence, yielding progress while rebuilding"""
+    source_mesh = source_obj.data
+    target_mesh = target_obj.data
+
+    source_co = shape_key_arrays.read_coords(source_mesh.shape_keys.key_blocks["Basis"].data)
+    target_co = shape_key_arrays.read_coords(target_mesh.vertices)
+    triangles = read_triangles(source_mesh)
+    if not len(triangles):
+        raise ValueError(f"Source mesh {source_obj.name} has no faces")
+
+    matrix = relative_matrix(source_obj, target_obj)
+    fingerprint = shape_key_arrays.mesh_fingerprint(
+        target_mesh,
+        target_co,
+        shape_key_arrays.mesh_fingerprint(source_mesh, source_co),
+        np.round(matrix, 6).tobytes()
+    )
+
+    slot, hit = _find_slot(target_mesh, fingerprint)
+    triangle_attribute = TRANSFER_TRIANGLE_ATTRIBUTE.format(slot)
+    weights_attribute = TRANSFER_WEIGHTS_ATTRIBUTE.format(slot)
+    if hit:
+        triangle_index = shape_key_arrays.read_point_attribute(target_mesh, triangle_attribute)
+        weights = shape_key_arrays.read_point_attribute(target_mesh, weights_attribute, 'FLOAT_VECTOR')
+        if triangle_index is not None and weights is not None:
+            _touch_slot(target_mesh, slot)
+            return triangles, triangle_index, weights
+
+    triangle_index, weights = yield from iter_correspondence(
+        source_co, triangles, transform_points(matrix, target_co), chunk_size
+    )
+    shape_key_arrays.write_point_attribute(target_mesh, triangle_attribute, triangle_index)
+    shape_key_arrays.write_point_attribute(target_mesh, weights_attribute, weights, 'FLOAT_VECTOR')
+    target_mesh[TRANSFER_FINGERPRINT.format(slot)] = fingerprint
+    _touch_slot(target_mesh, slot)
+    return triangles, triangle_index, weights
+
+def interpolate_deltas(source_deltas, triangles, triangle_index, weights):
+    """Interpolate (Ns, 3) or (K, Ns, 3) source deltas onto target vertices
+
+    Target vertices without a correspondence receive a zero delta.
+    """
+    corners = triangles[np.maximum(triangle_index, 0)]
+    weights = np.where((triangle_index >= 0)[:, None], weights, np.float32(0.0))
+
+    result = np.zeros(source_deltas.shape[:-2] + (len(triangle_index), 3), dtype=np.float32)
+    for corner in range(3):
+        result += weights[:, corner, None] * source_deltas[..., corners[:, corner], :]
+    return result
+
+def to_target_deltas(deltas, matrix):
+    """Rotate / scale deltas from source space into target space given relative_matrix()"""
+    linear = np.linalg.inv(matrix[:3, :3]).astype(np.float32)
+    return deltas @ linear.T
@@ -1,10 +1,50 @@
 import bpy
+import fnmatch
 import mathutils
 import random
-from bpy.types import Operator
-from bpy.props import EnumProperty, BoolProperty, FloatProperty, StringProperty
+import time
+import zlib
+import numpy as np
+from bpy.types import Operator, PropertyGroup
+from bpy.props import EnumProperty, BoolProperty, CollectionProperty, FloatProperty, IntProperty, StringProperty
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from . import shape_key_arrays
+from . import shape_key_history
+from . import shape_key_library
+from . import shape_key_prefetch
+from . import shape_key_stats
+from . import shape_key_topology
+from . import shape_key_transfer
+from . import utils
+
+# 좌우 분할 시 축별 (양의 방향, 음의 방향) 접미사
+SIDE_SUFFIXES = {
+    'X': ("_L", "_R"),
+    'Y': ("_Back", "_Front"),
+    'Z': ("_Top", "_Bottom"),
+}
+
+class ReferenceShapeKeyManager:
+    """Per-vertex reference implementation, kept for checking the array backend"""
+    def _find_mirror_pairs(self, vertices, axis_index, tolerance):
+        """Pair each vertex with its nearest mirror-image vertex, keeping mutual pairs only
+
+        Same rule as shape_key_arrays.build_symmetry_map: the largest
+        per-axis distance must be below tolerance, and vertices on the
+        mirror plane pair with themselves.
+        """
+        nearest = {}
+        for v1 in vertices:
+            mirrored = v1.co.copy()
+            mirrored[axis_index] *= -1
+            best = tolerance
+            for v2 in vertices:
+                distance = max(abs(v2.co[j] - mirrored[j]) for j in range(3))
+                if distance < best:
+                    best = distance
+                    nearest[v1.index] = v2.index
+        return {index: partner for index, partner in nearest.items() if nearest.get(partner) == index}
 
-class ShapeKeyManager:
     def invert_shape_key(self, mesh_obj, shape_key_name):
         try:
             shape_keys = mesh_obj.data.shape_keys
@@ -18,44 +58,28 @@ class ShapeKeyManager:
         except Exception as e:
             return False, f"Error inverting shape key: {str(e)}"
 
-    def mirror_shape_key(self, mesh_obj, shape_key_name, axis='X'):
+    def mirror_shape_key(self, mesh_obj, shape_key_name, axis='X', tolerance=0.0001):
         try:
             shape_keys = mesh_obj.data.shape_keys
             shape_key_block = shape_keys.key_blocks[shape_key_name]
             basis = shape_keys.key_blocks["Basis"]
             
             axis_index = {'X': 0, 'Y': 1, 'Z': 2}[axis]
-            vertex_map = {}
             vertices = mesh_obj.data.vertices
+            vertex_map = self._find_mirror_pairs(vertices, axis_index, tolerance)
             
-            # 대칭점 찾기
-            for v1 in vertices:
-                if v1.index in vertex_map:
-                    continue
-                    
-                pos1 = v1.co
-                for v2 in vertices:
-                    if v2.index == v1.index or v2.index in vertex_map.values():
-                        continue
-                        
-                    pos2 = v2.co
-                    if all(abs(pos1[j] - (-pos2[j] if j == axis_index else pos2[j])) < 0.0001 for j in range(3)):
-                        vertex_map[v1.index] = v2.index
-                        vertex_map[v2.index] = v1.index
-                        break
-            
-            # 변형 적용
+            # 원본 변형을 먼저 복사해 두고 적용 (제자리 덮어쓰기 시 짝끼리 교환되지 않음)
+            original = [shape_key_block.data[i].co - basis.data[i].co for i in range(len(vertices))]
             for v_idx, mirror_idx in vertex_map.items():
-                diff = shape_key_block.data[v_idx].co - basis.data[v_idx].co
-                mirror_diff = diff.copy()
+                mirror_diff = original[mirror_idx].copy()
                 mirror_diff[axis_index] *= -1
-                shape_key_block.data[mirror_idx].co = basis.data[mirror_idx].co + mirror_diff
+                shape_key_block.data[v_idx].co = basis.data[v_idx].co + mirror_diff
             
             return True, f"Shape key mirrored successfully along {axis} axis"
         except Exception as e:
             return False, f"Error mirroring shape key: {str(e)}"
 
-    def normalize_shape_key(self, mesh_obj, shape_key_name):
+    def normalize_shape_key(self, mesh_obj, shape_key_name, target=1.0):
         try:
             shape_keys = mesh_obj.data.shape_keys
             shape_key_block = shape_keys.key_blocks[shape_key_name]
@@ -70,29 +94,30 @@ class ShapeKeyManager:
             for i in range(len(mesh_obj.data.vertices)):
                 diff = shape_key_block.data[i].co - basis.data[i].co
                 if diff.length > 0:
-                    normalized_diff = diff * (1.0 / max_deformation)
+                    normalized_diff = diff * (target / max_deformation)
                     shape_key_block.data[i].co = basis.data[i].co + normalized_diff
             
             return True, "Shape key normalized successfully"
         except Exception as e:
             return False, f"Error normalizing shape key: {str(e)}"
         
-    def merge_shape_keys(self, mesh_obj, shape_keys_to_merge, new_name="Merged"):
+    def merge_shape_keys(self, mesh_obj, shape_keys_to_merge, new_name="Merged", weights=None):
         try:
             shape_keys = mesh_obj.data.shape_keys
             basis = shape_keys.key_blocks["Basis"]
             
             new_key = mesh_obj.shape_key_add(name=new_name)
+            weights = weights or [1.0] * len(shape_keys_to_merge)
             
             for i in range(len(mesh_obj.data.vertices)):
                 basis_co = basis.data[i].co
                 combined_diff = mathutils.Vector((0, 0, 0))
                 
-                for key_name in shape_keys_to_merge:
+                for key_name, weight in zip(shape_keys_to_merge, weights):
                     if key_name in shape_keys.key_blocks:
                         key_block = shape_keys.key_blocks[key_name]
                         diff = key_block.data[i].co - basis_co
-                        combined_diff += diff
+                        combined_diff += diff * weight
                 
                 new_key.data[i].co = basis_co + combined_diff
             
@@ -100,8 +125,11 @@ class ShapeKeyManager:
         except Exception as e:
             return False, f"Error merging shape keys: {str(e)}"
 
-    def split_shape_key(self, mesh_obj, shape_key_name, threshold=0.5):
+    def split_shape_key(self, mesh_obj, shape_key_name, threshold=0.5, falloff=0.0, bands=2):
         try:
+            if falloff > 0 or bands != 2:
+                return False, "Soft and multi-band splits are only available with the Array backend"
+            
             shape_keys = mesh_obj.data.shape_keys
             shape_key = shape_keys.key_blocks[shape_key_name]
             basis = shape_keys.key_blocks["Basis"]
@@ -129,7 +157,7 @@ class ShapeKeyManager:
         except Exception as e:
             return False, f"Error splitting shape key: {str(e)}"
 
-    def smooth_shape_key(self, mesh_obj, shape_key_name, strength=0.5):
+    def smooth_shape_key(self, mesh_obj, shape_key_name, strength=0.5, iterations=1, pin_boundary=False):
         try:
             shape_keys = mesh_obj.data.shape_keys
             shape_key = shape_keys.key_blocks[shape_key_name]
@@ -145,27 +173,39 @@ class ShapeKeyManager:
                 vertex_connections[v1].append(v2)
                 vertex_connections[v2].append(v1)
             
-            new_coordinates = {}
+            # 경계 정점 고정
+            pinned = set()
+            if pin_boundary:
+                edge_face_count = {}
+                for polygon in mesh_obj.data.polygons:
+                    for edge_key in polygon.edge_keys:
+                        edge_face_count[edge_key] = edge_face_count.get(edge_key, 0) + 1
+                for edge in mesh_obj.data.edges:
+                    if edge_face_count.get(tuple(sorted(edge.vertices)), 0) == 1:
+                        pinned.update(edge.vertices)
             
-            for i in range(len(mesh_obj.data.vertices)):
-                if i not in vertex_connections:
-                    continue
-                
-                current_co = shape_key.data[i].co
-                basis_co = basis.data[i].co
-                neighbors = vertex_connections[i]
+            for _ in range(iterations):
+                new_coordinates = {}
                 
-                if not neighbors:
-                    continue
+                for i in range(len(mesh_obj.data.vertices)):
+                    if i not in vertex_connections or i in pinned:
+                        continue
+                    
+                    current_co = shape_key.data[i].co
+                    basis_co = basis.data[i].co
+                    neighbors = vertex_connections[i]
+                    
+                    if not neighbors:
+                        continue
+                    
+                    avg_diff = sum((shape_key.data[n].co - basis.data[n].co) 
+                                 for n in neighbors) / len(neighbors)
+                    current_diff = current_co - basis_co
+                    interpolated_diff = current_diff.lerp(avg_diff, strength)
+                    new_coordinates[i] = basis_co + interpolated_diff
                 
-                avg_diff = sum((shape_key.data[n].co - basis.data[n].co) 
-                             for n in neighbors) / len(neighbors)
-                current_diff = current_co - basis_co
-                interpolated_diff = current_diff.lerp(avg_diff, strength)
-                new_coordinates[i] = basis_co + interpolated_diff
-            
-            for idx, co in new_coordinates.items():
-                shape_key.data[idx].co = co
+                for idx, co in new_coordinates.items():
+                    shape_key.data[idx].co = co
             
             return True, f"Shape key smoothed with strength {strength}"
         except Exception as e:
@@ -217,7 +257,7 @@ class ShapeKeyManager:
         except Exception as e:
             return False, f"Error cleaning shape key: {str(e)}"
 
-    def symmetrize_shape_key(self, mesh_obj, shape_key_name, direction='POSITIVE_X'):
+    def symmetrize_shape_key(self, mesh_obj, shape_key_name, direction='POSITIVE_X', tolerance=0.0001):
         try:
             shape_keys = mesh_obj.data.shape_keys
             shape_key = shape_keys.key_blocks[shape_key_name]
@@ -227,57 +267,45 @@ class ShapeKeyManager:
             is_positive = direction.startswith('POSITIVE')
             axis_index = {'x': 0, 'y': 1, 'z': 2}[axis]
             
-            vertex_map = {}
             vertices = mesh_obj.data.vertices
+            vertex_map = self._find_mirror_pairs(vertices, axis_index, tolerance)
             
-            # 대칭점 찾기
-            for v1 in vertices:
-                if v1.index in vertex_map:
-                    continue
-                
-                pos1 = v1.co
-                for v2 in vertices:
-                    if v2.index == v1.index or v2.index in vertex_map.values():
-                        continue
-                    
-                    pos2 = v2.co
-                    if all(abs(pos1[j] - (-pos2[j] if j == axis_index else pos2[j])) < 0.0001 for j in range(3)):
-                        vertex_map[v1.index] = v2.index
-                        vertex_map[v2.index] = v1.index
-                        break
-            
-            # 변형 대칭화
+            # 변형 대칭화: 원본 변형에서 선택한 쪽을 반대쪽으로 복사
+            original = [shape_key.data[i].co - basis.data[i].co for i in range(len(vertices))]
             for v in vertices:
-                if v.index in vertex_map:
+                side = v.co[axis_index] if is_positive else -v.co[axis_index]
+                if v.index in vertex_map and side > tolerance:
                     mirror_idx = vertex_map[v.index]
-                    
-                    if is_positive == (v.co[axis_index] > 0):
-                        source_idx = v.index
-                        target_idx = mirror_idx
-                    else:
-                        source_idx = mirror_idx
-                        target_idx = v.index
-                    
-                    source_diff = shape_key.data[source_idx].co - basis.data[source_idx].co
-                    mirror_diff = source_diff.copy()
+                    mirror_diff = original[v.index].copy()
                     mirror_diff[axis_index] *= -1
-                    shape_key.data[target_idx].co = basis.data[target_idx].co + mirror_diff
+                    shape_key.data[mirror_idx].co = basis.data[mirror_idx].co + mirror_diff
+
+            # 대칭면 위의 정점은 축 방향 변위를 제거
+            for v in vertices:
+                if v.index in vertex_map and abs(v.co[axis_index]) <= tolerance:
+                    center_diff = original[v.index].copy()
+                    center_diff[axis_index] = 0.0
+                    shape_key.data[v.index].co = basis.data[v.index].co + center_diff
             
             return True, f"Shape key symmetrized along {direction}"
         except Exception as e:
             return False, f"Error symmetrizing shape key: {str(e)}"
 
-    def randomize_shape_key(self, mesh_obj, shape_key_name, strength=0.1):
+    def randomize_shape_key(self, mesh_obj, shape_key_name, strength=0.1, seed=None, noise_scale=0.0):
         try:
+            if noise_scale > 0:
+                return False, "Smooth noise is only available with the Array backend"
+            
             shape_keys = mesh_obj.data.shape_keys
             shape_key = shape_keys.key_blocks[shape_key_name]
             basis = shape_keys.key_blocks["Basis"]
+            rng = random.Random(seed)
             
             for i in range(len(mesh_obj.data.vertices)):
                 random_vector = mathutils.Vector((
-                    (random.random() * 2 - 1) * strength,
-                    (random.random() * 2 - 1) * strength,
-                    (random.random() * 2 - 1) * strength
+                    (rng.random() * 2 - 1) * strength,
+                    (rng.random() * 2 - 1) * strength,
+                    (rng.random() * 2 - 1) * strength
                 ))
                 shape_key.data[i].co = shape_key.data[i].co + random_vector
             
@@ -304,7 +332,7 @@ class ShapeKeyManager:
         except Exception as e:
             return False, f"Error flipping shape key: {str(e)}"
 
-    def duplicate_with_mirror(self, mesh_obj, shape_key_name, axis='X'):
+    def duplicate_with_mirror(self, mesh_obj, shape_key_name, axis='X', tolerance=0.0001):
         try:
             shape_keys = mesh_obj.data.shape_keys
             source_key = shape_keys.key_blocks[shape_key_name]
@@ -316,21 +344,7 @@ class ShapeKeyManager:
             axis_index = {'X': 0, 'Y': 1, 'Z': 2}[axis]
             
             # vertex 매핑 생성 및 대칭 복사
-            vertex_map = {}
-            for v1 in mesh_obj.data.vertices:
-                if v1.index in vertex_map:
-                    continue
-                
-                pos1 = v1.co
-                for v2 in mesh_obj.data.vertices:
-                    if v2.index == v1.index or v2.index in vertex_map.values():
-                        continue
-                    
-                    pos2 = v2.co
-                    if all(abs(pos1[j] - (-pos2[j] if j == axis_index else pos2[j])) < 0.0001 for j in range(3)):
-                        vertex_map[v1.index] = v2.index
-                        vertex_map[v2.index] = v1.index
-                        break
+            vertex_map = self._find_mirror_pairs(mesh_obj.data.vertices, axis_index, tolerance)
             
             for i in range(len(mesh_obj.data.vertices)):
                 if i in vertex_map:
@@ -346,337 +360,2611 @@ class ShapeKeyManager:
         except Exception as e:
             return False, f"Error duplicating shape key: {str(e)}"
 
-class OBJECT_OT_shape_key_adjustments(Operator):
-    """Operator to perform shape key adjustments"""    
-    bl_idname = "object.shape_key_adjustments"
-    bl_label = "Shape Key Adjustments"
-    bl_options = {'REGISTER', 'UNDO'}
+    def split_sides_shape_key(self, mesh_obj, shape_key_name, axis='X', falloff=0.0):
+        try:
+            shape_keys = mesh_obj.data.shape_keys
+            shape_key = shape_keys.key_blocks[shape_key_name]
+            basis = shape_keys.key_blocks["Basis"]
+            axis_index = {'X': 0, 'Y': 1, 'Z': 2}[axis]
+            positive_suffix, negative_suffix = SIDE_SUFFIXES[axis]
+            
+            positive_key = mesh_obj.shape_key_add(name=f"{shape_key_name}{positive_suffix}")
+            negative_key = mesh_obj.shape_key_add(name=f"{shape_key_name}{negative_suffix}")
+            
+            for i in range(len(mesh_obj.data.vertices)):
+                basis_co = basis.data[i].co
+                position = basis_co[axis_index]
+                if falloff > 0:
+                    t = min(max(position / falloff + 0.5, 0.0), 1.0)
+                    weight = t * t * (3.0 - 2.0 * t)
+                else:
+                    weight = 1.0 if position > 0 else (0.0 if position < 0 else 0.5)
+                
+                diff = shape_key.data[i].co - basis_co
+                positive_key.data[i].co = basis_co + diff * weight
+                negative_key.data[i].co = basis_co + diff * (1.0 - weight)
+            
+            return True, f"Shape key split into {positive_key.name} and {negative_key.name}"
+        except Exception as e:
+            return False, f"Error splitting shape key sides: {str(e)}"
 
-    target_mesh: EnumProperty(
-        name="Target Mesh",
-        description="Select mesh with shape keys",
-        items=lambda self, context: [
-            (obj.name, obj.name, "")
-            for obj in context.scene.objects
-            if obj.type == 'MESH' and obj.data.shape_keys
-        ]
-    ) # type: ignore
+class ShapeKeyManager(ReferenceShapeKeyManager):
+    """Array backend: reads keys once with foreach_get and writes back with one foreach_set
 
-    shape_key: EnumProperty(
-        name="Shape Key",
-        description="Select shape key to adjust",
-        items=lambda self, context: [
-            (sk.name, sk.name, "")
-            for sk in bpy.data.objects.get(self.target_mesh, None).data.shape_keys.key_blocks[1:]
-        ] if self.target_mesh and bpy.data.objects.get(self.target_mesh).data.shape_keys else []
-    ) # type: ignore
+    Per-key actions accept a single shape key name or a list of names. A list
+    is loaded as one (K, N, 3) delta array and processed in a single pass.
 
-    action: EnumProperty(
-        name="Action",
-        description="Select action for the shape key",
-        items=[
-            ('INVERT', "Invert", "Invert the shape key value"),
-            ('MIRROR', "Mirror", "Mirror the shape key along an axis"),
-            ('NORMALIZE', "Normalize", "Normalize shape key deformation"),
-            ('MERGE', "Merge", "Merge multiple shape keys"),
-            ('SPLIT', "Split", "Split shape key by deformation amount"),
-            ('SMOOTH', "Smooth", "Smooth shape key deformation"),
-            ('TRANSFER', "Transfer", "Transfer to another mesh"),
-            ('CLEAN', "Clean", "Remove tiny deformations"),
-            ('SYMMETRIZE', "Symmetrize", "Make perfectly symmetrical"),
-            ('RANDOMIZE', "Randomize", "Add random variation"),
-            ('FLIP', "Flip", "Flip along axes"),
-            ('DUPLICATE_MIRROR', "Duplicate Mirror", "Create mirrored copy")
-        ]
-    ) # type: ignore
+    Element-wise actions (invert, flip, normalize, clean) run on SparseDeltas
+    holding only the moving vertices and write back only those.
 
-    # Mirror options
-    mirror_axis: EnumProperty(
-        name="Mirror Axis",
-        description="Axis to mirror along",
-        items=[
-            ('X', "X Axis", "Mirror along X axis"),
-            ('Y', "Y Axis", "Mirror along Y axis"),
-            ('Z', "Z Axis", "Mirror along Z axis")
-        ],
-        default='X'
-    ) # type: ignore
+    With a vertex group, in-place actions only compute on the vertices the
+    group touches and blend the result by the group weights. Actions that
+    create new keys (split, merge, transfer, duplicate) ignore the mask.
+    """
 
-    # Merge options
-    shape_keys_to_merge: EnumProperty(
-        name="Shape Keys to Merge",
-        description="Select shape keys to merge",
-        items=lambda self, context: [
-            (sk.name, sk.name, "")
-            for sk in bpy.data.objects.get(self.target_mesh, None).data.shape_keys.key_blocks[1:]
-        ] if self.target_mesh and bpy.data.objects.get(self.target_mesh).data.shape_keys else [],
-        options={'ENUM_FLAG'}
-    ) # type: ignore
+    def __init__(self, vertex_group="", cache=None, symmetry_method='POSITION'):
+        self.vertex_group = vertex_group
+        self.cache = cache
+        self.symmetry_method = symmetry_method
+        # 마지막으로 사용한 토폴로지 대칭 맵의 충돌 정점 수
+        self.topology_conflicts = 0
+        # 읽은 실행 전 델타를 스냅샷으로 받는 HistoryRecorder
+        self.recorder = None
 
-    merged_name: StringProperty(
-        name="Merged Name",
-        description="Name for the merged shape key",
-        default="Merged"
-    ) # type: ignore
+    def _cached(self, mesh_obj, key, build):
+        """Return a pre-operation value from the redo cache, building it on first use"""
+        if self.cache is None:
+            return build()
+        key = (mesh_obj.data.session_uid,) + key
+        if key not in self.cache:
+            self.cache[key] = build()
+        return self.cache[key]
 
-    # Split options
-    split_threshold: FloatProperty(
-        name="Split Threshold",
-        description="Threshold for splitting shape key",
-        default=0.5,
-        min=0.0,
-        max=1.0,
-        subtype='FACTOR'
-    ) # type: ignore
+    def _group_weights(self, mesh_obj):
+        """Dense (N,) weights of the mask vertex group"""
+        return self._cached(mesh_obj, ("group", self.vertex_group),
+                            lambda: shape_key_prefetch.get_group_weights(mesh_obj, self.vertex_group))
 
-    # Smooth options
-    smooth_strength: FloatProperty(
-        name="Smooth Strength",
-        description="Strength of smoothing effect",
-        default=0.5,
-        min=0.0,
-        max=1.0,
-        subtype='FACTOR'
-    ) # type: ignore
+    def _mask(self, mesh_obj):
+        """Return (indices, weights) of the vertices touched by the vertex group, or None"""
+        if not self.vertex_group:
+            return None
+        weights = self._group_weights(mesh_obj)
+        indices = np.nonzero(weights > 0)[0]
+        return indices, weights[indices]
 
-    # Transfer options
-    target_transfer_mesh: EnumProperty(
-        name="Target Mesh",
-        description="Select target mesh for transfer",
-        items=lambda self, context: [
-            (obj.name, obj.name, "")
-            for obj in context.scene.objects
-            if obj.type == 'MESH' and obj != context.object
-        ]
-    ) # type: ignore
+    def _apply_masked(self, deltas, mask, function):
+        """Apply an element-wise action to the masked vertices only, blended by weight"""
+        if mask is None:
+            return function(deltas)
+        indices, weights = mask
+        region = deltas[..., indices, :]
+        result = deltas.copy()
+        result[..., indices, :] = region + (function(region) - region) * weights[:, None]
+        return result
 
-    # Clean options
-    clean_threshold: FloatProperty(
-        name="Clean Threshold",
-        description="Minimum deformation threshold",
-        default=0.0001,
-        min=0.0,
-        max=1.0,
-        precision=6
-    ) # type: ignore
+    def _blend_masked(self, deltas, adjusted, mask):
+        """Keep an already computed result only inside the mask, blended by weight"""
+        if mask is None:
+            return adjusted
+        indices, weights = mask
+        result = deltas.copy()
+        region = deltas[..., indices, :]
+        result[..., indices, :] = region + (adjusted[..., indices, :] - region) * weights[:, None]
+        return result
 
-    # Symmetrize options
-    symmetrize_direction: EnumProperty(
-        name="Symmetrize Direction",
-        description="Direction for symmetrization",
-        items=[
-            ('POSITIVE_X', "X+ to X-", "Positive X to negative X"),
-            ('NEGATIVE_X', "X- to X+", "Negative X to positive X"),
-            ('POSITIVE_Y', "Y+ to Y-", "Positive Y to negative Y"),
-            ('NEGATIVE_Y', "Y- to Y+", "Negative Y to positive Y"),
-            ('POSITIVE_Z', "Z+ to Z-", "Positive Z to negative Z"),
-            ('NEGATIVE_Z', "Z- to Z+", "Negative Z to positive Z")
-        ],
-        default='POSITIVE_X'
-    ) # type: ignore
+    def _key_names(self, shape_key_name):
+        return [shape_key_name] if isinstance(shape_key_name, str) else list(shape_key_name)
 
-    # Randomize options
-    random_strength: FloatProperty(
-        name="Random Strength",
-        description="Strength of random variation",
-        default=0.1,
-        min=0.0,
-        max=1.0,
-        subtype='FACTOR'
-    ) # type: ignore
+    def _subject(self, key_blocks):
+        return "Shape key" if len(key_blocks) == 1 else f"{len(key_blocks)} shape keys"
 
-    # Flip options
-    flip_axes: EnumProperty(
-        name="Flip Axes",
-        description="Select axes to flip",
-        items=[
-            ('X', "X", "Flip X axis"),
-            ('Y', "Y", "Flip Y axis"),
-            ('Z', "Z", "Flip Z axis")
-        ],
-        options={'ENUM_FLAG'},
-        default={'X'}
-    ) # type: ignore
+    def _read_keys(self, mesh_obj, shape_key_name):
+        """Read basis and (K, N, 3) deltas of the keys
 
-    def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self)
+        With a redo cache the stacked deltas are stored as read and handed
+        back as the same array on a re-run, so callers must not modify them.
+        """
+        shape_keys = mesh_obj.data.shape_keys
+        names = tuple(self._key_names(shape_key_name))
+        key_blocks = [shape_keys.key_blocks[name] for name in names]
 
-    def draw(self, context):
-        layout = self.layout
-        
-        # Shape Key Selection
-        box = layout.box()
-        box.label(text="Shape Key Selection:", icon='SHAPEKEY_DATA')
-        box.prop(self, "target_mesh")
-        if self.target_mesh:
-            box.prop(self, "shape_key")
-        
-        # Action Selection
-        box = layout.box()
-        box.label(text="Action:", icon='MODIFIER')
-        box.prop(self, "action")
-        
-        # Action specific options
-        if self.action == 'MIRROR':
-            box = layout.box()
-            box.label(text="Mirror Options:", icon='MOD_MIRROR')
-            box.prop(self, "mirror_axis")
-        
-        elif self.action == 'MERGE':
-            box = layout.box()
-            box.label(text="Merge Options:", icon='AUTOMERGE_ON')
-            box.prop(self, "shape_keys_to_merge", text="")
-            box.prop(self, "merged_name")
-        
-        elif self.action == 'SPLIT':
-            box = layout.box()
-            box.label(text="Split Options:", icon='MOD_EDGESPLIT')
-            box.prop(self, "split_threshold", slider=True)
-        
-        elif self.action == 'SMOOTH':
-            box = layout.box()
-            box.label(text="Smooth Options:", icon='MOD_SMOOTH')
-            box.prop(self, "smooth_strength", slider=True)
-        
-        elif self.action == 'TRANSFER':
-            box = layout.box()
-            box.label(text="Transfer Options:", icon='TRANSFER_DATA')
-            box.prop(self, "target_transfer_mesh")
-        
-        elif self.action == 'CLEAN':
-            box = layout.box()
-            box.label(text="Clean Options:", icon='BRUSH_DATA')
-            box.prop(self, "clean_threshold", slider=True)
-        
-        elif self.action == 'SYMMETRIZE':
-            box = layout.box()
-            box.label(text="Symmetrize Options:", icon='MOD_MIRROR')
-            box.prop(self, "symmetrize_direction")
-        
-        elif self.action == 'RANDOMIZE':
-            box = layout.box()
-            box.label(text="Randomize Options:", icon='MOD_NOISE')
-            box.prop(self, "random_strength", slider=True)
-        
-        elif self.action == 'FLIP':
-            box = layout.box()
-            box.label(text="Flip Options:", icon='ARROW_LEFTRIGHT')
-            box.prop(self, "flip_axes")
-        
-        elif self.action == 'DUPLICATE_MIRROR':
-            box = layout.box()
-            box.label(text="Duplicate Mirror Options:", icon='MOD_MIRROR')
-            box.prop(self, "mirror_axis")
+        # 리두 캐시: 첫 실행 전의 델타를 한 배열로 보관하고 재실행 시 다시 읽지 않음
+        cache_key = (mesh_obj.data.session_uid, "keys", names)
+        if self.cache is not None and cache_key in self.cache:
+            basis_co, deltas = self.cache[cache_key]
+        else:
+            basis_co, deltas = shape_key_arrays.read_keys_deltas(key_blocks, shape_keys.key_blocks["Basis"])
+            if self.cache is not None:
+                self.cache[cache_key] = (basis_co, deltas)
+        if self.recorder is not None:
+            self.recorder.track_deltas(mesh_obj, names, basis_co, deltas)
+        return key_blocks, basis_co, deltas
 
-    def execute(self, context):
-        if not self.target_mesh or not self.shape_key:
-            self.report({'ERROR'}, "Please select both mesh and shape key")
-            return {'CANCELLED'}
+    def _write_keys(self, mesh_obj, key_blocks, basis_co, deltas):
+        for key_block, key_deltas in zip(key_blocks, deltas):
+            shape_key_arrays.write_coords(key_block.data, basis_co + key_deltas)
+        mesh_obj.data.update()
+        # 이미 메모리에 있는 델타로 통계 갱신
+        shape_key_stats.update_stats(mesh_obj.data, [key_block.name for key_block in key_blocks], basis_co, deltas)
 
-        mesh_obj = bpy.data.objects[self.target_mesh]
-        manager = ShapeKeyManager()
+    def _read_keys_sparse(self, mesh_obj, shape_key_name):
+        """Like _read_keys, but keep only the vertices that move in any of the keys
 
-        try:
-            if self.action == 'INVERT':
-                success, message = manager.invert_shape_key(mesh_obj, self.shape_key)
-            
-            elif self.action == 'MIRROR':
-                success, message = manager.mirror_shape_key(
-                    mesh_obj, 
-                    self.shape_key, 
-                    self.mirror_axis
-                )
-            
-            elif self.action == 'NORMALIZE':
-                success, message = manager.normalize_shape_key(mesh_obj, self.shape_key)
-            
-            elif self.action == 'MERGE':
-                if not self.shape_keys_to_merge:
-                    self.report({'ERROR'}, "Please select shape keys to merge")
-                    return {'CANCELLED'}
-                success, message = manager.merge_shape_keys(
-                    mesh_obj,
-                    list(self.shape_keys_to_merge),
-                    self.merged_name
-                )
-            
-            elif self.action == 'SPLIT':
-                success, message = manager.split_shape_key(
-                    mesh_obj,
-                    self.shape_key,
-                    self.split_threshold
-                )
-            
-            elif self.action == 'SMOOTH':
-                success, message = manager.smooth_shape_key(
-                    mesh_obj,
-                    self.shape_key,
-                    self.smooth_strength
-                )
-            
-            elif self.action == 'TRANSFER':
-                if not self.target_transfer_mesh:
-                    self.report({'ERROR'}, "Please select target mesh")
-                    return {'CANCELLED'}
-                target_obj = bpy.data.objects[self.target_transfer_mesh]
-                success, message = manager.transfer_shape_key(
-                    mesh_obj,
-                    target_obj,
-                    self.shape_key
-                )
-            
-            elif self.action == 'CLEAN':
-                success, message = manager.clean_shape_key(
-                    mesh_obj,
-                    self.shape_key,
-                    self.clean_threshold
-                )
-            
-            elif self.action == 'SYMMETRIZE':
-                success, message = manager.symmetrize_shape_key(
-                    mesh_obj,
-                    self.shape_key,
-                    self.symmetrize_direction
+        With a vertex group the sparse set is further limited to the group,
+        paired with the matching (M,) weights.
+
+        Returns:
+            tuple: (key_blocks, basis_co, SparseDeltas, weights or None)
+        """
+        key_blocks, basis_co, deltas = self._read_keys(mesh_obj, shape_key_name)
+        sparse = shape_key_arrays.SparseDeltas.from_dense(deltas)
+
+        mask = self._mask(mesh_obj)
+        if mask is None:
+            return key_blocks, basis_co, sparse, None
+        weights = np.zeros(len(basis_co), dtype=np.float32)
+        weights[mask[0]] = mask[1]
+        sparse = sparse.take(weights[sparse.indices] > 0)
+        return key_blocks, basis_co, sparse, weights[sparse.indices]
+
+    def _apply_sparse(self, sparse, weights, function):
+        """Apply an element-wise action to sparse deltas, blended by mask weights"""
+        result = sparse.apply(function)
+        if weights is not None:
+            result.deltas = sparse.deltas + (result.deltas - sparse.deltas) * weights[:, None]
+        return result
+
+    def _write_sparse(self, mesh_obj, key_blocks, basis_co, sparse):
+        """Write back only the vertices stored in the sparse deltas"""
+        deltas = sparse.deltas.reshape((len(key_blocks), len(sparse), 3))
+        for key_block, key_deltas in zip(key_blocks, deltas):
+            shape_key_arrays.write_sparse_deltas(key_block, basis_co, sparse.indices, key_deltas)
+        mesh_obj.data.update()
+        names = [key_block.name for key_block in key_blocks]
+        if self.vertex_group:
+            # 마스크 밖에서 움직이는 정점은 부분 배열에 없으므로 통계를 다시 계산하게 함
+            shape_key_stats.invalidate(mesh_obj.data, names)
+            return
+        # 빠진 정점은 변위가 0이므로 부분 배열로도 통계가 같음
+        shape_key_stats.update_stats(mesh_obj.data, names, basis_co[sparse.indices], deltas)
+
+    def get_symmetry_map(self, mesh_obj, basis_co, axis, tolerance=0.0001):
+        """Shared mirror pairing for mirror, symmetrize and duplicate_with_mirror
+
+        The map is cached on the mesh and only rebuilt when its topology or
+        basis changes. With the 'TOPOLOGY' method the pairing comes from the
+        mesh's centre edge instead of vertex positions.
+
+        Returns:
+            tuple: (mirror index array, number of unmatched vertices)
+        """
+        if self.symmetry_method == 'TOPOLOGY':
+            mirror_map, self.topology_conflicts = self._cached(
+                mesh_obj, ("topology",), lambda: shape_key_topology.get_cached_topology_map(mesh_obj.data)
+            )
+            return mirror_map, int(np.count_nonzero(mirror_map < 0))
+
+        shape_key_prefetch.finish_pending(mesh_obj.data)
+        mirror_map = self._cached(
+            mesh_obj, ("symmetry", axis, tolerance),
+            lambda: shape_key_arrays.get_cached_symmetry_map(mesh_obj.data, basis_co, axis, tolerance)
+        )
+        return mirror_map, int(np.count_nonzero(mirror_map < 0))
+
+    def _unmatched_note(self, unmatched):
+        note = f" ({unmatched} vertices without a mirror partner)" if unmatched else ""
+        if self.topology_conflicts:
+            # 토폴로지가 대칭이 아니면 일부 짝이 틀릴 수 있음
+            note += f" ({self.topology_conflicts} vertices with conflicting topology partners)"
+        return note
+
+    def invert_shape_key(self, mesh_obj, shape_key_name):
+        try:
+            key_blocks, basis_co, sparse, weights = self._read_keys_sparse(mesh_obj, shape_key_name)
+
+            inverted = self._apply_sparse(sparse, weights, shape_key_arrays.invert_deltas)
+            self._write_sparse(mesh_obj, key_blocks, basis_co, inverted)
+
+            return True, f"{self._subject(key_blocks)} inverted successfully"
+        except Exception as e:
+            return False, f"Error inverting shape key: {str(e)}"
+
+    def mirror_shape_key(self, mesh_obj, shape_key_name, axis='X', tolerance=0.0001):
+        try:
+            key_blocks, basis_co, deltas = self._read_keys(mesh_obj, shape_key_name)
+
+            mirror_map, unmatched = self.get_symmetry_map(mesh_obj, basis_co, axis, tolerance)
+            mirrored = shape_key_arrays.mirror_deltas(deltas, mirror_map, axis)
+            self._write_keys(mesh_obj, key_blocks, basis_co,
+                             self._blend_masked(deltas, mirrored, self._mask(mesh_obj)))
+
+            return True, f"{self._subject(key_blocks)} mirrored successfully along {axis} axis{self._unmatched_note(unmatched)}"
+        except Exception as e:
+            return False, f"Error mirroring shape key: {str(e)}"
+
+    def normalize_shape_key(self, mesh_obj, shape_key_name, target=1.0):
+        try:
+            key_blocks, basis_co, sparse, weights = self._read_keys_sparse(mesh_obj, shape_key_name)
+
+            if not len(sparse):
+                return False, "No deformation found in shape key"
+
+            normalized = self._apply_sparse(
+                sparse, weights, lambda values: shape_key_arrays.normalize_deltas(values, target)[0]
+            )
+
+            self._write_sparse(mesh_obj, key_blocks, basis_co, normalized)
+
+            return True, f"{self._subject(key_blocks)} normalized successfully"
+        except Exception as e:
+            return False, f"Error normalizing shape key: {str(e)}"
+
+    def merge_shape_keys(self, mesh_obj, shape_keys_to_merge, new_name="Merged", weights=None):
+        try:
+            shape_keys = mesh_obj.data.shape_keys
+            basis_co = shape_key_arrays.read_coords(shape_keys.key_blocks["Basis"].data)
+
+            weights = weights or [1.0] * len(shape_keys_to_merge)
+            merge_pairs = [(shape_keys.key_blocks[key_name], weight)
+                           for key_name, weight in zip(shape_keys_to_merge, weights)
+                           if key_name in shape_keys.key_blocks]
+            merged = shape_key_arrays.accumulate_key_deltas(
+                [key_block for key_block, _ in merge_pairs],
+                basis_co,
+                [weight for _, weight in merge_pairs]
+            )
+
+            new_key = mesh_obj.shape_key_add(name=new_name)
+            self._write_keys(mesh_obj, [new_key], basis_co, [merged])
+
+            return True, f"Successfully merged {len(shape_keys_to_merge)} shape keys"
+        except Exception as e:
+            return False, f"Error merging shape keys: {str(e)}"
+
+    def create_corrective_shape_key(self, mesh_obj, driving_keys, weights, target_co, new_name="", threshold=0.0):
+        """Store what a target shape adds on top of the linear sum of driving keys
+
+        corrective = target - (basis + sum(weight * driving key delta)),
+        computed for all vertices in one pass.
+
+        Args:
+            driving_keys: Names of the keys active in the target pose
+            weights: Value of each driving key in the target pose
+            target_co: (N, 3) target coordinates in object space
+            new_name: Corrective key name, defaults to the driving names joined
+            threshold: Corrections at or below this distance are snapped to zero
+
+        Returns:
+            tuple: (success, message, corrective key name or None)
+        """
+        try:
+            key_blocks = mesh_obj.data.shape_keys.key_blocks
+            basis_co = shape_key_arrays.read_coords(key_blocks["Basis"].data)
+            if len(target_co) != len(basis_co):
+                return False, (f"Target has {len(target_co)} vertices, "
+                               f"{mesh_obj.name} has {len(basis_co)}"), None
+
+            linear = shape_key_arrays.accumulate_key_deltas(
+                [key_blocks[name] for name in driving_keys], basis_co, weights
+            )
+            corrective = target_co - basis_co - linear
+            corrective, _ = shape_key_arrays.clean_deltas(corrective, threshold)
+
+            new_key = mesh_obj.shape_key_add(name=new_name or "_".join(driving_keys) + "_corrective", from_mix=False)
+            self._write_keys(mesh_obj, [new_key], basis_co, [corrective])
+
+            moved = int(np.count_nonzero(shape_key_arrays.delta_lengths(corrective) > threshold))
+            return True, f"Created corrective shape key {new_key.name} ({moved} vertices)", new_key.name
+        except Exception as e:
+            return False, f"Error creating corrective shape key: {str(e)}", None
+
+    def bake_pose_shape_keys(self, mesh_obj, poses):
+        """Write evaluated poses as new shape keys relative to the basis
+
+        Args:
+            poses: Iterable of (key name, (N, 3) object-space coordinates),
+                consumed one pose at a time so a frame range never holds
+                more than one pose in memory
+
+        Returns:
+            tuple: (success, message, names of the created keys)
+        """
+        created = []
+        try:
+            basis_co = shape_key_arrays.read_coords(mesh_obj.data.shape_keys.key_blocks["Basis"].data)
+            for name, coords in poses:
+                if len(coords) != len(basis_co):
+                    return False, (f"Evaluated mesh has {len(coords)} vertices, the basis has {len(basis_co)}. "
+                                   f"Disable modifiers that change topology"), created
+                new_key = mesh_obj.shape_key_add(name=name, from_mix=False)
+                self._write_keys(mesh_obj, [new_key], basis_co, [coords - basis_co])
+                created.append(new_key.name)
+
+            return True, f"Baked {len(created)} pose(s) to shape keys", created
+        except Exception as e:
+            return False, f"Error baking pose to shape key: {str(e)}", created
+
+    def split_shape_key(self, mesh_obj, shape_key_name, threshold=0.5, falloff=0.0, bands=2):
+        """Split keys by displacement magnitude
+
+        With two bands the keys are split at ``threshold`` into _High and _Low.
+        More bands use evenly spaced boundaries and are named _Band1 (lowest)
+        upward. ``falloff`` blends the bands so they still sum to the original.
+        """
+        try:
+            key_blocks, basis_co, deltas = self._read_keys(mesh_obj, shape_key_name)
+
+            if bands == 2:
+                boundaries = [threshold]
+                suffixes = ["_Low", "_High"]
+            else:
+                boundaries = [i / bands for i in range(1, bands)]
+                suffixes = [f"_Band{i + 1}" for i in range(bands)]
+            band_deltas = shape_key_arrays.band_split_deltas(deltas, boundaries, falloff)
+
+            new_keys = []
+            for k, key_block in enumerate(key_blocks):
+                # 기존 순서대로 High 먼저 생성
+                for band in reversed(range(bands)) if bands == 2 else range(bands):
+                    new_key = mesh_obj.shape_key_add(name=f"{key_block.name}{suffixes[band]}")
+                    shape_key_arrays.write_coords(new_key.data, basis_co + band_deltas[band, k])
+                    new_keys.append(new_key)
+            mesh_obj.data.update()
+
+            if len(key_blocks) == 1:
+                if bands == 2:
+                    return True, f"Shape key split into {new_keys[0].name} and {new_keys[1].name}"
+                return True, f"Shape key split into {bands} bands"
+            return True, f"{len(key_blocks)} shape keys split into {len(new_keys)} keys"
+        except Exception as e:
+            return False, f"Error splitting shape key: {str(e)}"
+
+    def split_sides_shape_key(self, mesh_obj, shape_key_name, axis='X', falloff=0.0):
+        """Split keys into positive / negative side halves (_L / _R for X)
+
+        The side weight is computed once for all keys; each output key is
+        added with one shape_key_add and written with one foreach_set.
+        """
+        try:
+            key_blocks, basis_co, deltas = self._read_keys(mesh_obj, shape_key_name)
+
+            weights = shape_key_arrays.side_weights(basis_co, axis, falloff)
+            positive_deltas, negative_deltas = shape_key_arrays.split_sides_deltas(deltas, weights)
+            positive_suffix, negative_suffix = SIDE_SUFFIXES[axis]
+
+            new_keys = []
+            for key_block, positive, negative in zip(key_blocks, positive_deltas, negative_deltas):
+                positive_key = mesh_obj.shape_key_add(name=f"{key_block.name}{positive_suffix}")
+                negative_key = mesh_obj.shape_key_add(name=f"{key_block.name}{negative_suffix}")
+                shape_key_arrays.write_coords(positive_key.data, basis_co + positive)
+                shape_key_arrays.write_coords(negative_key.data, basis_co + negative)
+                new_keys += [positive_key, negative_key]
+            mesh_obj.data.update()
+
+            if len(key_blocks) == 1:
+                return True, f"Shape key split into {new_keys[0].name} and {new_keys[1].name}"
+            return True, f"{len(key_blocks)} shape keys split into {len(new_keys)} side keys"
+        except Exception as e:
+            return False, f"Error splitting shape key sides: {str(e)}"
+
+    def smoothed_deltas(self, mesh_obj, deltas, strength=0.5, iterations=1, pin_boundary=False):
+        """Smooth already loaded deltas without writing them (shared with the interactive preview)"""
+        mesh = mesh_obj.data
+        adjacency = self._cached(mesh_obj, ("adjacency",), lambda: shape_key_prefetch.get_adjacency(mesh))
+        pinned = self._cached(mesh_obj, ("boundary",),
+                              lambda: shape_key_arrays.boundary_vertex_mask(mesh)) if pin_boundary else None
+        weights = self._group_weights(mesh_obj) if self.vertex_group else None
+        return shape_key_arrays.smooth_deltas(deltas, adjacency, strength, iterations, pinned, weights)
+
+    def smooth_shape_key(self, mesh_obj, shape_key_name, strength=0.5, iterations=1, pin_boundary=False):
+        try:
+            key_blocks, basis_co, deltas = self._read_keys(mesh_obj, shape_key_name)
+
+            smoothed = self.smoothed_deltas(mesh_obj, deltas, strength, iterations, pin_boundary)
+            self._write_keys(mesh_obj, key_blocks, basis_co, smoothed)
+
+            return True, f"{self._subject(key_blocks)} smoothed with strength {strength}"
+        except Exception as e:
+            return False, f"Error smoothing shape key: {str(e)}"
+
+    def transfer_shape_keys(self, source_mesh, target_meshes, shape_key_names,
+                            replace_existing=True, skip_threshold=None):
+        return shape_key_arrays.drain(self.iter_transfer_shape_keys(
+            source_mesh, target_meshes, shape_key_names, replace_existing, skip_threshold
+        ))
+
+    def iter_transfer_shape_keys(self, source_mesh, target_meshes, shape_key_names,
+                                 replace_existing=True, skip_threshold=None, chunk_size=None):
+        """Transfer several shape keys from one source to several targets
+
+        Generator yielding (target vertices done, total) while the surface
+        correspondences are built; transfer_shape_keys runs it to completion.
+        Keys are written once per target after its correspondence is done.
+
+        All source deltas are read once as a (K, N, 3) array. Each target
+        gets one (cached) surface correspondence and all its keys are
+        interpolated in a single pass.
+
+        Args:
+            source_mesh: Source mesh object
+            target_meshes: Target mesh objects
+            shape_key_names: Names of source shape keys to transfer
+            replace_existing: Overwrite target keys of the same name instead of adding new ones
+            skip_threshold: Skip keys whose transferred displacement never exceeds this value
+
+        Returns:
+            tuple: (success, message, number of written keys)
+        """
+        try:
+            source_keys = source_mesh.data.shape_keys.key_blocks
+            missing = [name for name in shape_key_names if name not in source_keys]
+            if missing:
+                return False, f"Source shape key not found: {', '.join(missing)}", 0
+
+            _, source_deltas = shape_key_arrays.read_keys_deltas(
+                [source_keys[name] for name in shape_key_names], source_keys["Basis"]
+            )
+
+            written = 0
+            skipped = 0
+            done = 0
+            total = sum(len(target_mesh.data.vertices) for target_mesh in target_meshes)
+            for target_mesh in target_meshes:
+                # 표면 대응 관계 (캐시됨)
+                job = shape_key_transfer.iter_get_correspondence(source_mesh, target_mesh, chunk_size)
+                while True:
+                    try:
+                        yield done + next(job), total
+                    except StopIteration as stop:
+                        triangles, triangle_index, weights = stop.value
+                        break
+                done += len(target_mesh.data.vertices)
+                target_deltas = shape_key_transfer.to_target_deltas(
+                    shape_key_transfer.interpolate_deltas(source_deltas, triangles, triangle_index, weights),
+                    shape_key_transfer.relative_matrix(source_mesh, target_mesh)
                 )
-            
-            elif self.action == 'RANDOMIZE':
-                success, message = manager.randomize_shape_key(
-                    mesh_obj,
-                    self.shape_key,
-                    self.random_strength
+
+                keep = np.ones(len(shape_key_names), dtype=bool)
+                if skip_threshold is not None:
+                    keep = shape_key_arrays.max_delta_length(target_deltas) > skip_threshold
+                skipped += int(np.count_nonzero(~keep))
+                if not keep.any():
+                    continue
+
+                if not target_mesh.data.shape_keys:
+                    target_mesh.shape_key_add(name="Basis")
+                target_keys = target_mesh.data.shape_keys.key_blocks
+                target_co = shape_key_arrays.read_coords(target_mesh.data.vertices)
+
+                for k in np.nonzero(keep)[0]:
+                    name = shape_key_names[k]
+                    target_key = target_keys.get(name) if replace_existing else None
+                    if target_key is None:
+                        target_key = target_mesh.shape_key_add(name=name)
+                    shape_key_arrays.write_coords(target_key.data, target_co + target_deltas[k])
+                    written += 1
+                target_mesh.data.update()
+                shape_key_stats.invalidate(target_mesh.data, [shape_key_names[k] for k in np.nonzero(keep)[0]])
+
+            message = f"Transferred {written} shape keys to {len(target_meshes)} meshes"
+            if skipped:
+                message += f" ({skipped} empty keys skipped)"
+            return True, message, written
+        except Exception as e:
+            return False, f"Error transferring shape keys: {str(e)}", 0
+
+    def transfer_shape_key(self, source_mesh, target_mesh, shape_key_name):
+        if not source_mesh.data.shape_keys or shape_key_name not in source_mesh.data.shape_keys.key_blocks:
+            return False, "Source shape key not found"
+
+        success, message, _ = self.transfer_shape_keys(
+            source_mesh, [target_mesh], [shape_key_name], replace_existing=False
+        )
+        if not success:
+            return False, message
+        return True, f"Shape key transferred to {target_mesh.name}"
+
+    def clean_shape_key(self, mesh_obj, shape_key_name, threshold=0.0001):
+        try:
+            key_blocks, basis_co, sparse, weights = self._read_keys_sparse(mesh_obj, shape_key_name)
+
+            # 이미 기저와 같은 정점은 희소 배열에 없으므로 실제로 스냅된 정점만 셈
+            small = shape_key_arrays.delta_lengths(sparse.deltas) <= threshold
+            cleaned_count = int(np.count_nonzero(small))
+
+            cleaned = self._apply_sparse(
+                sparse, weights, lambda values: shape_key_arrays.clean_deltas(values, threshold)[0]
+            )
+            self._write_sparse(mesh_obj, key_blocks, basis_co, cleaned)
+
+            if len(key_blocks) == 1:
+                return True, f"Cleaned {cleaned_count} vertices in shape key"
+            return True, f"Cleaned {cleaned_count} vertices in {len(key_blocks)} shape keys"
+        except Exception as e:
+            return False, f"Error cleaning shape key: {str(e)}"
+
+    def symmetrize_shape_key(self, mesh_obj, shape_key_name, direction='POSITIVE_X', tolerance=0.0001):
+        return shape_key_arrays.drain(
+            self.iter_symmetrize_shape_key(mesh_obj, shape_key_name, direction, tolerance)
+        )
+
+    def iter_symmetrize_shape_key(self, mesh_obj, shape_key_name, direction='POSITIVE_X', tolerance=0.0001,
+                                  chunk_size=None):
+        """Generator form of symmetrize_shape_key for chunked execution
+
+        Yields (vertices done, total) while building the symmetry map and
+        while symmetrizing, each over all N vertices. Nothing is written
+        until the last chunk, so closing the generator early leaves the
+        keys untouched. Returns (success, message).
+        """
+        try:
+            key_blocks, basis_co, deltas = self._read_keys(mesh_obj, shape_key_name)
+            count = len(basis_co)
+            total = count * 2
+
+            axis = direction[-1]
+            cache_key = (mesh_obj.data.session_uid, "symmetry", axis, tolerance)
+            if self.symmetry_method == 'TOPOLOGY':
+                mirror_map, _ = self.get_symmetry_map(mesh_obj, basis_co, axis, tolerance)
+            elif self.cache is not None and cache_key in self.cache:
+                mirror_map = self.cache[cache_key]
+            else:
+                shape_key_prefetch.finish_pending(mesh_obj.data)
+                job = shape_key_arrays.iter_cached_symmetry_map(mesh_obj.data, basis_co, axis, tolerance, chunk_size)
+                while True:
+                    try:
+                        yield next(job), total
+                    except StopIteration as stop:
+                        mirror_map = stop.value
+                        break
+                if self.cache is not None:
+                    self.cache[cache_key] = mirror_map
+            unmatched = int(np.count_nonzero(mirror_map < 0))
+
+            symmetrized = deltas.copy()
+            chunk_size = chunk_size or max(count, 1)
+            for start in range(0, count, chunk_size):
+                shape_key_arrays.symmetrize_rows(
+                    symmetrized, deltas, basis_co, mirror_map, axis,
+                    positive=direction.startswith('POSITIVE'),
+                    tolerance=tolerance,
+                    start=start,
+                    stop=start + chunk_size,
+                    topological=self.symmetry_method == 'TOPOLOGY'
                 )
-            
-            elif self.action == 'FLIP':
-                if not self.flip_axes:
-                    self.report({'ERROR'}, "Please select at least one axis")
-                    return {'CANCELLED'}
-                success, message = manager.flip_shape_key(
-                    mesh_obj,
-                    self.shape_key,
-                    list(self.flip_axes)
+                yield count + min(start + chunk_size, count), total
+
+            self._write_keys(mesh_obj, key_blocks, basis_co,
+                             self._blend_masked(deltas, symmetrized, self._mask(mesh_obj)))
+
+            return True, f"{self._subject(key_blocks)} symmetrized along {direction}{self._unmatched_note(unmatched)}"
+        except Exception as e:
+            return False, f"Error symmetrizing shape key: {str(e)}"
+
+    def randomize_shape_key(self, mesh_obj, shape_key_name, strength=0.1, seed=None, noise_scale=0.0):
+        try:
+            key_blocks, basis_co, deltas = self._read_keys(mesh_obj, shape_key_name)
+            mask = self._mask(mesh_obj)
+            coords = basis_co if mask is None else basis_co[mask[0]]
+
+            # 키 이름으로 시드를 나눠 일괄 처리 여부와 관계없이 같은 결과
+            randomized = np.empty_like(deltas)
+            for k, key_block in enumerate(key_blocks):
+                rng = np.random.default_rng(
+                    None if seed is None else [seed, zlib.crc32(key_block.name.encode())]
                 )
-            
-            elif self.action == 'DUPLICATE_MIRROR':
-                success, message = manager.duplicate_with_mirror(
-                    mesh_obj,
-                    self.shape_key,
-                    self.mirror_axis
+                randomized[k] = self._apply_masked(
+                    deltas[k], mask,
+                    lambda values: shape_key_arrays.randomize_deltas(values, strength, rng, coords, noise_scale)
                 )
-            
-            else:
-                success, message = False, "Unknown action"
+            self._write_keys(mesh_obj, key_blocks, basis_co, randomized)
 
-            if success:
-                self.report({'INFO'}, message)
-                return {'FINISHED'}
-            else:
-                self.report({'ERROR'}, message)
-                return {'CANCELLED'}
-                
+            return True, f"Random variation added with strength {strength}"
         except Exception as e:
-            self.report({'ERROR'}, f"Operation failed: {str(e)}")
-            return {'CANCELLED'}
+            return False, f"Error randomizing shape key: {str(e)}"
+
+    def flip_shape_key(self, mesh_obj, shape_key_name, axes=['X']):
+        try:
+            key_blocks, basis_co, sparse, weights = self._read_keys_sparse(mesh_obj, shape_key_name)
+
+            flipped = self._apply_sparse(
+                sparse, weights, lambda values: shape_key_arrays.flip_deltas(values, axes)
+            )
+            self._write_sparse(mesh_obj, key_blocks, basis_co, flipped)
+
+            return True, f"{self._subject(key_blocks)} flipped along {', '.join(axes)} axes"
+        except Exception as e:
+            return False, f"Error flipping shape key: {str(e)}"
+
+    def duplicate_with_mirror(self, mesh_obj, shape_key_name, axis='X', tolerance=0.0001):
+        try:
+            key_blocks, basis_co, deltas = self._read_keys(mesh_obj, shape_key_name)
+
+            mirror_map, unmatched = self.get_symmetry_map(mesh_obj, basis_co, axis, tolerance)
+            mirrored = shape_key_arrays.mirror_deltas(deltas, mirror_map, axis)
+            mirrored[..., mirror_map < 0, :] = 0.0
+
+            new_keys = []
+            for key_block, key_deltas in zip(key_blocks, mirrored):
+                new_key = mesh_obj.shape_key_add(name=f"{key_block.name}_mirror_{axis}")
+                shape_key_arrays.write_coords(new_key.data, basis_co + key_deltas)
+                new_keys.append(new_key)
+            mesh_obj.data.update()
+
+            if len(new_keys) == 1:
+                return True, f"Created mirrored shape key: {new_keys[0].name}{self._unmatched_note(unmatched)}"
+            return True, f"Created {len(new_keys)} mirrored shape keys{self._unmatched_note(unmatched)}"
+        except Exception as e:
+            return False, f"Error duplicating shape key: {str(e)}"
+
+    def find_duplicate_shape_keys(self, mesh_obj, tolerance=0.01, resolve='REPORT'):
+        """Find groups of nearly identical shape keys and optionally resolve them
+
+        Args:
+            tolerance: Largest relative distance between two keys' deltas
+            resolve: 'REPORT' only lists the groups, 'MERGE' replaces each
+                group's first key by the group average and removes the rest,
+                'REMOVE' keeps the first key and removes the rest
+
+        Returns:
+            tuple: (success, message, groups as [(kept name, [(name, similarity), ...])])
+        """
+        try:
+            shape_keys = mesh_obj.data.shape_keys
+            key_blocks = list(shape_keys.key_blocks[1:])
+            if len(key_blocks) < 2:
+                return False, "Need at least two shape keys to compare", []
+
+            # 키를 하나씩 읽어 시그니처만 보관, 전체 델타는 후보 쌍에만 다시 읽음
+            basis_co = shape_key_arrays.read_coords(shape_keys.key_blocks["Basis"].data)
+            projection = shape_key_arrays.sketch_projection(len(basis_co))
+            signatures = np.empty((len(key_blocks), shape_key_arrays.SIGNATURE_DIMS), dtype=np.float64)
+            buffer = np.empty_like(basis_co)
+            empty = 0
+            for k, key_block in enumerate(key_blocks):
+                key_block.data.foreach_get("co", buffer.ravel())
+                buffer -= basis_co
+                signatures[k] = shape_key_arrays.delta_signature(buffer, projection)
+                empty += not buffer.any()
+
+            def load_rows(indices):
+                return shape_key_arrays.read_keys_relative([key_blocks[i] for i in indices], basis_co)
+
+            found = shape_key_arrays.find_duplicate_groups(signatures, load_rows, tolerance)
+            groups = [(key_blocks[representative].name,
+                       [(key_blocks[member].name, similarity) for member, similarity in members])
+                      for representative, members in found]
+
+            if not groups:
+                message = "No duplicate shape keys found"
+                if empty:
+                    message += f" ({empty} shape keys have no displacement)"
+                return True, message, groups
+
+            if resolve == 'MERGE':
+                for representative, members in found:
+                    indices = [representative] + [member for member, _ in members]
+                    self._write_keys(mesh_obj, [key_blocks[representative]], basis_co,
+                                     load_rows(indices).mean(axis=0, keepdims=True))
+
+            removed = 0
+            if resolve in {'MERGE', 'REMOVE'}:
+                removed_names = [name for _, members in groups for name, _ in members]
+                for name in removed_names:
+                    mesh_obj.shape_key_remove(shape_keys.key_blocks[name])
+                shape_key_stats.invalidate(mesh_obj.data, removed_names)
+                removed = len(removed_names)
+
+            summary = "; ".join(
+                f"{name} = " + ", ".join(f"{member} ({similarity * 100:.1f}%)" for member, similarity in members)
+                for name, members in groups
+            )
+            if resolve == 'MERGE':
+                return True, f"Merged {removed} duplicate shape keys in {len(groups)} groups: {summary}", groups
+            if resolve == 'REMOVE':
+                return True, f"Removed {removed} duplicate shape keys in {len(groups)} groups: {summary}", groups
+            return True, f"Found {len(groups)} duplicate groups: {summary}", groups
+        except Exception as e:
+            return False, f"Error finding duplicate shape keys: {str(e)}", []
+
+    def clean_all_shape_keys(self, mesh_objs, threshold=0.0001, remove_empty=False):
+        """Snap sub-threshold deltas of every shape key of the meshes in one pass per mesh
+
+        Only keys that actually change are written back. Keys left without
+        any displacement are reported, and removed with ``remove_empty``.
+
+        Returns:
+            tuple: (success, message)
+        """
+        try:
+            cleaned_keys = 0
+            cleaned_vertices = 0
+            empty_keys = 0
+            reclaimable = 0
+
+            for mesh_obj in mesh_objs:
+                shape_keys = mesh_obj.data.shape_keys
+                if not shape_keys or len(shape_keys.key_blocks) < 2:
+                    continue
+
+                key_blocks = list(shape_keys.key_blocks[1:])
+                basis_co, deltas = shape_key_arrays.read_keys_deltas(key_blocks, shape_keys.key_blocks["Basis"])
+
+                lengths = shape_key_arrays.delta_lengths(deltas)
+                snapped = (lengths > 0) & (lengths <= threshold)
+                changed = np.nonzero(snapped.any(axis=1))[0]
+                if len(changed):
+                    cleaned, _ = shape_key_arrays.clean_deltas(deltas[changed], threshold)
+                    self._write_keys(mesh_obj, [key_blocks[k] for k in changed], basis_co, cleaned)
+                cleaned_keys += len(changed)
+                cleaned_vertices += int(np.count_nonzero(snapped))
+
+                # 정리 후 변형이 전혀 없는 키 (키 블록마다 정점당 float 3개)
+                empty = [key_blocks[k].name for k in np.nonzero((lengths <= threshold).all(axis=1))[0]]
+                empty_keys += len(empty)
+                reclaimable += len(empty) * len(basis_co) * 3 * 4
+                if remove_empty and empty:
+                    for name in empty:
+                        mesh_obj.shape_key_remove(shape_keys.key_blocks[name])
+                    shape_key_stats.invalidate(mesh_obj.data, empty)
+
+            message = f"Cleaned {cleaned_vertices} vertices in {cleaned_keys} shape keys"
+            if empty_keys:
+                if remove_empty:
+                    message += f", removed {empty_keys} empty shape keys ({reclaimable / 1024 / 1024:.2f} MB reclaimed)"
+                else:
+                    message += f", {empty_keys} shape keys are empty ({reclaimable / 1024 / 1024:.2f} MB reclaimable by removing them)"
+            return True, message
+        except Exception as e:
+            return False, f"Error cleaning shape keys: {str(e)}"
+
+    def export_shape_key_library(self, mesh_obj, filepath, shape_key_names, precision='FLOAT32'):
+        """Write shape keys to a library file, reading one key at a time
+
+        Returns:
+            tuple: (success, message)
+        """
+        try:
+            mesh = mesh_obj.data
+            key_blocks = mesh.shape_keys.key_blocks
+            basis_co = shape_key_arrays.read_coords(key_blocks["Basis"].data)
+
+            def library_keys():
+                for name in shape_key_names:
+                    key_block = key_blocks[name]
+                    metadata = {
+                        "slider_min": key_block.slider_min,
+                        "slider_max": key_block.slider_max,
+                        "value": key_block.value,
+                        "vertex_group": key_block.vertex_group,
+                        "interpolation": key_block.interpolation,
+                        "mute": key_block.mute,
+                    }
+                    yield name, shape_key_arrays.read_coords(key_block.data) - basis_co, metadata
+
+            count = shape_key_library.write_library(
+                filepath,
+                len(basis_co),
+                shape_key_arrays.topology_fingerprint(mesh),
+                library_keys(),
+                precision
+            )
+            return True, f"Exported {count} shape keys to {filepath}"
+        except Exception as e:
+            return False, f"Error exporting shape key library: {str(e)}"
+
+    def import_shape_key_library(self, mesh_obj, filepath, pattern="*", replace_existing=True, ignore_topology=False):
+        """Load the library keys matching the pattern onto the mesh
+
+        Only the header and the blocks of the matching keys are read.
+
+        Args:
+            ignore_topology: Accept a library whose edges differ as long as the vertex count matches
+
+        Returns:
+            tuple: (success, message)
+        """
+        try:
+            mesh = mesh_obj.data
+            header = shape_key_library.read_library_header(filepath)
+            if header["vertex_count"] != len(mesh.vertices):
+                return False, f"Library has {header['vertex_count']} vertices, mesh has {len(mesh.vertices)}"
+            if header["fingerprint"] != shape_key_arrays.topology_fingerprint(mesh) and not ignore_topology:
+                return False, "Library was exported from a mesh with a different topology"
+
+            names = [entry["name"] for entry in header["keys"] if fnmatch.fnmatchcase(entry["name"], pattern)]
+            if not names:
+                return False, "No library shape keys match the pattern"
+
+            if not mesh.shape_keys:
+                mesh_obj.shape_key_add(name="Basis")
+            key_blocks = mesh.shape_keys.key_blocks
+            basis_co = shape_key_arrays.read_coords(key_blocks["Basis"].data)
+
+            for entry, deltas in shape_key_library.load_library_keys(filepath, header, names):
+                key_block = key_blocks.get(entry["name"]) if replace_existing else None
+                if key_block is None:
+                    key_block = mesh_obj.shape_key_add(name=entry["name"], from_mix=False)
+                self._write_keys(mesh_obj, [key_block], basis_co, deltas[None])
+
+                key_block.slider_min = entry.get("slider_min", 0.0)
+                key_block.slider_max = entry.get("slider_max", 1.0)
+                key_block.value = entry.get("value", 0.0)
+                key_block.interpolation = entry.get("interpolation", 'KEY_LINEAR')
+                key_block.mute = entry.get("mute", False)
+                if entry.get("vertex_group") in mesh_obj.vertex_groups:
+                    key_block.vertex_group = entry["vertex_group"]
+
+            return True, f"Imported {len(names)} of {len(header['keys'])} library shape keys"
+        except Exception as e:
+            return False, f"Error importing shape key library: {str(e)}"
+
+# 정점 그룹 마스크를 지원하는 액션 (기존 키를 수정하는 액션)
+MASKABLE_ACTIONS = {'INVERT', 'MIRROR', 'NORMALIZE', 'SMOOTH', 'CLEAN', 'SYMMETRIZE', 'RANDOMIZE', 'FLIP'}
+
+# 대칭 맵을 사용하는 액션
+SYMMETRY_ACTIONS = {'MIRROR', 'SYMMETRIZE', 'DUPLICATE_MIRROR'}
+
+# 청크 단위 모달 실행을 지원하는 액션과 청크 크기 (정점 수)
+CHUNKED_ACTIONS = {
+    'SYMMETRIZE': 65536,
+    'TRANSFER': 4096,
+}
+
+# 타이머 이벤트 한 번에 처리할 최대 시간 (초)
+CHUNK_TIME_BUDGET = 0.05
+
+# 마지막 조정 실행의 대상, 히스토리 단계, 실행 전 데이터 캐시
+_redo_state = {"signature": None, "step": None, "cache": None, "time": 0.0}
+
+# 재실행이 없으면 이 시간 (초) 뒤에 실행 전 데이터 캐시를 해제
+REDO_CACHE_TIMEOUT = 60.0
+REDO_CACHE_CHECK_INTERVAL = 1.0
+
+def _cache_nbytes(cache):
+    return sum(getattr(part, "nbytes", 0)
+               for value in cache.values()
+               for part in (value if isinstance(value, tuple) else (value,)))
+
+def _expire_redo_cache():
+    """bpy.app.timers callback: drop the pre-operation cache once it can no longer be reused
+
+    The cache only helps while the last run is still on top of the history
+    and the user is still tuning it.
+    """
+    if (_redo_state["step"] is not shape_key_history.peek_undo()
+            or time.perf_counter() - _redo_state["time"] > REDO_CACHE_TIMEOUT):
+        _redo_state["cache"] = None
+        return None
+    return REDO_CACHE_CHECK_INTERVAL
+
+def store_redo_state(signature, step, cache, limit_bytes):
+    """Remember the last run for Adjust Last Run, keeping its cache only if it fits the history limit"""
+    if step is None or not cache or _cache_nbytes(cache) > limit_bytes:
+        cache = None
+    _redo_state.update(signature=signature, step=step, cache=cache, time=time.perf_counter())
+    if cache is not None and not bpy.app.timers.is_registered(_expire_redo_cache):
+        bpy.app.timers.register(_expire_redo_cache, first_interval=REDO_CACHE_CHECK_INTERVAL)
+
+def clear_redo_state():
+    """Forget the last run and its cache (add-on unregister)"""
+    if bpy.app.timers.is_registered(_expire_redo_cache):
+        bpy.app.timers.unregister(_expire_redo_cache)
+    _redo_state.update(signature=None, step=None, cache=None, time=0.0)
+
+class SHAPEKEY_PG_key_selection(PropertyGroup):
+    """Shape key entry in the batch selection list"""
+    selected: BoolProperty(
+        name="Selected",
+        description="Include this shape key in the batch",
+        default=False
+    ) # type: ignore
+
+    weight: FloatProperty(
+        name="Weight",
+        description="Weight of this shape key when merging (negative subtracts)",
+        default=1.0,
+        soft_min=-2.0,
+        soft_max=2.0
+    ) # type: ignore
+
+class SHAPEKEY_PG_object_selection(PropertyGroup):
+    """Mesh object entry in a target selection list"""
+    selected: BoolProperty(
+        name="Selected",
+        description="Use this mesh as a target",
+        default=False
+    ) # type: ignore
+
+class OBJECT_OT_shape_key_adjustments(Operator):
+    """Operator to perform shape key adjustments"""    
+    bl_idname = "object.shape_key_adjustments"
+    bl_label = "Shape Key Adjustments"
+    # 전역 undo 대신 변경된 정점만 저장하는 애드온 히스토리 사용
+    bl_options = {'REGISTER'}
+
+    target_mesh: EnumProperty(
+        name="Target Mesh",
+        description="Select mesh with shape keys",
+        items=lambda self, context: [
+            (obj.name, obj.name, "")
+            for obj in context.scene.objects
+            if obj.type == 'MESH' and obj.data.shape_keys
+        ],
+        update=lambda self, context: self.target_mesh_changed()
+    ) # type: ignore
+
+    target_keys: EnumProperty(
+        name="Target Keys",
+        description="Shape keys the action is applied to",
+        items=[
+            ('ACTIVE', "Active", "Only the chosen shape key"),
+            ('SELECTED', "Selected", "Shape keys checked in the list"),
+            ('ALL', "All", "All shape keys except the basis"),
+            ('PATTERN', "Pattern", "Shape keys whose name matches a wildcard pattern")
+        ],
+        default='ACTIVE'
+    ) # type: ignore
+
+    batch_keys: CollectionProperty(
+        type=SHAPEKEY_PG_key_selection
+    ) # type: ignore
+
+    key_pattern: StringProperty(
+        name="Name Pattern",
+        description="Wildcard pattern for shape key names (e.g. mouth*, *_L)",
+        default="*"
+    ) # type: ignore
+
+    shape_key: EnumProperty(
+        name="Shape Key",
+        description="Select shape key to adjust",
+        items=lambda self, context: [
+            (sk.name, sk.name, "")
+            for sk in bpy.data.objects.get(self.target_mesh, None).data.shape_keys.key_blocks[1:]
+        ] if self.target_mesh and bpy.data.objects.get(self.target_mesh).data.shape_keys else []
+    ) # type: ignore
+
+    action: EnumProperty(
+        name="Action",
+        description="Select action for the shape key",
+        items=[
+            ('INVERT', "Invert", "Invert the shape key value"),
+            ('MIRROR', "Mirror", "Mirror the shape key along an axis"),
+            ('NORMALIZE', "Normalize", "Normalize shape key deformation"),
+            ('MERGE', "Merge", "Merge multiple shape keys"),
+            ('SPLIT', "Split", "Split shape key by deformation amount"),
+            ('SPLIT_SIDES', "Split Left/Right", "Split shape key into left and right halves"),
+            ('SMOOTH', "Smooth", "Smooth shape key deformation"),
+            ('TRANSFER', "Transfer", "Transfer to another mesh"),
+            ('CLEAN', "Clean", "Remove tiny deformations"),
+            ('SYMMETRIZE', "Symmetrize", "Make perfectly symmetrical"),
+            ('RANDOMIZE', "Randomize", "Add random variation"),
+            ('FLIP', "Flip", "Flip along axes"),
+            ('DUPLICATE_MIRROR', "Duplicate Mirror", "Create mirrored copy")
+        ],
+        update=lambda self, context: self.prefetch()
+    ) # type: ignore
+
+    backend: EnumProperty(
+        name="Backend",
+        description="Implementation used to compute the adjustment",
+        items=[
+            ('ARRAY', "Array", "Vectorized NumPy backend"),
+            ('REFERENCE', "Reference", "Per-vertex reference loops, for checking results")
+        ],
+        default='ARRAY'
+    ) # type: ignore
+
+    # Mirror options
+    mirror_axis: EnumProperty(
+        name="Mirror Axis",
+        description="Axis to mirror along",
+        items=[
+            ('X', "X Axis", "Mirror along X axis"),
+            ('Y', "Y Axis", "Mirror along Y axis"),
+            ('Z', "Z Axis", "Mirror along Z axis")
+        ],
+        default='X',
+        update=lambda self, context: self.prefetch()
+    ) # type: ignore
+
+    symmetry_tolerance: FloatProperty(
+        name="Symmetry Tolerance",
+        description="Maximum distance between a vertex and its mirrored partner",
+        default=0.0001,
+        min=0.0000001,
+        max=1.0,
+        precision=6
+    ) # type: ignore
+
+    # Symmetry options
+    symmetry_method: EnumProperty(
+        name="Symmetry",
+        description="How mirror partners are found",
+        items=[
+            ('POSITION', "Position", "Pair vertices whose mirrored positions match within the tolerance"),
+            ('TOPOLOGY', "Topology", "Pair vertices by walking the mesh from its centre edge, for asymmetric scans and sculpts"),
+        ],
+        default='POSITION',
+        update=lambda self, context: self.prefetch()
+    ) # type: ignore
+
+    # Merge options
+    shape_keys_to_merge: EnumProperty(
+        name="Shape Keys to Merge",
+        description="Select shape keys to merge",
+        items=lambda self, context: [
+            (sk.name, sk.name, "")
+            for sk in bpy.data.objects.get(self.target_mesh, None).data.shape_keys.key_blocks[1:]
+        ] if self.target_mesh and bpy.data.objects.get(self.target_mesh).data.shape_keys else [],
+        options={'ENUM_FLAG'}
+    ) # type: ignore
+
+    merged_name: StringProperty(
+        name="Merged Name",
+        description="Name for the merged shape key",
+        default="Merged"
+    ) # type: ignore
+
+    # Normalize options
+    normalize_target: FloatProperty(
+        name="Target Length",
+        description="Largest displacement of the shape key after normalizing",
+        default=1.0,
+        min=0.0,
+        soft_max=10.0
+    ) # type: ignore
+
+    # Split options
+    split_threshold: FloatProperty(
+        name="Split Threshold",
+        description="Threshold for splitting shape key",
+        default=0.5,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    ) # type: ignore
+
+    split_falloff: FloatProperty(
+        name="Falloff",
+        description="Width of the smooth blend around the split threshold, 0 for a hard split",
+        default=0.0,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    ) # type: ignore
+
+    split_bands: IntProperty(
+        name="Bands",
+        description="Number of magnitude bands, more than 2 uses evenly spaced thresholds",
+        default=2,
+        min=2,
+        max=10
+    ) # type: ignore
+
+    # Split Left/Right options
+    side_falloff: FloatProperty(
+        name="Center Falloff",
+        description="Width of the blend band around the center line, 0 for a hard split",
+        default=0.0,
+        min=0.0,
+        soft_max=1.0,
+        subtype='DISTANCE'
+    ) # type: ignore
+
+    # Smooth options
+    smooth_strength: FloatProperty(
+        name="Smooth Strength",
+        description="Strength of smoothing effect",
+        default=0.5,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    ) # type: ignore
+
+    smooth_iterations: IntProperty(
+        name="Iterations",
+        description="Number of smoothing passes",
+        default=1,
+        min=1,
+        max=200
+    ) # type: ignore
+
+    smooth_pin_boundary: BoolProperty(
+        name="Pin Boundary",
+        description="Keep vertices on open mesh boundaries in place",
+        default=False
+    ) # type: ignore
+
+    # Transfer options
+    target_transfer_mesh: EnumProperty(
+        name="Target Mesh",
+        description="Select target mesh for transfer",
+        items=lambda self, context: [
+            (obj.name, obj.name, "")
+            for obj in context.scene.objects
+            if obj.type == 'MESH' and obj != context.object
+        ]
+    ) # type: ignore
+
+    # Clean options
+    clean_threshold: FloatProperty(
+        name="Clean Threshold",
+        description="Minimum deformation threshold",
+        default=0.0001,
+        min=0.0,
+        max=1.0,
+        precision=6
+    ) # type: ignore
+
+    # Symmetrize options
+    symmetrize_direction: EnumProperty(
+        name="Symmetrize Direction",
+        description="Direction for symmetrization",
+        items=[
+            ('POSITIVE_X', "X+ to X-", "Positive X to negative X"),
+            ('NEGATIVE_X', "X- to X+", "Negative X to positive X"),
+            ('POSITIVE_Y', "Y+ to Y-", "Positive Y to negative Y"),
+            ('NEGATIVE_Y', "Y- to Y+", "Negative Y to positive Y"),
+            ('POSITIVE_Z', "Z+ to Z-", "Positive Z to negative Z"),
+            ('NEGATIVE_Z', "Z- to Z+", "Negative Z to positive Z")
+        ],
+        default='POSITIVE_X',
+        update=lambda self, context: self.prefetch()
+    ) # type: ignore
+
+    # Randomize options
+    random_strength: FloatProperty(
+        name="Random Strength",
+        description="Strength of random variation",
+        default=0.1,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    ) # type: ignore
+
+    random_seed: IntProperty(
+        name="Seed",
+        description="Seed for the random generator, the same seed gives the same result",
+        default=0,
+        min=0
+    ) # type: ignore
+
+    random_noise_scale: FloatProperty(
+        name="Noise Scale",
+        description="Size of smooth noise features, 0 for independent per-vertex noise",
+        default=0.0,
+        min=0.0,
+        soft_max=1.0,
+        subtype='DISTANCE'
+    ) # type: ignore
+
+    # Mask options
+    mask_vertex_group: StringProperty(
+        name="Vertex Group",
+        description="Limit the effect to this vertex group, weighted by its weights",
+        default=""
+    ) # type: ignore
+
+    # Execution options
+    chunked: BoolProperty(
+        name="Chunked Execution",
+        description="Process in chunks with a progress bar so the UI stays responsive; Esc cancels and rolls back",
+        default=False
+    ) # type: ignore
+
+    adjust_last: BoolProperty(
+        name="Adjust Last Run",
+        description="Re-run the last adjustment of the same keys from its original data with the current settings instead of applying on top of it",
+        default=False,
+        options={'SKIP_SAVE'}
+    ) # type: ignore
+
+    # Flip options
+    flip_axes: EnumProperty(
+        name="Flip Axes",
+        description="Select axes to flip",
+        items=[
+            ('X', "X", "Flip X axis"),
+            ('Y', "Y", "Flip Y axis"),
+            ('Z', "Z", "Flip Z axis")
+        ],
+        options={'ENUM_FLAG'},
+        default={'X'}
+    ) # type: ignore
+
+    def target_mesh_changed(self):
+        self.sync_batch_keys()
+        self.prefetch()
+
+    def prefetch(self):
+        """Start building what the chosen action needs (symmetry map or adjacency) in the background"""
+        mesh_obj = bpy.data.objects.get(self.target_mesh) if self.target_mesh else None
+        if not mesh_obj or mesh_obj.type != 'MESH' or self.backend != 'ARRAY':
+            return
+        # 위치 대칭 맵은 해당 축만, 인접 구조는 스무스에만 필요
+        axes = ()
+        if self.action in SYMMETRY_ACTIONS and self.symmetry_method == 'POSITION':
+            axes = (self.symmetrize_direction[-1],) if self.action == 'SYMMETRIZE' else (self.mirror_axis,)
+        if axes or self.action == 'SMOOTH':
+            shape_key_prefetch.request(mesh_obj, axes, self.symmetry_tolerance, adjacency=self.action == 'SMOOTH')
+
+    def sync_batch_keys(self):
+        """Refill the batch selection list from the target mesh, keeping checked names"""
+        selected = {item.name for item in self.batch_keys if item.selected}
+        weights = {item.name: item.weight for item in self.batch_keys}
+        self.batch_keys.clear()
+
+        mesh_obj = bpy.data.objects.get(self.target_mesh) if self.target_mesh else None
+        if mesh_obj and mesh_obj.data.shape_keys:
+            for key_block in mesh_obj.data.shape_keys.key_blocks[1:]:
+                item = self.batch_keys.add()
+                item.name = key_block.name
+                item.selected = key_block.name in selected
+                item.weight = weights.get(key_block.name, 1.0)
+
+    def get_target_key_names(self, mesh_obj):
+        """Resolve the shape key names the action should run on"""
+        shape_keys = mesh_obj.data.shape_keys
+        key_blocks = shape_keys.key_blocks[1:] if shape_keys else []
+
+        if self.target_keys == 'ALL':
+            return [key_block.name for key_block in key_blocks]
+        if self.target_keys == 'SELECTED':
+            existing = {key_block.name for key_block in key_blocks}
+            return [item.name for item in self.batch_keys if item.selected and item.name in existing]
+        if self.target_keys == 'PATTERN':
+            return [key_block.name for key_block in key_blocks
+                    if fnmatch.fnmatchcase(key_block.name, self.key_pattern)]
+        return [self.shape_key] if self.shape_key else []
+
+    def run_per_key(self, manager, method, mesh_obj, key_names, *args):
+        """Run a per-key action on every target key
+
+        The array backend takes the whole list in one pass; the reference
+        backend is called once per key.
+        """
+        if isinstance(manager, ShapeKeyManager):
+            return method(mesh_obj, key_names if len(key_names) > 1 else key_names[0], *args)
+
+        message = ""
+        for key_name in key_names:
+            success, message = method(mesh_obj, key_name, *args)
+            if not success:
+                return False, message
+        if len(key_names) > 1:
+            message = f"Processed {len(key_names)} shape keys"
+        return True, message
+
+    def redo_signature(self, mesh_obj, key_names):
+        """What must stay the same for a run to count as a re-run of the last one"""
+        return (
+            mesh_obj.data.session_uid,
+            tuple(key_names),
+            tuple(self.shape_keys_to_merge) if self.action == 'MERGE' else (),
+            self.action,
+            self.backend,
+            self.mask_vertex_group if self.action in MASKABLE_ACTIONS else "",
+            self.symmetry_method if self.action in SYMMETRY_ACTIONS else "",
+            self.target_transfer_mesh if self.action == 'TRANSFER' else "",
+        )
+
+    def validation_error(self):
+        """Message for settings the action cannot run with, or None"""
+        if self.action == 'MERGE' and not self.shape_keys_to_merge:
+            return "Please select shape keys to merge"
+        if self.action == 'TRANSFER' and self.target_transfer_mesh not in bpy.data.objects:
+            return "Please select target mesh"
+        if self.action == 'FLIP' and not self.flip_axes:
+            return "Please select at least one axis"
+        return None
+
+    def can_adjust_last(self, mesh_obj, key_names):
+        """True if the last history step is this operator's run on the same keys"""
+        return (_redo_state["step"] is not None
+                and _redo_state["step"] is shape_key_history.peek_undo()
+                and _redo_state["signature"] == self.redo_signature(mesh_obj, key_names))
+
+    def invoke(self, context, event):
+        self.sync_batch_keys()
+        self.prefetch()
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw_symmetry_options(self, box):
+        box.prop(self, "symmetry_method")
+        if self.symmetry_method == 'POSITION':
+            box.prop(self, "symmetry_tolerance")
+            return
+        mesh_obj = bpy.data.objects.get(self.target_mesh) if self.target_mesh else None
+        if mesh_obj and mesh_obj.data.get(shape_key_topology.CENTER_EDGE_PROPERTY, -1) < 0:
+            box.label(text="Set a centre edge in Edit Mode first", icon='ERROR')
+
+    def draw(self, context):
+        layout = self.layout
+        
+        # Shape Key Selection
+        box = layout.box()
+        box.label(text="Shape Key Selection:", icon='SHAPEKEY_DATA')
+        box.prop(self, "target_mesh")
+        if self.target_mesh and self.action != 'MERGE':
+            box.prop(self, "target_keys")
+            if self.target_keys == 'ACTIVE':
+                box.prop(self, "shape_key")
+            elif self.target_keys == 'SELECTED':
+                flow = box.column_flow(columns=3, align=True)
+                for item in self.batch_keys:
+                    flow.prop(item, "selected", text=item.name)
+            elif self.target_keys == 'PATTERN':
+                box.prop(self, "key_pattern")
+        
+        # Action Selection
+        box = layout.box()
+        box.label(text="Action:", icon='MODIFIER')
+        box.prop(self, "action")
+        box.prop(self, "backend")
+        
+        # Action specific options
+        if self.action == 'MIRROR':
+            box = layout.box()
+            box.label(text="Mirror Options:", icon='MOD_MIRROR')
+            box.prop(self, "mirror_axis")
+            self.draw_symmetry_options(box)
+        
+        elif self.action == 'NORMALIZE':
+            box = layout.box()
+            box.label(text="Normalize Options:", icon='NORMALIZE_FCURVES')
+            box.prop(self, "normalize_target")
+        
+        elif self.action == 'MERGE':
+            box = layout.box()
+            box.label(text="Merge Options:", icon='AUTOMERGE_ON')
+            box.prop(self, "shape_keys_to_merge", text="")
+            for item in self.batch_keys:
+                if item.name in self.shape_keys_to_merge:
+                    box.prop(item, "weight", text=item.name)
+            box.prop(self, "merged_name")
+        
+        elif self.action == 'SPLIT':
+            box = layout.box()
+            box.label(text="Split Options:", icon='MOD_EDGESPLIT')
+            box.prop(self, "split_bands")
+            if self.split_bands == 2:
+                box.prop(self, "split_threshold", slider=True)
+            box.prop(self, "split_falloff", slider=True)
+        
+        elif self.action == 'SPLIT_SIDES':
+            box = layout.box()
+            box.label(text="Split Left/Right Options:", icon='MOD_MIRROR')
+            box.prop(self, "mirror_axis")
+            box.prop(self, "side_falloff")
+        
+        elif self.action == 'SMOOTH':
+            box = layout.box()
+            box.label(text="Smooth Options:", icon='MOD_SMOOTH')
+            box.prop(self, "smooth_strength", slider=True)
+            box.prop(self, "smooth_iterations")
+            box.prop(self, "smooth_pin_boundary")
+        
+        elif self.action == 'TRANSFER':
+            box = layout.box()
+            box.label(text="Transfer Options:", icon='TRANSFER_DATA')
+            box.prop(self, "target_transfer_mesh")
+        
+        elif self.action == 'CLEAN':
+            box = layout.box()
+            box.label(text="Clean Options:", icon='BRUSH_DATA')
+            box.prop(self, "clean_threshold", slider=True)
+        
+        elif self.action == 'SYMMETRIZE':
+            box = layout.box()
+            box.label(text="Symmetrize Options:", icon='MOD_MIRROR')
+            box.prop(self, "symmetrize_direction")
+            self.draw_symmetry_options(box)
+        
+        elif self.action == 'RANDOMIZE':
+            box = layout.box()
+            box.label(text="Randomize Options:", icon='MOD_NOISE')
+            box.prop(self, "random_strength", slider=True)
+            box.prop(self, "random_seed")
+            box.prop(self, "random_noise_scale")
+        
+        elif self.action == 'FLIP':
+            box = layout.box()
+            box.label(text="Flip Options:", icon='ARROW_LEFTRIGHT')
+            box.prop(self, "flip_axes")
+        
+        elif self.action == 'DUPLICATE_MIRROR':
+            box = layout.box()
+            box.label(text="Duplicate Mirror Options:", icon='MOD_MIRROR')
+            box.prop(self, "mirror_axis")
+            self.draw_symmetry_options(box)
+
+        # Mask options
+        mesh_obj = bpy.data.objects.get(self.target_mesh) if self.target_mesh else None
+        if mesh_obj and self.action in MASKABLE_ACTIONS:
+            box = layout.box()
+            box.label(text="Mask:", icon='GROUP_VERTEX')
+            box.prop_search(self, "mask_vertex_group", mesh_obj, "vertex_groups")
+
+        if self.action in CHUNKED_ACTIONS and self.backend == 'ARRAY':
+            layout.prop(self, "chunked")
+
+        if mesh_obj and self.can_adjust_last(mesh_obj, self.get_target_key_names(mesh_obj)):
+            layout.prop(self, "adjust_last", icon='RECOVER_LAST')
+
+    def execute(self, context):
+        if not self.target_mesh:
+            self.report({'ERROR'}, "Please select a target mesh")
+            return {'CANCELLED'}
+
+        mesh_obj = bpy.data.objects[self.target_mesh]
+        vertex_group = self.mask_vertex_group if self.action in MASKABLE_ACTIONS else ""
+        if vertex_group and self.backend != 'ARRAY':
+            self.report({'ERROR'}, "Vertex group masks are only available with the Array backend")
+            return {'CANCELLED'}
+        symmetry_method = self.symmetry_method if self.action in SYMMETRY_ACTIONS else 'POSITION'
+        if symmetry_method == 'TOPOLOGY' and self.backend != 'ARRAY':
+            self.report({'ERROR'}, "Topology symmetry is only available with the Array backend")
+            return {'CANCELLED'}
+
+        key_names = self.get_target_key_names(mesh_obj)
+        if self.action != 'MERGE' and not key_names:
+            self.report({'ERROR'}, "No shape keys selected for the action")
+            return {'CANCELLED'}
+
+        # 재실행으로 지난 실행을 되돌리기 전에 모든 설정을 검사
+        error = self.validation_error()
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+
+        # 재실행: 지난 실행을 되돌리고 캐시된 실행 전 데이터와 인접/대칭/마스크를 재사용
+        signature = self.redo_signature(mesh_obj, key_names)
+        cache = {}
+        if self.adjust_last and self.can_adjust_last(mesh_obj, key_names):
+            try:
+                shape_key_history.undo()
+            except ValueError as e:
+                self.report({'ERROR'}, f"Cannot adjust last run: {str(e)}")
+                return {'CANCELLED'}
+            cache = _redo_state["cache"] or {}
+        # 새 실행 동안 이전 캐시를 함께 들고 있지 않도록 해제
+        _redo_state["cache"] = None
+        manager = (ShapeKeyManager(vertex_group, cache, symmetry_method)
+                   if self.backend == 'ARRAY' else ReferenceShapeKeyManager())
+
+        # 제자리 수정 액션만 기존 키를 스냅샷, 새로 생긴 키는 자동으로 감지
+        # 배열 백엔드는 다시 읽지 않고 매니저가 읽은 실행 전 델타를 스냅샷으로 사용
+        tracked_names = key_names if self.action in MASKABLE_ACTIONS else ()
+        recorder = shape_key_history.HistoryRecorder(self.action.replace('_', ' ').title())
+        recorder.track(mesh_obj, tracked_names, deferred=self.backend == 'ARRAY')
+        if self.backend == 'ARRAY':
+            manager.recorder = recorder
+        if self.action == 'TRANSFER' and self.target_transfer_mesh in bpy.data.objects:
+            recorder.track(bpy.data.objects[self.target_transfer_mesh])
+
+        if self.chunked and self.action in CHUNKED_ACTIONS and self.backend == 'ARRAY':
+            return self.start_chunked(context, manager, mesh_obj, key_names, recorder, signature, cache)
+
+        try:
+            if self.action == 'INVERT':
+                success, message = self.run_per_key(manager, manager.invert_shape_key, mesh_obj, key_names)
+            
+            elif self.action == 'MIRROR':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.mirror_shape_key,
+                    mesh_obj,
+                    key_names,
+                    self.mirror_axis,
+                    self.symmetry_tolerance
+                )
+            
+            elif self.action == 'NORMALIZE':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.normalize_shape_key,
+                    mesh_obj,
+                    key_names,
+                    self.normalize_target
+                )
+            
+            elif self.action == 'MERGE':
+                merge_names = list(self.shape_keys_to_merge)
+                weights = {item.name: item.weight for item in self.batch_keys}
+                success, message = manager.merge_shape_keys(
+                    mesh_obj,
+                    merge_names,
+                    self.merged_name,
+                    [weights.get(key_name, 1.0) for key_name in merge_names]
+                )
+            
+            elif self.action == 'SPLIT':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.split_shape_key,
+                    mesh_obj,
+                    key_names,
+                    self.split_threshold,
+                    self.split_falloff,
+                    self.split_bands
+                )
+            
+            elif self.action == 'SPLIT_SIDES':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.split_sides_shape_key,
+                    mesh_obj,
+                    key_names,
+                    self.mirror_axis,
+                    self.side_falloff
+                )
+            
+            elif self.action == 'SMOOTH':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.smooth_shape_key,
+                    mesh_obj,
+                    key_names,
+                    self.smooth_strength,
+                    self.smooth_iterations,
+                    self.smooth_pin_boundary
+                )
+            
+            elif self.action == 'TRANSFER':
+                target_obj = bpy.data.objects[self.target_transfer_mesh]
+                if isinstance(manager, ShapeKeyManager):
+                    # 대응 관계와 소스 델타를 한 번만 준비하는 일괄 전송
+                    success, message, _ = manager.transfer_shape_keys(
+                        mesh_obj,
+                        [target_obj],
+                        key_names,
+                        replace_existing=False
+                    )
+                else:
+                    for key_name in key_names:
+                        success, message = manager.transfer_shape_key(
+                            mesh_obj,
+                            target_obj,
+                            key_name
+                        )
+                        if not success:
+                            break
+                    if success and len(key_names) > 1:
+                        message = f"Transferred {len(key_names)} shape keys to {target_obj.name}"
+            
+            elif self.action == 'CLEAN':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.clean_shape_key,
+                    mesh_obj,
+                    key_names,
+                    self.clean_threshold
+                )
+            
+            elif self.action == 'SYMMETRIZE':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.symmetrize_shape_key,
+                    mesh_obj,
+                    key_names,
+                    self.symmetrize_direction,
+                    self.symmetry_tolerance
+                )
+            
+            elif self.action == 'RANDOMIZE':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.randomize_shape_key,
+                    mesh_obj,
+                    key_names,
+                    self.random_strength,
+                    self.random_seed,
+                    self.random_noise_scale
+                )
+            
+            elif self.action == 'FLIP':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.flip_shape_key,
+                    mesh_obj,
+                    key_names,
+                    list(self.flip_axes)
+                )
+            
+            elif self.action == 'DUPLICATE_MIRROR':
+                success, message = self.run_per_key(
+                    manager,
+                    manager.duplicate_with_mirror,
+                    mesh_obj,
+                    key_names,
+                    self.mirror_axis,
+                    self.symmetry_tolerance
+                )
+            
+            else:
+                success, message = False, "Unknown action"
+
+            if self.backend != 'ARRAY':
+                # 레퍼런스 백엔드는 통계를 갱신하지 않으므로 모두 무효화
+                shape_key_stats.invalidate(mesh_obj.data)
+                if self.action == 'TRANSFER':
+                    shape_key_stats.invalidate(bpy.data.objects[self.target_transfer_mesh].data)
+
+            # 실패해도 일부 기록된 변경은 되돌릴 수 있게 저장
+            limit_bytes = context.window_manager.shape_key_history_limit * 1024 * 1024
+            step = recorder.commit(limit_bytes)
+            store_redo_state(signature, step, cache, limit_bytes)
+
+            if success:
+                self.report({'INFO'}, message)
+                return {'FINISHED'}
+            else:
+                self.report({'ERROR'}, message)
+                return {'CANCELLED'}
+                
+        except Exception as e:
+            self.report({'ERROR'}, f"Operation failed: {str(e)}")
+            return {'CANCELLED'}
+
+    def start_chunked(self, context, manager, mesh_obj, key_names, recorder, signature, cache):
+        """Run the action from a modal timer in chunks instead of blocking execute"""
+        chunk_size = CHUNKED_ACTIONS[self.action]
+        if self.action == 'SYMMETRIZE':
+            self._job = manager.iter_symmetrize_shape_key(
+                mesh_obj, key_names, self.symmetrize_direction, self.symmetry_tolerance, chunk_size
+            )
+            self._vertex_count = len(mesh_obj.data.vertices) * len(key_names)
+        else:
+            target_obj = bpy.data.objects[self.target_transfer_mesh]
+            self._job = manager.iter_transfer_shape_keys(
+                mesh_obj, [target_obj], key_names, False, None, chunk_size
+            )
+            self._vertex_count = len(target_obj.data.vertices) * len(key_names)
+
+        self._recorder = recorder
+        self._signature = signature
+        self._cache = cache
+        self._start_time = time.perf_counter()
+
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        wm = context.window_manager
+
+        if event.type == 'ESC':
+            # 제너레이터를 닫고 이미 기록된 변경이 있으면 되돌림
+            self._job.close()
+            self.stop_chunked(context)
+            try:
+                shape_key_history.rollback(self._recorder)
+            except ValueError as e:
+                self.report({'ERROR'}, f"Cancelled, but rollback failed: {str(e)}")
+                return {'CANCELLED'}
+            self.report({'WARNING'}, "Cancelled, changes rolled back")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        deadline = time.perf_counter() + CHUNK_TIME_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                done, total = next(self._job)
+            except StopIteration as stop:
+                return self.finish_chunked(context, stop.value)
+            wm.progress_update(int(done * 100 / max(total, 1)))
+        return {'RUNNING_MODAL'}
+
+    def finish_chunked(self, context, result):
+        self.stop_chunked(context)
+        success, message = result[:2]
+
+        limit_bytes = context.window_manager.shape_key_history_limit * 1024 * 1024
+        step = self._recorder.commit(limit_bytes)
+        store_redo_state(self._signature, step, self._cache, limit_bytes)
+
+        elapsed = max(time.perf_counter() - self._start_time, 1e-6)
+        if success:
+            self.report({'INFO'}, f"{message} ({self._vertex_count / elapsed:,.0f} vertices/s)")
+            return {'FINISHED'}
+        self.report({'ERROR'}, message)
+        return {'CANCELLED'}
+
+    def stop_chunked(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.window_manager.progress_end()
+
+# 인터랙티브 미리보기의 메쉬 기록 주기 (초)
+PREVIEW_INTERVAL = 1.0 / 30.0
+
+class OBJECT_OT_shape_key_interactive_adjust(Operator):
+    """Drag the mouse to tune smooth, normalize or split on the active shape key with a live preview"""
+    bl_idname = "object.shape_key_interactive_adjust"
+    bl_label = "Interactive Shape Key Adjustment"
+    bl_options = {'REGISTER', 'BLOCKING'}
+
+    action: EnumProperty(
+        name="Action",
+        items=[
+            ('SMOOTH', "Smooth", "Drag to change the smoothing strength, scroll to change iterations"),
+            ('NORMALIZE', "Normalize", "Drag to change the largest displacement"),
+            ('SPLIT', "Split", "Drag to change the split threshold (preview shows the high part)"),
+        ],
+        default='SMOOTH'
+    ) # type: ignore
+
+    value: FloatProperty(
+        name="Value",
+        description="Smooth strength, normalize target length or split threshold",
+        default=0.0,
+        min=0.0,
+        options={'SKIP_SAVE'}
+    ) # type: ignore
+
+    smooth_iterations: IntProperty(
+        name="Iterations",
+        default=1,
+        min=1,
+        max=200
+    ) # type: ignore
+
+    smooth_pin_boundary: BoolProperty(
+        name="Pin Boundary",
+        default=False
+    ) # type: ignore
+
+    split_falloff: FloatProperty(
+        name="Falloff",
+        default=0.0,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return (obj and obj.type == 'MESH' and obj.mode == 'OBJECT'
+                and obj.data.shape_keys and obj.active_shape_key_index > 0)
+
+    def preview_deltas(self):
+        """Result of the action for the current value, computed from the cached original"""
+        if self.action == 'SMOOTH':
+            return self._manager.smoothed_deltas(
+                self._mesh_obj, self._deltas, self.value, self.smooth_iterations, self.smooth_pin_boundary
+            )
+        if self.action == 'NORMALIZE':
+            return shape_key_arrays.normalize_deltas(self._deltas, self.value, self._max_deform)[0]
+        return shape_key_arrays.split_deltas(self._deltas, self.value, self.split_falloff, self._max_deform)[0]
+
+    def write_preview(self, deltas):
+        shape_key_arrays.write_coords(self._key_block.data, self._basis_co + deltas[0])
+        self._mesh_obj.data.update()
+
+    def header_text(self):
+        if self.action == 'SMOOTH':
+            return f"Smooth strength: {self.value:.3f}  iterations: {self.smooth_iterations}  (scroll: iterations, Shift: precise, Esc: cancel)"
+        if self.action == 'NORMALIZE':
+            return f"Normalize target length: {self.value:.4f}  (Shift: precise, Esc: cancel)"
+        return f"Split threshold: {self.value:.3f}  (Shift: precise, Esc: cancel)"
+
+    def invoke(self, context, event):
+        self._mesh_obj = context.active_object
+        self._key_block = self._mesh_obj.active_shape_key
+
+        # 원본 델타와 인접 구조는 한 번만 읽고 캐시에서 재사용
+        self._manager = ShapeKeyManager("", {})
+        _, self._basis_co, self._deltas = self._manager._read_keys(self._mesh_obj, self._key_block.name)
+        self._original_co = self._basis_co + self._deltas[0]
+        # 최대 변위는 한 번만 계산하고 미리보기마다 다시 계산하지 않음
+        self._max_deform = shape_key_arrays.max_delta_length(self._deltas)
+
+        if self.action == 'NORMALIZE':
+            self.value = float(self._max_deform[0])
+            if self.value == 0:
+                self.report({'ERROR'}, "No deformation found in shape key")
+                return {'CANCELLED'}
+        elif self.action == 'SPLIT':
+            self.value = 0.5
+        else:
+            self.value = 0.0
+        self._start_value = self.value
+        self._start_x = event.mouse_x
+        self._dirty = False
+
+        self._recorder = shape_key_history.HistoryRecorder(f"Interactive {self.action.title()}")
+        self._recorder.track(self._mesh_obj, [self._key_block.name], {self._key_block.name: self._original_co})
+
+        self._timer = context.window_manager.event_timer_add(PREVIEW_INTERVAL, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        context.area.header_text_set(self.header_text())
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'MOUSEMOVE':
+            # 정규화는 원래 최대 변위에 비례, 나머지는 0-1 범위
+            scale = self._start_value if self.action == 'NORMALIZE' else 1.0
+            sensitivity = 0.0005 if event.shift else 0.005
+            self.value = max(0.0, self._start_value + (event.mouse_x - self._start_x) * sensitivity * scale)
+            if self.action != 'NORMALIZE':
+                self.value = min(self.value, 1.0)
+            self._dirty = True
+
+        elif self.action == 'SMOOTH' and event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            step = 1 if event.type == 'WHEELUPMOUSE' else -1
+            self.smooth_iterations = max(1, min(200, self.smooth_iterations + step))
+            self._dirty = True
+
+        elif event.type == 'TIMER':
+            # 디스플레이 주기로만 메쉬에 기록
+            if self._dirty:
+                self.write_preview(self.preview_deltas())
+                self._dirty = False
+                context.area.header_text_set(self.header_text())
+
+        elif event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'} and event.value == 'PRESS':
+            return self.finish(context)
+
+        elif event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+            self.write_preview(self._deltas)
+            self.cleanup(context)
+            return {'CANCELLED'}
+
+        return {'RUNNING_MODAL'}
+
+    def finish(self, context):
+        """Commit through the regular manager methods, reusing the cached original"""
+        name = self._key_block.name
+        if self.action == 'SMOOTH':
+            success, message = self._manager.smooth_shape_key(
+                self._mesh_obj, name, self.value, self.smooth_iterations, self.smooth_pin_boundary
+            )
+        elif self.action == 'NORMALIZE':
+            success, message = self._manager.normalize_shape_key(self._mesh_obj, name, self.value)
+        else:
+            # 미리보기로 바뀐 원본 키를 되돌린 뒤 분할
+            self.write_preview(self._deltas)
+            success, message = self._manager.split_shape_key(
+                self._mesh_obj, name, self.value, self.split_falloff
+            )
+
+        self._recorder.commit(context.window_manager.shape_key_history_limit * 1024 * 1024)
+        self.cleanup(context)
+
+        if success:
+            self.report({'INFO'}, message)
+            return {'FINISHED'}
+        self.report({'ERROR'}, message)
+        return {'CANCELLED'}
+
+    def cleanup(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.area.header_text_set(None)
+
+class OBJECT_OT_bulk_transfer_shape_keys(Operator):
+    """Transfer many shape keys from one mesh to several target meshes"""
+    bl_idname = "object.bulk_transfer_shape_keys"
+    bl_label = "Bulk Transfer Shape Keys"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source_mesh: EnumProperty(
+        name="Source Mesh",
+        description="Mesh to copy shape keys from",
+        items=lambda self, context: [
+            (obj.name, obj.name, "")
+            for obj in context.scene.objects
+            if obj.type == 'MESH' and obj.data.shape_keys
+        ],
+        update=lambda self, context: self.sync_targets(context)
+    ) # type: ignore
+
+    targets: CollectionProperty(
+        type=SHAPEKEY_PG_object_selection
+    ) # type: ignore
+
+    key_pattern: StringProperty(
+        name="Name Pattern",
+        description="Wildcard pattern for shape keys to transfer (e.g. mouth*, *_L)",
+        default="*"
+    ) # type: ignore
+
+    replace_existing: BoolProperty(
+        name="Replace Existing",
+        description="Overwrite target shape keys with the same name instead of adding new ones",
+        default=True
+    ) # type: ignore
+
+    skip_threshold: FloatProperty(
+        name="Skip Threshold",
+        description="Skip keys whose transferred deformation stays below this distance on a target",
+        default=0.000001,
+        min=0.0,
+        max=1.0,
+        precision=6
+    ) # type: ignore
+
+    def sync_targets(self, context):
+        """Refill the target list, pre-checking meshes selected in the viewport"""
+        checked = {item.name for item in self.targets if item.selected}
+        self.targets.clear()
+        for obj in context.scene.objects:
+            if obj.type == 'MESH' and obj.name != self.source_mesh:
+                item = self.targets.add()
+                item.name = obj.name
+                item.selected = obj.name in checked or obj.select_get()
+
+    def invoke(self, context, event):
+        if context.active_object and context.active_object.type == 'MESH' and context.active_object.data.shape_keys:
+            self.source_mesh = context.active_object.name
+        self.sync_targets(context)
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        box.label(text="Source:", icon='SHAPEKEY_DATA')
+        box.prop(self, "source_mesh")
+        box.prop(self, "key_pattern")
+
+        box = layout.box()
+        box.label(text="Targets:", icon='MESH_DATA')
+        flow = box.column_flow(columns=2, align=True)
+        for item in self.targets:
+            flow.prop(item, "selected", text=item.name)
+
+        box = layout.box()
+        box.prop(self, "replace_existing")
+        box.prop(self, "skip_threshold")
+
+    def execute(self, context):
+        source_obj = bpy.data.objects.get(self.source_mesh) if self.source_mesh else None
+        if not source_obj or not source_obj.data.shape_keys:
+            self.report({'ERROR'}, "Please select a source mesh with shape keys")
+            return {'CANCELLED'}
+
+        target_objs = [bpy.data.objects[item.name] for item in self.targets
+                       if item.selected and item.name in bpy.data.objects]
+        if not target_objs:
+            self.report({'ERROR'}, "Please select at least one target mesh")
+            return {'CANCELLED'}
+
+        key_names = [key_block.name for key_block in source_obj.data.shape_keys.key_blocks[1:]
+                     if fnmatch.fnmatchcase(key_block.name, self.key_pattern)]
+        if not key_names:
+            self.report({'ERROR'}, "No shape keys match the pattern")
+            return {'CANCELLED'}
+
+        success, message, _ = ShapeKeyManager().transfer_shape_keys(
+            source_obj,
+            target_objs,
+            key_names,
+            self.replace_existing,
+            self.skip_threshold
+        )
+
+        if success:
+            self.report({'INFO'}, message)
+            return {'FINISHED'}
+        self.report({'ERROR'}, message)
+        return {'CANCELLED'}
+
+class OBJECT_OT_refresh_shape_key_stats(Operator):
+    """Recompute displacement statistics of every shape key of the mesh"""
+    bl_idname = "object.refresh_shape_key_stats"
+    bl_label = "Refresh Shape Key Statistics"
+    bl_options = {'REGISTER'}
+
+    mesh_name: StringProperty() # type: ignore
+
+    def execute(self, context):
+        mesh_obj = bpy.data.objects.get(self.mesh_name) or context.active_object
+        if not mesh_obj or mesh_obj.type != 'MESH' or not mesh_obj.data.shape_keys:
+            self.report({'ERROR'}, "Please select a mesh with shape keys")
+            return {'CANCELLED'}
+
+        shape_key_stats.invalidate(mesh_obj.data)
+        stats = shape_key_stats.get_stats(mesh_obj)
+
+        self.report({'INFO'}, f"Computed statistics for {len(stats)} shape keys")
+        return {'FINISHED'}
+
+class OBJECT_OT_find_duplicate_shape_keys(Operator):
+    """Find nearly identical shape keys and merge or remove them"""
+    bl_idname = "object.find_duplicate_shape_keys"
+    bl_label = "Find Duplicate Shape Keys"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    tolerance: FloatProperty(
+        name="Tolerance",
+        description="Largest difference between two keys, relative to their size, still counted as a duplicate",
+        default=0.01,
+        min=0.0,
+        max=0.5,
+        precision=4
+    ) # type: ignore
+
+    resolve: EnumProperty(
+        name="Resolve",
+        items=[
+            ('REPORT', "Report Only", "List the duplicate groups without changing anything"),
+            ('MERGE', "Merge", "Replace the first key of each group by the group average and remove the others"),
+            ('REMOVE', "Remove", "Keep the first key of each group and remove the others"),
+        ],
+        default='REPORT'
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=300)
+
+    def execute(self, context):
+        success, message, _ = ShapeKeyManager().find_duplicate_shape_keys(
+            context.active_object,
+            self.tolerance,
+            self.resolve
+        )
+
+        if success:
+            self.report({'INFO'}, message)
+            return {'FINISHED'}
+        self.report({'ERROR'}, message)
+        return {'CANCELLED'}
+
+class OBJECT_OT_clean_all_shape_keys(Operator):
+    """Clean every shape key of the chosen meshes and report reclaimable memory"""
+    bl_idname = "object.clean_all_shape_keys"
+    bl_label = "Clean All Shape Keys"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: EnumProperty(
+        name="Scope",
+        items=[
+            ('ACTIVE', "Active Mesh", "Clean the active mesh only"),
+            ('SELECTED', "Selected Meshes", "Clean all selected meshes"),
+            ('SCENE', "Scene", "Clean every mesh in the scene"),
+        ],
+        default='SELECTED'
+    ) # type: ignore
+
+    threshold: FloatProperty(
+        name="Threshold",
+        description="Snap vertices that move less than this distance back to the basis",
+        default=0.0001,
+        min=0.0,
+        max=1.0,
+        precision=6
+    ) # type: ignore
+
+    remove_empty: BoolProperty(
+        name="Remove Empty Keys",
+        description="Remove shape keys that have no displacement left after cleaning",
+        default=False
+    ) # type: ignore
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=300)
+
+    def execute(self, context):
+        if self.scope == 'ACTIVE':
+            mesh_objs = [context.active_object] if context.active_object else []
+        elif self.scope == 'SELECTED':
+            mesh_objs = context.selected_objects
+        else:
+            mesh_objs = context.scene.objects
+        mesh_objs = [obj for obj in mesh_objs if obj.type == 'MESH' and obj.data.shape_keys]
+        if not mesh_objs:
+            self.report({'ERROR'}, "No meshes with shape keys found")
+            return {'CANCELLED'}
+
+        success, message = ShapeKeyManager().clean_all_shape_keys(mesh_objs, self.threshold, self.remove_empty)
+
+        if success:
+            self.report({'INFO'}, message)
+            return {'FINISHED'}
+        self.report({'ERROR'}, message)
+        return {'CANCELLED'}
+
+class OBJECT_OT_export_shape_key_library(Operator, ExportHelper):
+    """Export the active mesh's shape keys as a shape key library file"""
+    bl_idname = "object.export_shape_key_library"
+    bl_label = "Export Shape Key Library"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".skclib"
+
+    filter_glob: StringProperty(
+        default="*.skclib",
+        options={'HIDDEN'}
+    ) # type: ignore
+
+    key_pattern: StringProperty(
+        name="Name Pattern",
+        description="Wildcard pattern for shape keys to export (e.g. mouth*, *_L)",
+        default="*"
+    ) # type: ignore
+
+    precision: EnumProperty(
+        name="Precision",
+        items=[
+            ('FLOAT32', "Float32", "Store deltas at full precision"),
+            ('FLOAT16', "Float16", "Store deltas at half precision, halving the file size"),
+        ],
+        default='FLOAT32'
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys
+
+    def execute(self, context):
+        mesh_obj = context.active_object
+        key_names = [key_block.name for key_block in mesh_obj.data.shape_keys.key_blocks[1:]
+                     if fnmatch.fnmatchcase(key_block.name, self.key_pattern)]
+        if not key_names:
+            self.report({'ERROR'}, "No shape keys match the pattern")
+            return {'CANCELLED'}
+
+        success, message = ShapeKeyManager().export_shape_key_library(
+            mesh_obj, self.filepath, key_names, self.precision
+        )
+
+        if success:
+            self.report({'INFO'}, message)
+            return {'FINISHED'}
+        self.report({'ERROR'}, message)
+        return {'CANCELLED'}
+
+class OBJECT_OT_import_shape_key_library(Operator, ImportHelper):
+    """Import shape keys from a shape key library file onto the active mesh"""
+    bl_idname = "object.import_shape_key_library"
+    bl_label = "Import Shape Key Library"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".skclib"
+
+    filter_glob: StringProperty(
+        default="*.skclib",
+        options={'HIDDEN'}
+    ) # type: ignore
+
+    key_pattern: StringProperty(
+        name="Name Pattern",
+        description="Wildcard pattern for library shape keys to import (e.g. mouth*, *_L)",
+        default="*"
+    ) # type: ignore
+
+    replace_existing: BoolProperty(
+        name="Replace Existing",
+        description="Overwrite shape keys with the same name instead of adding new ones",
+        default=True
+    ) # type: ignore
+
+    ignore_topology: BoolProperty(
+        name="Ignore Topology",
+        description="Import even if the edges differ from the exported mesh, as long as the vertex count matches",
+        default=False
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH'
+
+    def execute(self, context):
+        success, message = ShapeKeyManager().import_shape_key_library(
+            context.active_object,
+            self.filepath,
+            self.key_pattern,
+            self.replace_existing,
+            self.ignore_topology
+        )
+
+        if success:
+            self.report({'INFO'}, message)
+            return {'FINISHED'}
+        self.report({'ERROR'}, message)
+        return {'CANCELLED'}
+
+class OBJECT_OT_shape_key_history_undo(Operator):
+    """Revert the last shape key adjustment from the add-on history"""
+    bl_idname = "object.shape_key_history_undo"
+    bl_label = "Undo Shape Key Adjustment"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return shape_key_history.peek_undo() is not None
+
+    def execute(self, context):
+        try:
+            step = shape_key_history.undo()
+        except ValueError as e:
+            self.report({'ERROR'}, f"Cannot undo: {str(e)}. Shape key history cleared")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Undid {step.label}")
+        return {'FINISHED'}
+
+class OBJECT_OT_shape_key_history_redo(Operator):
+    """Re-apply the last undone shape key adjustment"""
+    bl_idname = "object.shape_key_history_redo"
+    bl_label = "Redo Shape Key Adjustment"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return shape_key_history.peek_redo() is not None
+
+    def execute(self, context):
+        try:
+            step = shape_key_history.redo()
+        except ValueError as e:
+            self.report({'ERROR'}, f"Cannot redo: {str(e)}. Shape key history cleared")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Redid {step.label}")
+        return {'FINISHED'}
+
+class MESH_OT_set_symmetry_center_edge(Operator):
+    """Use the selected edge as the centre line for topology symmetry"""
+    bl_idname = "mesh.set_symmetry_center_edge"
+    bl_label = "Set Symmetry Centre Edge"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and context.mode == 'EDIT_MESH'
+
+    def execute(self, context):
+        obj = context.active_object
+        obj.update_from_editmode()
+        mesh = obj.data
+
+        selected = np.zeros(len(mesh.edges), dtype=bool)
+        mesh.edges.foreach_get("select", selected)
+        edges = np.nonzero(selected)[0]
+        if len(edges) != 1:
+            self.report({'ERROR'}, "Select exactly one edge on the centre line")
+            return {'CANCELLED'}
+
+        try:
+            mirror_map, conflicts = shape_key_topology.get_cached_topology_map(mesh, int(edges[0]))
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        mesh[shape_key_topology.CENTER_EDGE_PROPERTY] = int(edges[0])
+
+        unmatched = int(np.count_nonzero(mirror_map < 0))
+        message = f"Centre edge set, {len(mirror_map) - unmatched} vertices paired"
+        if unmatched:
+            message += f" ({unmatched} without a partner)"
+        if conflicts:
+            message += f", {conflicts} with conflicting partners. Check that the topology is symmetric"
+            self.report({'WARNING'}, message)
+            return {'FINISHED'}
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+class OBJECT_OT_create_corrective_shape_key(Operator):
+    """Capture a sculpted or evaluated pose as a corrective key for a combination of shape keys"""
+    bl_idname = "object.create_corrective_shape_key"
+    bl_label = "Create Corrective Shape Key"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    driving_keys: CollectionProperty(
+        type=SHAPEKEY_PG_key_selection
+    ) # type: ignore
+
+    target_source: EnumProperty(
+        name="Target",
+        description="Where the corrected shape is taken from",
+        items=[
+            ('SHAPE_KEY', "Shape Key", "A shape key sculpted as the full corrected pose"),
+            ('EVALUATED', "Evaluated Pose", "The current pose with shape keys, modifiers and armature evaluated"),
+            ('OBJECT', "Object", "Another mesh with the same vertex count"),
+        ],
+        default='SHAPE_KEY'
+    ) # type: ignore
+
+    target_key: EnumProperty(
+        name="Target Shape Key",
+        description="Sculpted shape key holding the corrected pose",
+        items=lambda self, context: [
+            (key_block.name, key_block.name, "")
+            for key_block in context.active_object.data.shape_keys.key_blocks[1:]
+        ] if context.active_object and context.active_object.type == 'MESH' and context.active_object.data.shape_keys else []
+    ) # type: ignore
+
+    target_object: EnumProperty(
+        name="Target Object",
+        description="Mesh holding the corrected pose",
+        items=lambda self, context: [
+            (obj.name, obj.name, "")
+            for obj in context.scene.objects
+            if obj.type == 'MESH' and obj != context.active_object
+            and len(obj.data.vertices) == len(context.active_object.data.vertices)
+        ]
+    ) # type: ignore
+
+    new_name: StringProperty(
+        name="Name",
+        description="Name of the corrective key, empty joins the driving key names",
+        default=""
+    ) # type: ignore
+
+    threshold: FloatProperty(
+        name="Threshold",
+        description="Ignore corrections smaller than this distance",
+        default=0.00001,
+        min=0.0,
+        max=1.0,
+        precision=6
+    ) # type: ignore
+
+    add_driver: BoolProperty(
+        name="Add Driver",
+        description="Drive the corrective by the product of the driving key values",
+        default=True
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys and context.mode == 'OBJECT'
+
+    def invoke(self, context, event):
+        mesh_obj = context.active_object
+        key_blocks = mesh_obj.data.shape_keys.key_blocks
+
+        # 현재 포즈에서 켜져 있는 키를 조합으로 미리 선택
+        self.driving_keys.clear()
+        for key_block in key_blocks[1:]:
+            item = self.driving_keys.add()
+            item.name = key_block.name
+            item.selected = key_block.value > 0 and not key_block.mute
+            item.weight = key_block.value if item.selected else 1.0
+
+        active_key = mesh_obj.active_shape_key
+        if active_key and active_key != key_blocks[0] and active_key.value <= 0:
+            self.target_key = active_key.name
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        box.label(text="Driving Keys:", icon='SHAPEKEY_DATA')
+        for item in self.driving_keys:
+            if self.target_source == 'SHAPE_KEY' and item.name == self.target_key:
+                continue
+            row = box.row(align=True)
+            row.prop(item, "selected", text=item.name)
+            sub = row.row(align=True)
+            sub.active = item.selected
+            sub.prop(item, "weight", text="")
+
+        box = layout.box()
+        box.prop(self, "target_source")
+        if self.target_source == 'SHAPE_KEY':
+            box.prop(self, "target_key")
+        elif self.target_source == 'OBJECT':
+            box.prop(self, "target_object")
+
+        box = layout.box()
+        box.prop(self, "new_name")
+        box.prop(self, "threshold")
+        box.prop(self, "add_driver")
+
+    def read_target(self, context, mesh_obj, driving):
+        """Target coordinates of the corrected pose, or None if the source is missing
+
+        The evaluated pose is read with the driving keys set to their
+        weights, so it matches the combination the corrective is relative to.
+
+        Raises:
+            ValueError: If a driving key does not evaluate to its weight
+        """
+        if self.target_source == 'SHAPE_KEY':
+            key_block = mesh_obj.data.shape_keys.key_blocks.get(self.target_key)
+            return shape_key_arrays.read_coords(key_block.data) if key_block else None
+        if self.target_source == 'OBJECT':
+            target_obj = bpy.data.objects.get(self.target_object) if self.target_object else None
+            return shape_key_arrays.read_coords(target_obj.data.vertices) if target_obj else None
+
+        shape_keys = mesh_obj.data.shape_keys
+        original = {name: shape_keys.key_blocks[name].value for name, _ in driving}
+        try:
+            for name, weight in driving:
+                shape_keys.key_blocks[name].value = weight
+            depsgraph = context.evaluated_depsgraph_get()
+            depsgraph.update()
+
+            # 드라이버/애니메이션이나 슬라이더 범위 때문에 값이 다르면 잘못된 보정이 됨
+            evaluated = shape_keys.evaluated_get(depsgraph).key_blocks
+            for name, weight in driving:
+                if abs(evaluated[name].value - weight) > 1e-4:
+                    raise ValueError(f"{name} evaluates to {evaluated[name].value:.3f} instead of {weight:.3f}. "
+                                     f"Check its driver, animation or slider range")
+            return shape_key_arrays.read_evaluated_coords(mesh_obj, depsgraph)
+        finally:
+            for name, value in original.items():
+                shape_keys.key_blocks[name].value = value
+
+    def execute(self, context):
+        mesh_obj = context.active_object
+        key_blocks = mesh_obj.data.shape_keys.key_blocks
+
+        driving = [(item.name, item.weight) for item in self.driving_keys
+                   if item.selected and item.name in key_blocks
+                   and not (self.target_source == 'SHAPE_KEY' and item.name == self.target_key)]
+        if not driving:
+            self.report({'ERROR'}, "Please select at least one driving shape key")
+            return {'CANCELLED'}
+        if any(abs(weight) < 1e-6 for _, weight in driving):
+            self.report({'ERROR'}, "Driving key weights must not be zero")
+            return {'CANCELLED'}
+        names = [name for name, _ in driving]
+        weights = [weight for _, weight in driving]
+
+        try:
+            target_co = self.read_target(context, mesh_obj, driving)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if target_co is None:
+            self.report({'ERROR'}, "Please choose a target for the corrected pose")
+            return {'CANCELLED'}
+
+        # 드라이버도 함께 되돌려야 하므로 애드온 히스토리가 아닌 Blender 실행 취소만 사용
+        success, message, corrective_name = ShapeKeyManager().create_corrective_shape_key(
+            mesh_obj, names, weights, target_co, self.new_name, self.threshold
+        )
+        if not success:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+        if self.add_driver:
+            driver_ok, error = utils.setup_corrective_driver(key_blocks[corrective_name], names, weights)
+            if not driver_ok:
+                message += f" (driver not created: {error})"
+
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+class OBJECT_OT_bake_pose_to_shape_key(Operator):
+    """Store the evaluated pose (shape keys, modifiers and armature) as new shape keys"""
+    bl_idname = "object.bake_pose_to_shape_key"
+    bl_label = "Bake Pose to Shape Key"
+    # 애드온 히스토리에 기록하므로 Blender 전역 실행 취소 단계는 만들지 않음
+    bl_options = {'REGISTER'}
+
+    new_name: StringProperty(
+        name="Name",
+        description="Name of the baked key, frame numbers are appended for a frame range",
+        default="Pose"
+    ) # type: ignore
+
+    use_frame_range: BoolProperty(
+        name="Frame Range",
+        description="Bake one numbered key per frame instead of only the current pose",
+        default=False
+    ) # type: ignore
+
+    frame_start: IntProperty(
+        name="Start",
+        description="First frame to bake",
+        default=1
+    ) # type: ignore
+
+    frame_end: IntProperty(
+        name="End",
+        description="Last frame to bake",
+        default=250
+    ) # type: ignore
+
+    frame_step: IntProperty(
+        name="Step",
+        description="Bake every n-th frame",
+        default=1,
+        min=1
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and context.mode == 'OBJECT'
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self, width=300)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "new_name")
+        layout.prop(self, "use_frame_range")
+        if self.use_frame_range:
+            col = layout.column(align=True)
+            col.prop(self, "frame_start")
+            col.prop(self, "frame_end")
+            col.prop(self, "frame_step")
+
+    def execute(self, context):
+        scene = context.scene
+        wm = context.window_manager
+        mesh_obj = context.active_object
+
+        if self.use_frame_range:
+            frames = list(range(self.frame_start, self.frame_end + 1, self.frame_step))
+            if not frames:
+                self.report({'ERROR'}, "End frame must not be before the start frame")
+                return {'CANCELLED'}
+        else:
+            frames = [None]
+
+        # Basis는 기록 밖에서 생성 (기준 키 삭제는 메쉬 좌표를 바꾸므로)
+        if not mesh_obj.data.shape_keys:
+            mesh_obj.shape_key_add(name="Basis", from_mix=False)
+
+        def poses():
+            for i, frame in enumerate(frames):
+                wm.progress_update(i)
+                if frame is None:
+                    name = self.new_name
+                else:
+                    scene.frame_set(frame)
+                    name = f"{self.new_name}_{frame:04d}"
+                yield name, shape_key_arrays.read_evaluated_coords(mesh_obj, context.evaluated_depsgraph_get())
+
+        recorder = shape_key_history.HistoryRecorder("Bake Pose")
+        recorder.track(mesh_obj)
+        original_frame = scene.frame_current
+        wm.progress_begin(0, len(frames))
+        try:
+            success, message, _ = ShapeKeyManager().bake_pose_shape_keys(mesh_obj, poses())
+        finally:
+            if self.use_frame_range:
+                scene.frame_set(original_frame)
+            wm.progress_end()
+
+        if not success:
+            # 일부 프레임만 구운 키는 남기지 않음
+            shape_key_history.rollback(recorder)
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+        recorder.commit(wm.shape_key_history_limit * 1024 * 1024)
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
 
 classes = (
+    SHAPEKEY_PG_key_selection,
+    SHAPEKEY_PG_object_selection,
     OBJECT_OT_shape_key_adjustments,
+    OBJECT_OT_shape_key_interactive_adjust,
+    OBJECT_OT_bulk_transfer_shape_keys,
+    OBJECT_OT_refresh_shape_key_stats,
+    OBJECT_OT_find_duplicate_shape_keys,
+    OBJECT_OT_clean_all_shape_keys,
+    OBJECT_OT_export_shape_key_library,
+    OBJECT_OT_import_shape_key_library,
+    OBJECT_OT_shape_key_history_undo,
+    OBJECT_OT_shape_key_history_redo,
+    MESH_OT_set_symmetry_center_edge,
+    OBJECT_OT_create_corrective_shape_key,
+    OBJECT_OT_bake_pose_to_shape_key,
 )
@@ -227,6 +227,227 @@ ko_KR = {
     ("*", "Show confirmation dialog"): "확인 대화상자 표시",
     ("*", "Name of the new bone (editable)"): "새 본의 이름 (수정 가능)",
     ("*", "Suggested name based on shape key"): "쉐이프 키 기반 추천 이름",
+    
+    # Shape key adjustment tools
+    ("*", "Shape Key Statistics"): "쉐이프 키 통계",
+    ("*", "Show Shape Key Statistics"): "쉐이프 키 통계 표시",
+    ("*", "Show displacement statistics of the active mesh's shape keys"): "활성 메쉬의 쉐이프 키 변위 통계 표시",
+    ("*", "Refresh Shape Key Statistics"): "쉐이프 키 통계 새로고침",
+    ("*", "Press refresh to compute statistics"): "새로고침을 눌러 통계를 계산하세요",
+    ("*", "Sort By"): "정렬 기준",
+    ("*", "Column used to order the shape key statistics"): "쉐이프 키 통계를 정렬할 열",
+    ("*", "Descending"): "내림차순",
+    ("*", "Sort the shape key statistics in descending order"): "쉐이프 키 통계를 내림차순으로 정렬",
+    ("*", "Sort by shape key name"): "쉐이프 키 이름으로 정렬",
+    ("*", "Max"): "최대",
+    ("*", "Sort by maximum displacement"): "최대 변위로 정렬",
+    ("*", "Mean"): "평균",
+    ("*", "Sort by mean displacement of affected vertices"): "영향받는 정점의 평균 변위로 정렬",
+    ("*", "Affected"): "영향받는 정점",
+    ("*", "Sort by number of affected vertices"): "영향받는 정점 수로 정렬",
+    ("*", "History Memory Limit"): "히스토리 메모리 제한",
+    ("*", "Memory in MB the shape key adjustment history may use before dropping the oldest steps"): "가장 오래된 단계를 버리기 전까지 쉐이프 키 조정 히스토리가 사용할 수 있는 메모리 (MB)",
+    ("*", "MB"): "MB",
+    ("*", "Undo Shape Key Adjustment"): "쉐이프 키 조정 실행 취소",
+    ("*", "Redo Shape Key Adjustment"): "쉐이프 키 조정 다시 실행",
+    ("*", "Cancelled, changes rolled back"): "취소됨, 변경 사항이 되돌려졌습니다",
+    ("*", "Shape Key Adjustments"): "쉐이프 키 조정",
+    ("*", "Shape Key Selection:"): "쉐이프 키 선택:",
+    ("*", "Action:"): "작업:",
+    ("*", "Action"): "작업",
+    ("*", "Target Keys"): "대상 키",
+    ("*", "Shape keys the action is applied to"): "작업을 적용할 쉐이프 키",
+    ("*", "Active"): "활성",
+    ("*", "Only the chosen shape key"): "선택한 쉐이프 키만",
+    ("*", "Selected"): "선택됨",
+    ("*", "Shape keys checked in the list"): "목록에서 체크된 쉐이프 키",
+    ("*", "All"): "전체",
+    ("*", "All shape keys except the basis"): "베이스를 제외한 모든 쉐이프 키",
+    ("*", "Pattern"): "패턴",
+    ("*", "Shape keys whose name matches a wildcard pattern"): "이름이 와일드카드 패턴과 일치하는 쉐이프 키",
+    ("*", "Name Pattern"): "이름 패턴",
+    ("*", "Wildcard pattern for shape key names (e.g. mouth*, *_L)"): "쉐이프 키 이름의 와일드카드 패턴 (예: mouth*, *_L)",
+    ("*", "Include this shape key in the batch"): "이 쉐이프 키를 일괄 작업에 포함",
+    ("*", "Weight"): "가중치",
+    ("*", "Weight of this shape key when merging (negative subtracts)"): "병합 시 이 쉐이프 키의 가중치 (음수는 빼기)",
+    ("*", "Use this mesh as a target"): "이 메쉬를 대상으로 사용",
+    ("*", "Merged"): "병합됨",
+    ("*", "Basis"): "베이스",
+    ("*", "Backend"): "백엔드",
+    ("*", "Implementation used to compute the adjustment"): "조정을 계산하는 데 사용할 구현",
+    ("*", "Array"): "배열",
+    ("*", "Vectorized NumPy backend"): "벡터화된 NumPy 백엔드",
+    ("*", "Reference"): "레퍼런스",
+    ("*", "Per-vertex reference loops, for checking results"): "결과 확인용 정점별 레퍼런스 루프",
+    ("*", "Axis to mirror along"): "대칭할 축",
+    ("*", "X Axis"): "X 축",
+    ("*", "Mirror along X axis"): "X 축을 따라 대칭",
+    ("*", "Y Axis"): "Y 축",
+    ("*", "Mirror along Y axis"): "Y 축을 따라 대칭",
+    ("*", "Z Axis"): "Z 축",
+    ("*", "Mirror along Z axis"): "Z 축을 따라 대칭",
+    ("*", "Symmetry Tolerance"): "대칭 허용 오차",
+    ("*", "Maximum distance between a vertex and its mirrored partner"): "정점과 대칭 정점 사이의 최대 거리",
+    ("*", "Symmetry"): "대칭",
+    ("*", "How mirror partners are found"): "대칭 정점을 찾는 방법",
+    ("*", "Position"): "위치",
+    ("*", "Pair vertices whose mirrored positions match within the tolerance"): "대칭 위치가 허용 오차 내에서 일치하는 정점끼리 짝지음",
+    ("*", "Topology"): "토폴로지",
+    ("*", "Pair vertices by walking the mesh from its centre edge, for asymmetric scans and sculpts"): "중심 엣지에서 메쉬를 따라가며 정점을 짝지음 (비대칭 스캔과 스컬프트용)",
+    ("*", "Set Symmetry Centre Edge"): "대칭 중심 엣지 설정",
+    ("*", "Set a centre edge in Edit Mode first"): "먼저 에딧 모드에서 중심 엣지를 설정하세요",
+    ("*", "Select exactly one edge on the centre line"): "중심선 위의 엣지를 정확히 하나 선택하세요",
+    ("*", "Topology symmetry is only available with the Array backend"): "토폴로지 대칭은 배열 백엔드에서만 사용할 수 있습니다",
+    ("*", "Select shape keys to merge"): "병합할 쉐이프 키 선택",
+    ("*", "Name for the merged shape key"): "병합된 쉐이프 키의 이름",
+    ("*", "Target Length"): "목표 길이",
+    ("*", "Largest displacement of the shape key after normalizing"): "정규화 후 쉐이프 키의 최대 변위",
+    ("*", "Threshold for splitting shape key"): "쉐이프 키 분할 임계값",
+    ("*", "Falloff"): "감쇠",
+    ("*", "Width of the smooth blend around the split threshold, 0 for a hard split"): "분할 임계값 주변의 부드러운 블렌드 폭, 0이면 딱 잘라 분할",
+    ("*", "Bands"): "구간 수",
+    ("*", "Number of magnitude bands, more than 2 uses evenly spaced thresholds"): "변형량 구간 수, 2보다 크면 균등한 간격의 임계값 사용",
+    ("*", "Split Left/Right"): "좌/우 분할",
+    ("*", "Split shape key into left and right halves"): "쉐이프 키를 왼쪽과 오른쪽 절반으로 분할",
+    ("*", "Center Falloff"): "중심 감쇠",
+    ("*", "Width of the blend band around the center line, 0 for a hard split"): "중심선 주변 블렌드 영역의 폭, 0이면 딱 잘라 분할",
+    ("*", "Strength of smoothing effect"): "스무딩 효과의 강도",
+    ("*", "Iterations"): "반복 횟수",
+    ("*", "Number of smoothing passes"): "스무딩 반복 횟수",
+    ("*", "Pin Boundary"): "경계 고정",
+    ("*", "Keep vertices on open mesh boundaries in place"): "열린 메쉬 경계의 정점을 제자리에 유지",
+    ("*", "Select target mesh for transfer"): "전송할 대상 메쉬 선택",
+    ("*", "Minimum deformation threshold"): "최소 변형 임계값",
+    ("*", "Symmetrize Direction"): "대칭화 방향",
+    ("*", "Direction for symmetrization"): "대칭화 방향",
+    ("*", "X+ to X-"): "X+ → X-",
+    ("*", "Positive X to negative X"): "양의 X에서 음의 X로",
+    ("*", "X- to X+"): "X- → X+",
+    ("*", "Negative X to positive X"): "음의 X에서 양의 X로",
+    ("*", "Y+ to Y-"): "Y+ → Y-",
+    ("*", "Positive Y to negative Y"): "양의 Y에서 음의 Y로",
+    ("*", "Y- to Y+"): "Y- → Y+",
+    ("*", "Negative Y to positive Y"): "음의 Y에서 양의 Y로",
+    ("*", "Z+ to Z-"): "Z+ → Z-",
+    ("*", "Positive Z to negative Z"): "양의 Z에서 음의 Z로",
+    ("*", "Z- to Z+"): "Z- → Z+",
+    ("*", "Negative Z to positive Z"): "음의 Z에서 양의 Z로",
+    ("*", "Strength of random variation"): "무작위 변화의 강도",
+    ("*", "Seed"): "시드",
+    ("*", "Seed for the random generator, the same seed gives the same result"): "난수 생성기의 시드, 같은 시드는 같은 결과를 냄",
+    ("*", "Noise Scale"): "노이즈 크기",
+    ("*", "Size of smooth noise features, 0 for independent per-vertex noise"): "부드러운 노이즈 패턴의 크기, 0이면 정점마다 독립적인 노이즈",
+    ("*", "Vertex Group"): "버텍스 그룹",
+    ("*", "Limit the effect to this vertex group, weighted by its weights"): "효과를 이 버텍스 그룹으로 제한하고 그룹 가중치를 적용",
+    ("*", "Vertex group masks are only available with the Array backend"): "버텍스 그룹 마스크는 배열 백엔드에서만 사용할 수 있습니다",
+    ("*", "Mask:"): "마스크:",
+    ("*", "Chunked Execution"): "분할 실행",
+    ("*", "Process in chunks with a progress bar so the UI stays responsive; Esc cancels and rolls back"): "진행 표시줄과 함께 나눠서 처리하여 UI가 멈추지 않게 함; Esc로 취소하고 되돌림",
+    ("*", "Adjust Last Run"): "마지막 실행 조정",
+    ("*", "Re-run the last adjustment of the same keys from its original data with the current settings instead of applying on top of it"): "같은 키의 마지막 조정을 덧적용하지 않고 원래 데이터에서 현재 설정으로 다시 실행",
+    ("*", "Flip Axes"): "뒤집기 축",
+    ("*", "Select axes to flip"): "뒤집을 축 선택",
+    ("*", "Flip X axis"): "X 축 뒤집기",
+    ("*", "Flip Y axis"): "Y 축 뒤집기",
+    ("*", "Flip Z axis"): "Z 축 뒤집기",
+    ("*", "Mirror Options:"): "대칭 옵션:",
+    ("*", "Normalize Options:"): "정규화 옵션:",
+    ("*", "Merge Options:"): "병합 옵션:",
+    ("*", "Split Options:"): "분할 옵션:",
+    ("*", "Split Left/Right Options:"): "좌/우 분할 옵션:",
+    ("*", "Smooth Options:"): "스무딩 옵션:",
+    ("*", "Transfer Options:"): "전송 옵션:",
+    ("*", "Clean Options:"): "정리 옵션:",
+    ("*", "Symmetrize Options:"): "대칭화 옵션:",
+    ("*", "Randomize Options:"): "무작위화 옵션:",
+    ("*", "Flip Options:"): "뒤집기 옵션:",
+    ("*", "Duplicate Mirror Options:"): "대칭 복제 옵션:",
+    ("*", "Please select a target mesh"): "대상 메쉬를 선택해주세요",
+    ("*", "No shape keys selected for the action"): "작업할 쉐이프 키가 선택되지 않았습니다",
+    ("*", "Interactive Shape Key Adjustment"): "대화형 쉐이프 키 조정",
+    ("*", "Drag to change the smoothing strength, scroll to change iterations"): "드래그로 스무딩 강도 변경, 스크롤로 반복 횟수 변경",
+    ("*", "Drag to change the largest displacement"): "드래그로 최대 변위 변경",
+    ("*", "Drag to change the split threshold (preview shows the high part)"): "드래그로 분할 임계값 변경 (미리보기는 큰 변형 부분 표시)",
+    ("*", "Smooth strength, normalize target length or split threshold"): "스무딩 강도, 정규화 목표 길이 또는 분할 임계값",
+    ("*", "No deformation found in shape key"): "쉐이프 키에서 변형을 찾을 수 없습니다",
+    ("*", "Bulk Transfer Shape Keys"): "쉐이프 키 일괄 전송",
+    ("*", "Source Mesh"): "소스 메쉬",
+    ("*", "Mesh to copy shape keys from"): "쉐이프 키를 복사해 올 메쉬",
+    ("*", "Wildcard pattern for shape keys to transfer (e.g. mouth*, *_L)"): "전송할 쉐이프 키의 와일드카드 패턴 (예: mouth*, *_L)",
+    ("*", "Replace Existing"): "기존 항목 교체",
+    ("*", "Overwrite target shape keys with the same name instead of adding new ones"): "새로 추가하지 않고 같은 이름의 대상 쉐이프 키를 덮어씀",
+    ("*", "Skip Threshold"): "건너뛰기 임계값",
+    ("*", "Skip keys whose transferred deformation stays below this distance on a target"): "대상에서 전송된 변형이 이 거리보다 작은 키는 건너뜀",
+    ("*", "Source:"): "소스:",
+    ("*", "Targets:"): "대상:",
+    ("*", "Please select a source mesh with shape keys"): "쉐이프 키가 있는 소스 메쉬를 선택해주세요",
+    ("*", "Please select at least one target mesh"): "대상 메쉬를 하나 이상 선택해주세요",
+    ("*", "No shape keys match the pattern"): "패턴과 일치하는 쉐이프 키가 없습니다",
+    ("*", "Please select a mesh with shape keys"): "쉐이프 키가 있는 메쉬를 선택해주세요",
+    ("*", "Find Duplicate Shape Keys"): "중복 쉐이프 키 찾기",
+    ("*", "Tolerance"): "허용 오차",
+    ("*", "Largest difference between two keys, relative to their size, still counted as a duplicate"): "중복으로 간주되는 두 키 사이의 최대 차이 (키 크기 대비)",
+    ("*", "Resolve"): "처리 방법",
+    ("*", "Report Only"): "보고만 하기",
+    ("*", "List the duplicate groups without changing anything"): "아무것도 바꾸지 않고 중복 그룹만 나열",
+    ("*", "Replace the first key of each group by the group average and remove the others"): "각 그룹의 첫 키를 그룹 평균으로 바꾸고 나머지를 제거",
+    ("*", "Remove"): "제거",
+    ("*", "Keep the first key of each group and remove the others"): "각 그룹의 첫 키만 남기고 나머지를 제거",
+    ("*", "Clean All Shape Keys"): "모든 쉐이프 키 정리",
+    ("*", "Scope"): "범위",
+    ("*", "Active Mesh"): "활성 메쉬",
+    ("*", "Clean the active mesh only"): "활성 메쉬만 정리",
+    ("*", "Selected Meshes"): "선택된 메쉬",
+    ("*", "Clean all selected meshes"): "선택된 모든 메쉬 정리",
+    ("*", "Clean every mesh in the scene"): "씬의 모든 메쉬 정리",
+    ("*", "Threshold"): "임계값",
+    ("*", "Snap vertices that move less than this distance back to the basis"): "이 거리보다 적게 움직인 정점을 베이스 위치로 되돌림",
+    ("*", "Remove Empty Keys"): "빈 키 제거",
+    ("*", "Remove shape keys that have no displacement left after cleaning"): "정리 후 변위가 남지 않은 쉐이프 키 제거",
+    ("*", "Export Library"): "라이브러리 내보내기",
+    ("*", "Import Library"): "라이브러리 가져오기",
+    ("*", "Export Shape Key Library"): "쉐이프 키 라이브러리 내보내기",
+    ("*", "Wildcard pattern for shape keys to export (e.g. mouth*, *_L)"): "내보낼 쉐이프 키의 와일드카드 패턴 (예: mouth*, *_L)",
+    ("*", "Precision"): "정밀도",
+    ("*", "Float32"): "Float32",
+    ("*", "Store deltas at full precision"): "델타를 전체 정밀도로 저장",
+    ("*", "Float16"): "Float16",
+    ("*", "Store deltas at half precision, halving the file size"): "델타를 절반 정밀도로 저장하여 파일 크기를 절반으로 줄임",
+    ("*", "Import Shape Key Library"): "쉐이프 키 라이브러리 가져오기",
+    ("*", "Wildcard pattern for library shape keys to import (e.g. mouth*, *_L)"): "가져올 라이브러리 쉐이프 키의 와일드카드 패턴 (예: mouth*, *_L)",
+    ("*", "Overwrite shape keys with the same name instead of adding new ones"): "새로 추가하지 않고 같은 이름의 쉐이프 키를 덮어씀",
+    ("*", "Ignore Topology"): "토폴로지 무시",
+    ("*", "Import even if the edges differ from the exported mesh, as long as the vertex count matches"): "정점 수만 같으면 엣지가 내보낸 메쉬와 달라도 가져옴",
+    ("*", "Create Corrective Shape Key"): "보정 쉐이프 키 생성",
+    ("*", "Target"): "대상",
+    ("*", "Where the corrected shape is taken from"): "보정된 형태를 가져올 곳",
+    ("*", "A shape key sculpted as the full corrected pose"): "보정된 포즈 전체로 스컬프트한 쉐이프 키",
+    ("*", "Evaluated Pose"): "평가된 포즈",
+    ("*", "The current pose with shape keys, modifiers and armature evaluated"): "쉐이프 키, 모디파이어, 아마추어가 평가된 현재 포즈",
+    ("*", "Another mesh with the same vertex count"): "정점 수가 같은 다른 메쉬",
+    ("*", "Target Shape Key"): "대상 쉐이프 키",
+    ("*", "Sculpted shape key holding the corrected pose"): "보정된 포즈를 담은 스컬프트 쉐이프 키",
+    ("*", "Target Object"): "대상 오브젝트",
+    ("*", "Mesh holding the corrected pose"): "보정된 포즈를 담은 메쉬",
+    ("*", "Name of the corrective key, empty joins the driving key names"): "보정 키의 이름, 비워두면 구동 키 이름을 이어 붙임",
+    ("*", "Ignore corrections smaller than this distance"): "이 거리보다 작은 보정은 무시",
+    ("*", "Add Driver"): "드라이버 추가",
+    ("*", "Drive the corrective by the product of the driving key values"): "구동 키 값의 곱으로 보정 키를 구동",
+    ("*", "Driving Keys:"): "구동 키:",
+    ("*", "Please select at least one driving shape key"): "구동 쉐이프 키를 하나 이상 선택해주세요",
+    ("*", "Driving key weights must not be zero"): "구동 키 가중치는 0이 될 수 없습니다",
+    ("*", "Please choose a target for the corrected pose"): "보정된 포즈의 대상을 선택해주세요",
+    ("*", "Bake Pose to Shape Key"): "포즈를 쉐이프 키로 베이크",
+    ("*", "Name of the baked key, frame numbers are appended for a frame range"): "베이크된 키의 이름, 프레임 범위에서는 프레임 번호가 붙음",
+    ("*", "Frame Range"): "프레임 범위",
+    ("*", "Bake one numbered key per frame instead of only the current pose"): "현재 포즈만이 아니라 프레임마다 번호가 붙은 키를 하나씩 베이크",
+    ("*", "Start"): "시작",
+    ("*", "First frame to bake"): "베이크할 첫 프레임",
+    ("*", "End"): "끝",
+    ("*", "Last frame to bake"): "베이크할 마지막 프레임",
+    ("*", "Step"): "간격",
+    ("*", "Bake every n-th frame"): "n 프레임마다 베이크",
+    ("*", "End frame must not be before the start frame"): "끝 프레임은 시작 프레임보다 앞설 수 없습니다",
 }
 
 # 일본어 번역
@@ -441,6 +662,227 @@ ja_JP = {
     ("*", "Show confirmation dialog"): "確認ダイアログを表示",
     ("*", "Name of the new bone (editable)"): "新しいボーンの名前（編集可能）",
     ("*", "Suggested name based on shape key"): "シェイプキーに基づく推奨名",
+    
+    # Shape key adjustment tools
+    ("*", "Shape Key Statistics"): "シェイプキー統計",
+    ("*", "Show Shape Key Statistics"): "シェイプキー統計を表示",
+    ("*", "Show displacement statistics of the active mesh's shape keys"): "アクティブメッシュのシェイプキーの変位統計を表示",
+    ("*", "Refresh Shape Key Statistics"): "シェイプキー統計を更新",
+    ("*", "Press refresh to compute statistics"): "更新を押して統計を計算してください",
+    ("*", "Sort By"): "並べ替え",
+    ("*", "Column used to order the shape key statistics"): "シェイプキー統計の並べ替えに使う列",
+    ("*", "Descending"): "降順",
+    ("*", "Sort the shape key statistics in descending order"): "シェイプキー統計を降順で並べ替え",
+    ("*", "Sort by shape key name"): "シェイプキー名で並べ替え",
+    ("*", "Max"): "最大",
+    ("*", "Sort by maximum displacement"): "最大変位で並べ替え",
+    ("*", "Mean"): "平均",
+    ("*", "Sort by mean displacement of affected vertices"): "影響を受ける頂点の平均変位で並べ替え",
+    ("*", "Affected"): "影響頂点",
+    ("*", "Sort by number of affected vertices"): "影響を受ける頂点数で並べ替え",
+    ("*", "History Memory Limit"): "履歴メモリ上限",
+    ("*", "Memory in MB the shape key adjustment history may use before dropping the oldest steps"): "最も古いステップを破棄するまでにシェイプキー調整履歴が使用できるメモリ (MB)",
+    ("*", "MB"): "MB",
+    ("*", "Undo Shape Key Adjustment"): "シェイプキー調整を元に戻す",
+    ("*", "Redo Shape Key Adjustment"): "シェイプキー調整をやり直す",
+    ("*", "Cancelled, changes rolled back"): "キャンセルされ、変更は元に戻されました",
+    ("*", "Shape Key Adjustments"): "シェイプキー調整",
+    ("*", "Shape Key Selection:"): "シェイプキーの選択:",
+    ("*", "Action:"): "アクション:",
+    ("*", "Action"): "アクション",
+    ("*", "Target Keys"): "対象キー",
+    ("*", "Shape keys the action is applied to"): "アクションを適用するシェイプキー",
+    ("*", "Active"): "アクティブ",
+    ("*", "Only the chosen shape key"): "選択したシェイプキーのみ",
+    ("*", "Selected"): "選択",
+    ("*", "Shape keys checked in the list"): "リストでチェックされたシェイプキー",
+    ("*", "All"): "すべて",
+    ("*", "All shape keys except the basis"): "ベース以外のすべてのシェイプキー",
+    ("*", "Pattern"): "パターン",
+    ("*", "Shape keys whose name matches a wildcard pattern"): "名前がワイルドカードパターンに一致するシェイプキー",
+    ("*", "Name Pattern"): "名前パターン",
+    ("*", "Wildcard pattern for shape key names (e.g. mouth*, *_L)"): "シェイプキー名のワイルドカードパターン (例: mouth*, *_L)",
+    ("*", "Include this shape key in the batch"): "このシェイプキーを一括処理に含める",
+    ("*", "Weight"): "ウェイト",
+    ("*", "Weight of this shape key when merging (negative subtracts)"): "結合時のこのシェイプキーのウェイト (負の値は減算)",
+    ("*", "Use this mesh as a target"): "このメッシュをターゲットとして使用",
+    ("*", "Merged"): "結合済み",
+    ("*", "Basis"): "ベース",
+    ("*", "Backend"): "バックエンド",
+    ("*", "Implementation used to compute the adjustment"): "調整の計算に使用する実装",
+    ("*", "Array"): "配列",
+    ("*", "Vectorized NumPy backend"): "ベクトル化された NumPy バックエンド",
+    ("*", "Reference"): "リファレンス",
+    ("*", "Per-vertex reference loops, for checking results"): "結果確認用の頂点ごとのリファレンスループ",
+    ("*", "Axis to mirror along"): "ミラーする軸",
+    ("*", "X Axis"): "X 軸",
+    ("*", "Mirror along X axis"): "X 軸に沿ってミラー",
+    ("*", "Y Axis"): "Y 軸",
+    ("*", "Mirror along Y axis"): "Y 軸に沿ってミラー",
+    ("*", "Z Axis"): "Z 軸",
+    ("*", "Mirror along Z axis"): "Z 軸に沿ってミラー",
+    ("*", "Symmetry Tolerance"): "対称許容誤差",
+    ("*", "Maximum distance between a vertex and its mirrored partner"): "頂点とミラー側の頂点との最大距離",
+    ("*", "Symmetry"): "対称",
+    ("*", "How mirror partners are found"): "ミラー側の頂点の探し方",
+    ("*", "Position"): "位置",
+    ("*", "Pair vertices whose mirrored positions match within the tolerance"): "ミラー位置が許容誤差内で一致する頂点を対応付け",
+    ("*", "Topology"): "トポロジー",
+    ("*", "Pair vertices by walking the mesh from its centre edge, for asymmetric scans and sculpts"): "中心エッジからメッシュをたどって頂点を対応付け (非対称なスキャンやスカルプト用)",
+    ("*", "Set Symmetry Centre Edge"): "対称中心エッジを設定",
+    ("*", "Set a centre edge in Edit Mode first"): "先に編集モードで中心エッジを設定してください",
+    ("*", "Select exactly one edge on the centre line"): "中心線上のエッジを1つだけ選択してください",
+    ("*", "Topology symmetry is only available with the Array backend"): "トポロジー対称は配列バックエンドでのみ使用できます",
+    ("*", "Select shape keys to merge"): "結合するシェイプキーを選択",
+    ("*", "Name for the merged shape key"): "結合後のシェイプキーの名前",
+    ("*", "Target Length"): "目標の長さ",
+    ("*", "Largest displacement of the shape key after normalizing"): "正規化後のシェイプキーの最大変位",
+    ("*", "Threshold for splitting shape key"): "シェイプキー分割のしきい値",
+    ("*", "Falloff"): "減衰",
+    ("*", "Width of the smooth blend around the split threshold, 0 for a hard split"): "分割しきい値周辺の滑らかなブレンド幅、0 ではっきり分割",
+    ("*", "Bands"): "バンド数",
+    ("*", "Number of magnitude bands, more than 2 uses evenly spaced thresholds"): "変形量のバンド数、2 より大きい場合は等間隔のしきい値を使用",
+    ("*", "Split Left/Right"): "左右分割",
+    ("*", "Split shape key into left and right halves"): "シェイプキーを左右の半分に分割",
+    ("*", "Center Falloff"): "中心の減衰",
+    ("*", "Width of the blend band around the center line, 0 for a hard split"): "中心線周辺のブレンド帯の幅、0 ではっきり分割",
+    ("*", "Strength of smoothing effect"): "スムーズ効果の強さ",
+    ("*", "Iterations"): "反復回数",
+    ("*", "Number of smoothing passes"): "スムーズの反復回数",
+    ("*", "Pin Boundary"): "境界を固定",
+    ("*", "Keep vertices on open mesh boundaries in place"): "開いたメッシュ境界の頂点をその場に保持",
+    ("*", "Select target mesh for transfer"): "転送先のメッシュを選択",
+    ("*", "Minimum deformation threshold"): "最小変形しきい値",
+    ("*", "Symmetrize Direction"): "対称化の方向",
+    ("*", "Direction for symmetrization"): "対称化の方向",
+    ("*", "X+ to X-"): "X+ → X-",
+    ("*", "Positive X to negative X"): "正の X から負の X へ",
+    ("*", "X- to X+"): "X- → X+",
+    ("*", "Negative X to positive X"): "負の X から正の X へ",
+    ("*", "Y+ to Y-"): "Y+ → Y-",
+    ("*", "Positive Y to negative Y"): "正の Y から負の Y へ",
+    ("*", "Y- to Y+"): "Y- → Y+",
+    ("*", "Negative Y to positive Y"): "負の Y から正の Y へ",
+    ("*", "Z+ to Z-"): "Z+ → Z-",
+    ("*", "Positive Z to negative Z"): "正の Z から負の Z へ",
+    ("*", "Z- to Z+"): "Z- → Z+",
+    ("*", "Negative Z to positive Z"): "負の Z から正の Z へ",
+    ("*", "Strength of random variation"): "ランダムな変化の強さ",
+    ("*", "Seed"): "シード",
+    ("*", "Seed for the random generator, the same seed gives the same result"): "乱数生成器のシード、同じシードは同じ結果になります",
+    ("*", "Noise Scale"): "ノイズスケール",
+    ("*", "Size of smooth noise features, 0 for independent per-vertex noise"): "滑らかなノイズの模様の大きさ、0 で頂点ごとに独立したノイズ",
+    ("*", "Vertex Group"): "頂点グループ",
+    ("*", "Limit the effect to this vertex group, weighted by its weights"): "効果をこの頂点グループに限定し、そのウェイトで重み付け",
+    ("*", "Vertex group masks are only available with the Array backend"): "頂点グループマスクは配列バックエンドでのみ使用できます",
+    ("*", "Mask:"): "マスク:",
+    ("*", "Chunked Execution"): "分割実行",
+    ("*", "Process in chunks with a progress bar so the UI stays responsive; Esc cancels and rolls back"): "プログレスバー付きで分割処理し UI の応答性を保ちます。Esc でキャンセルして元に戻します",
+    ("*", "Adjust Last Run"): "前回の実行を調整",
+    ("*", "Re-run the last adjustment of the same keys from its original data with the current settings instead of applying on top of it"): "同じキーの前回の調整を上から重ねず、元のデータから現在の設定で再実行",
+    ("*", "Flip Axes"): "反転軸",
+    ("*", "Select axes to flip"): "反転する軸を選択",
+    ("*", "Flip X axis"): "X 軸を反転",
+    ("*", "Flip Y axis"): "Y 軸を反転",
+    ("*", "Flip Z axis"): "Z 軸を反転",
+    ("*", "Mirror Options:"): "ミラーオプション:",
+    ("*", "Normalize Options:"): "正規化オプション:",
+    ("*", "Merge Options:"): "結合オプション:",
+    ("*", "Split Options:"): "分割オプション:",
+    ("*", "Split Left/Right Options:"): "左右分割オプション:",
+    ("*", "Smooth Options:"): "スムーズオプション:",
+    ("*", "Transfer Options:"): "転送オプション:",
+    ("*", "Clean Options:"): "クリーンオプション:",
+    ("*", "Symmetrize Options:"): "対称化オプション:",
+    ("*", "Randomize Options:"): "ランダム化オプション:",
+    ("*", "Flip Options:"): "反転オプション:",
+    ("*", "Duplicate Mirror Options:"): "ミラーコピーオプション:",
+    ("*", "Please select a target mesh"): "ターゲットメッシュを選択してください",
+    ("*", "No shape keys selected for the action"): "アクションの対象となるシェイプキーが選択されていません",
+    ("*", "Interactive Shape Key Adjustment"): "インタラクティブなシェイプキー調整",
+    ("*", "Drag to change the smoothing strength, scroll to change iterations"): "ドラッグでスムーズ強度、スクロールで反復回数を変更",
+    ("*", "Drag to change the largest displacement"): "ドラッグで最大変位を変更",
+    ("*", "Drag to change the split threshold (preview shows the high part)"): "ドラッグで分割しきい値を変更 (プレビューは変形の大きい部分を表示)",
+    ("*", "Smooth strength, normalize target length or split threshold"): "スムーズ強度、正規化の目標の長さ、または分割しきい値",
+    ("*", "No deformation found in shape key"): "シェイプキーに変形が見つかりません",
+    ("*", "Bulk Transfer Shape Keys"): "シェイプキーを一括転送",
+    ("*", "Source Mesh"): "ソースメッシュ",
+    ("*", "Mesh to copy shape keys from"): "シェイプキーのコピー元メッシュ",
+    ("*", "Wildcard pattern for shape keys to transfer (e.g. mouth*, *_L)"): "転送するシェイプキーのワイルドカードパターン (例: mouth*, *_L)",
+    ("*", "Replace Existing"): "既存を置き換え",
+    ("*", "Overwrite target shape keys with the same name instead of adding new ones"): "新規追加せず同じ名前のターゲットシェイプキーを上書き",
+    ("*", "Skip Threshold"): "スキップしきい値",
+    ("*", "Skip keys whose transferred deformation stays below this distance on a target"): "ターゲット上で転送された変形がこの距離未満のキーをスキップ",
+    ("*", "Source:"): "ソース:",
+    ("*", "Targets:"): "ターゲット:",
+    ("*", "Please select a source mesh with shape keys"): "シェイプキーのあるソースメッシュを選択してください",
+    ("*", "Please select at least one target mesh"): "ターゲットメッシュを1つ以上選択してください",
+    ("*", "No shape keys match the pattern"): "パターンに一致するシェイプキーがありません",
+    ("*", "Please select a mesh with shape keys"): "シェイプキーのあるメッシュを選択してください",
+    ("*", "Find Duplicate Shape Keys"): "重複したシェイプキーを検索",
+    ("*", "Tolerance"): "許容誤差",
+    ("*", "Largest difference between two keys, relative to their size, still counted as a duplicate"): "重複と見なされる2つのキー間の最大差 (キーの大きさに対する比率)",
+    ("*", "Resolve"): "処理方法",
+    ("*", "Report Only"): "レポートのみ",
+    ("*", "List the duplicate groups without changing anything"): "何も変更せずに重複グループを一覧表示",
+    ("*", "Replace the first key of each group by the group average and remove the others"): "各グループの最初のキーをグループの平均で置き換え、他を削除",
+    ("*", "Remove"): "削除",
+    ("*", "Keep the first key of each group and remove the others"): "各グループの最初のキーを残し、他を削除",
+    ("*", "Clean All Shape Keys"): "すべてのシェイプキーをクリーン",
+    ("*", "Scope"): "範囲",
+    ("*", "Active Mesh"): "アクティブメッシュ",
+    ("*", "Clean the active mesh only"): "アクティブメッシュのみクリーン",
+    ("*", "Selected Meshes"): "選択したメッシュ",
+    ("*", "Clean all selected meshes"): "選択したすべてのメッシュをクリーン",
+    ("*", "Clean every mesh in the scene"): "シーン内のすべてのメッシュをクリーン",
+    ("*", "Threshold"): "しきい値",
+    ("*", "Snap vertices that move less than this distance back to the basis"): "この距離未満しか動かない頂点をベースに戻す",
+    ("*", "Remove Empty Keys"): "空のキーを削除",
+    ("*", "Remove shape keys that have no displacement left after cleaning"): "クリーン後に変位が残らないシェイプキーを削除",
+    ("*", "Export Library"): "ライブラリを書き出し",
+    ("*", "Import Library"): "ライブラリを読み込み",
+    ("*", "Export Shape Key Library"): "シェイプキーライブラリを書き出し",
+    ("*", "Wildcard pattern for shape keys to export (e.g. mouth*, *_L)"): "書き出すシェイプキーのワイルドカードパターン (例: mouth*, *_L)",
+    ("*", "Precision"): "精度",
+    ("*", "Float32"): "Float32",
+    ("*", "Store deltas at full precision"): "差分を完全な精度で保存",
+    ("*", "Float16"): "Float16",
+    ("*", "Store deltas at half precision, halving the file size"): "差分を半精度で保存し、ファイルサイズを半分にする",
+    ("*", "Import Shape Key Library"): "シェイプキーライブラリを読み込み",
+    ("*", "Wildcard pattern for library shape keys to import (e.g. mouth*, *_L)"): "読み込むライブラリのシェイプキーのワイルドカードパターン (例: mouth*, *_L)",
+    ("*", "Overwrite shape keys with the same name instead of adding new ones"): "新規追加せず同じ名前のシェイプキーを上書き",
+    ("*", "Ignore Topology"): "トポロジーを無視",
+    ("*", "Import even if the edges differ from the exported mesh, as long as the vertex count matches"): "頂点数が一致すれば、エッジが書き出したメッシュと異なっていても読み込む",
+    ("*", "Create Corrective Shape Key"): "補正シェイプキーを作成",
+    ("*", "Target"): "ターゲット",
+    ("*", "Where the corrected shape is taken from"): "補正された形状の取得元",
+    ("*", "A shape key sculpted as the full corrected pose"): "補正後のポーズ全体としてスカルプトしたシェイプキー",
+    ("*", "Evaluated Pose"): "評価されたポーズ",
+    ("*", "The current pose with shape keys, modifiers and armature evaluated"): "シェイプキー、モディファイアー、アーマチュアを評価した現在のポーズ",
+    ("*", "Another mesh with the same vertex count"): "頂点数が同じ別のメッシュ",
+    ("*", "Target Shape Key"): "ターゲットシェイプキー",
+    ("*", "Sculpted shape key holding the corrected pose"): "補正後のポーズを持つスカルプトしたシェイプキー",
+    ("*", "Target Object"): "ターゲットオブジェクト",
+    ("*", "Mesh holding the corrected pose"): "補正後のポーズを持つメッシュ",
+    ("*", "Name of the corrective key, empty joins the driving key names"): "補正キーの名前、空の場合は駆動キーの名前を連結",
+    ("*", "Ignore corrections smaller than this distance"): "この距離より小さい補正を無視",
+    ("*", "Add Driver"): "ドライバーを追加",
+    ("*", "Drive the corrective by the product of the driving key values"): "駆動キーの値の積で補正キーを駆動",
+    ("*", "Driving Keys:"): "駆動キー:",
+    ("*", "Please select at least one driving shape key"): "駆動シェイプキーを1つ以上選択してください",
+    ("*", "Driving key weights must not be zero"): "駆動キーのウェイトは 0 にできません",
+    ("*", "Please choose a target for the corrected pose"): "補正後のポーズのターゲットを選択してください",
+    ("*", "Bake Pose to Shape Key"): "ポーズをシェイプキーにベイク",
+    ("*", "Name of the baked key, frame numbers are appended for a frame range"): "ベイクしたキーの名前、フレーム範囲ではフレーム番号が付加されます",
+    ("*", "Frame Range"): "フレーム範囲",
+    ("*", "Bake one numbered key per frame instead of only the current pose"): "現在のポーズだけでなくフレームごとに番号付きキーをベイク",
+    ("*", "Start"): "開始",
+    ("*", "First frame to bake"): "ベイクする最初のフレーム",
+    ("*", "End"): "終了",
+    ("*", "Last frame to bake"): "ベイクする最後のフレーム",
+    ("*", "Step"): "ステップ",
+    ("*", "Bake every n-th frame"): "n フレームごとにベイク",
+    ("*", "End frame must not be before the start frame"): "終了フレームは開始フレームより前にできません",
 }
 
 # 중국어 번역
@@ -655,6 +1097,227 @@ zh_CN = {
     ("*", "Show confirmation dialog"): "显示确认对话框",
     ("*", "Name of the new bone (editable)"): "新骨骼的名称（可编辑）",
     ("*", "Suggested name based on shape key"): "基于形态键的建议名称",
+    
+    # Shape key adjustment tools
+    ("*", "Shape Key Statistics"): "形态键统计",
+    ("*", "Show Shape Key Statistics"): "显示形态键统计",
+    ("*", "Show displacement statistics of the active mesh's shape keys"): "显示活动网格形态键的位移统计",
+    ("*", "Refresh Shape Key Statistics"): "刷新形态键统计",
+    ("*", "Press refresh to compute statistics"): "按刷新以计算统计",
+    ("*", "Sort By"): "排序方式",
+    ("*", "Column used to order the shape key statistics"): "用于排序形态键统计的列",
+    ("*", "Descending"): "降序",
+    ("*", "Sort the shape key statistics in descending order"): "按降序排列形态键统计",
+    ("*", "Sort by shape key name"): "按形态键名称排序",
+    ("*", "Max"): "最大",
+    ("*", "Sort by maximum displacement"): "按最大位移排序",
+    ("*", "Mean"): "平均",
+    ("*", "Sort by mean displacement of affected vertices"): "按受影响顶点的平均位移排序",
+    ("*", "Affected"): "受影响顶点",
+    ("*", "Sort by number of affected vertices"): "按受影响顶点数量排序",
+    ("*", "History Memory Limit"): "历史内存上限",
+    ("*", "Memory in MB the shape key adjustment history may use before dropping the oldest steps"): "在丢弃最旧步骤之前形态键调整历史可使用的内存 (MB)",
+    ("*", "MB"): "MB",
+    ("*", "Undo Shape Key Adjustment"): "撤销形态键调整",
+    ("*", "Redo Shape Key Adjustment"): "重做形态键调整",
+    ("*", "Cancelled, changes rolled back"): "已取消，更改已回滚",
+    ("*", "Shape Key Adjustments"): "形态键调整",
+    ("*", "Shape Key Selection:"): "形态键选择:",
+    ("*", "Action:"): "操作:",
+    ("*", "Action"): "操作",
+    ("*", "Target Keys"): "目标键",
+    ("*", "Shape keys the action is applied to"): "应用操作的形态键",
+    ("*", "Active"): "活动",
+    ("*", "Only the chosen shape key"): "仅所选形态键",
+    ("*", "Selected"): "选中",
+    ("*", "Shape keys checked in the list"): "列表中勾选的形态键",
+    ("*", "All"): "全部",
+    ("*", "All shape keys except the basis"): "除基础外的所有形态键",
+    ("*", "Pattern"): "模式",
+    ("*", "Shape keys whose name matches a wildcard pattern"): "名称匹配通配符模式的形态键",
+    ("*", "Name Pattern"): "名称模式",
+    ("*", "Wildcard pattern for shape key names (e.g. mouth*, *_L)"): "形态键名称的通配符模式 (例如 mouth*, *_L)",
+    ("*", "Include this shape key in the batch"): "将此形态键包含在批处理中",
+    ("*", "Weight"): "权重",
+    ("*", "Weight of this shape key when merging (negative subtracts)"): "合并时此形态键的权重 (负值为减去)",
+    ("*", "Use this mesh as a target"): "将此网格用作目标",
+    ("*", "Merged"): "已合并",
+    ("*", "Basis"): "基础",
+    ("*", "Backend"): "后端",
+    ("*", "Implementation used to compute the adjustment"): "用于计算调整的实现",
+    ("*", "Array"): "数组",
+    ("*", "Vectorized NumPy backend"): "向量化的 NumPy 后端",
+    ("*", "Reference"): "参考",
+    ("*", "Per-vertex reference loops, for checking results"): "用于检查结果的逐顶点参考循环",
+    ("*", "Axis to mirror along"): "镜像所沿的轴",
+    ("*", "X Axis"): "X 轴",
+    ("*", "Mirror along X axis"): "沿 X 轴镜像",
+    ("*", "Y Axis"): "Y 轴",
+    ("*", "Mirror along Y axis"): "沿 Y 轴镜像",
+    ("*", "Z Axis"): "Z 轴",
+    ("*", "Mirror along Z axis"): "沿 Z 轴镜像",
+    ("*", "Symmetry Tolerance"): "对称容差",
+    ("*", "Maximum distance between a vertex and its mirrored partner"): "顶点与其镜像顶点之间的最大距离",
+    ("*", "Symmetry"): "对称",
+    ("*", "How mirror partners are found"): "查找镜像顶点的方式",
+    ("*", "Position"): "位置",
+    ("*", "Pair vertices whose mirrored positions match within the tolerance"): "将镜像位置在容差内匹配的顶点配对",
+    ("*", "Topology"): "拓扑",
+    ("*", "Pair vertices by walking the mesh from its centre edge, for asymmetric scans and sculpts"): "从中心边遍历网格来配对顶点，适用于不对称的扫描和雕刻",
+    ("*", "Set Symmetry Centre Edge"): "设置对称中心边",
+    ("*", "Set a centre edge in Edit Mode first"): "请先在编辑模式下设置中心边",
+    ("*", "Select exactly one edge on the centre line"): "请在中心线上只选择一条边",
+    ("*", "Topology symmetry is only available with the Array backend"): "拓扑对称仅在数组后端可用",
+    ("*", "Select shape keys to merge"): "选择要合并的形态键",
+    ("*", "Name for the merged shape key"): "合并后形态键的名称",
+    ("*", "Target Length"): "目标长度",
+    ("*", "Largest displacement of the shape key after normalizing"): "标准化后形态键的最大位移",
+    ("*", "Threshold for splitting shape key"): "分割形态键的阈值",
+    ("*", "Falloff"): "衰减",
+    ("*", "Width of the smooth blend around the split threshold, 0 for a hard split"): "分割阈值附近的平滑过渡宽度，0 为硬分割",
+    ("*", "Bands"): "分段数",
+    ("*", "Number of magnitude bands, more than 2 uses evenly spaced thresholds"): "变形量分段数，大于 2 时使用等间距阈值",
+    ("*", "Split Left/Right"): "左右分割",
+    ("*", "Split shape key into left and right halves"): "将形态键分割为左右两半",
+    ("*", "Center Falloff"): "中心衰减",
+    ("*", "Width of the blend band around the center line, 0 for a hard split"): "中心线附近过渡带的宽度，0 为硬分割",
+    ("*", "Strength of smoothing effect"): "平滑效果的强度",
+    ("*", "Iterations"): "迭代次数",
+    ("*", "Number of smoothing passes"): "平滑的迭代次数",
+    ("*", "Pin Boundary"): "固定边界",
+    ("*", "Keep vertices on open mesh boundaries in place"): "保持开放网格边界上的顶点不动",
+    ("*", "Select target mesh for transfer"): "选择传递的目标网格",
+    ("*", "Minimum deformation threshold"): "最小变形阈值",
+    ("*", "Symmetrize Direction"): "对称化方向",
+    ("*", "Direction for symmetrization"): "对称化的方向",
+    ("*", "X+ to X-"): "X+ → X-",
+    ("*", "Positive X to negative X"): "从正 X 到负 X",
+    ("*", "X- to X+"): "X- → X+",
+    ("*", "Negative X to positive X"): "从负 X 到正 X",
+    ("*", "Y+ to Y-"): "Y+ → Y-",
+    ("*", "Positive Y to negative Y"): "从正 Y 到负 Y",
+    ("*", "Y- to Y+"): "Y- → Y+",
+    ("*", "Negative Y to positive Y"): "从负 Y 到正 Y",
+    ("*", "Z+ to Z-"): "Z+ → Z-",
+    ("*", "Positive Z to negative Z"): "从正 Z 到负 Z",
+    ("*", "Z- to Z+"): "Z- → Z+",
+    ("*", "Negative Z to positive Z"): "从负 Z 到正 Z",
+    ("*", "Strength of random variation"): "随机变化的强度",
+    ("*", "Seed"): "种子",
+    ("*", "Seed for the random generator, the same seed gives the same result"): "随机生成器的种子，相同种子得到相同结果",
+    ("*", "Noise Scale"): "噪波尺寸",
+    ("*", "Size of smooth noise features, 0 for independent per-vertex noise"): "平滑噪波特征的尺寸，0 为逐顶点独立噪波",
+    ("*", "Vertex Group"): "顶点组",
+    ("*", "Limit the effect to this vertex group, weighted by its weights"): "将效果限制在此顶点组内，并按其权重加权",
+    ("*", "Vertex group masks are only available with the Array backend"): "顶点组遮罩仅在数组后端可用",
+    ("*", "Mask:"): "遮罩:",
+    ("*", "Chunked Execution"): "分块执行",
+    ("*", "Process in chunks with a progress bar so the UI stays responsive; Esc cancels and rolls back"): "分块处理并显示进度条以保持界面响应；按 Esc 取消并回滚",
+    ("*", "Adjust Last Run"): "调整上次执行",
+    ("*", "Re-run the last adjustment of the same keys from its original data with the current settings instead of applying on top of it"): "对相同键的上次调整不叠加应用，而是从原始数据以当前设置重新执行",
+    ("*", "Flip Axes"): "翻转轴",
+    ("*", "Select axes to flip"): "选择要翻转的轴",
+    ("*", "Flip X axis"): "翻转 X 轴",
+    ("*", "Flip Y axis"): "翻转 Y 轴",
+    ("*", "Flip Z axis"): "翻转 Z 轴",
+    ("*", "Mirror Options:"): "镜像选项:",
+    ("*", "Normalize Options:"): "标准化选项:",
+    ("*", "Merge Options:"): "合并选项:",
+    ("*", "Split Options:"): "分割选项:",
+    ("*", "Split Left/Right Options:"): "左右分割选项:",
+    ("*", "Smooth Options:"): "平滑选项:",
+    ("*", "Transfer Options:"): "传递选项:",
+    ("*", "Clean Options:"): "清理选项:",
+    ("*", "Symmetrize Options:"): "对称化选项:",
+    ("*", "Randomize Options:"): "随机化选项:",
+    ("*", "Flip Options:"): "翻转选项:",
+    ("*", "Duplicate Mirror Options:"): "镜像复制选项:",
+    ("*", "Please select a target mesh"): "请选择目标网格",
+    ("*", "No shape keys selected for the action"): "未选择要操作的形态键",
+    ("*", "Interactive Shape Key Adjustment"): "交互式形态键调整",
+    ("*", "Drag to change the smoothing strength, scroll to change iterations"): "拖动更改平滑强度，滚动更改迭代次数",
+    ("*", "Drag to change the largest displacement"): "拖动更改最大位移",
+    ("*", "Drag to change the split threshold (preview shows the high part)"): "拖动更改分割阈值 (预览显示变形较大的部分)",
+    ("*", "Smooth strength, normalize target length or split threshold"): "平滑强度、标准化目标长度或分割阈值",
+    ("*", "No deformation found in shape key"): "形态键中未找到变形",
+    ("*", "Bulk Transfer Shape Keys"): "批量传递形态键",
+    ("*", "Source Mesh"): "源网格",
+    ("*", "Mesh to copy shape keys from"): "复制形态键的来源网格",
+    ("*", "Wildcard pattern for shape keys to transfer (e.g. mouth*, *_L)"): "要传递的形态键的通配符模式 (例如 mouth*, *_L)",
+    ("*", "Replace Existing"): "替换现有",
+    ("*", "Overwrite target shape keys with the same name instead of adding new ones"): "覆盖同名的目标形态键而不是新增",
+    ("*", "Skip Threshold"): "跳过阈值",
+    ("*", "Skip keys whose transferred deformation stays below this distance on a target"): "跳过在目标上传递后变形小于此距离的键",
+    ("*", "Source:"): "源:",
+    ("*", "Targets:"): "目标:",
+    ("*", "Please select a source mesh with shape keys"): "请选择带有形态键的源网格",
+    ("*", "Please select at least one target mesh"): "请至少选择一个目标网格",
+    ("*", "No shape keys match the pattern"): "没有与模式匹配的形态键",
+    ("*", "Please select a mesh with shape keys"): "请选择带有形态键的网格",
+    ("*", "Find Duplicate Shape Keys"): "查找重复形态键",
+    ("*", "Tolerance"): "容差",
+    ("*", "Largest difference between two keys, relative to their size, still counted as a duplicate"): "仍视为重复的两个键之间的最大差异 (相对于其大小)",
+    ("*", "Resolve"): "处理方式",
+    ("*", "Report Only"): "仅报告",
+    ("*", "List the duplicate groups without changing anything"): "仅列出重复组而不做任何更改",
+    ("*", "Replace the first key of each group by the group average and remove the others"): "用组平均值替换每组的第一个键并删除其余键",
+    ("*", "Remove"): "删除",
+    ("*", "Keep the first key of each group and remove the others"): "保留每组的第一个键并删除其余键",
+    ("*", "Clean All Shape Keys"): "清理所有形态键",
+    ("*", "Scope"): "范围",
+    ("*", "Active Mesh"): "活动网格",
+    ("*", "Clean the active mesh only"): "仅清理活动网格",
+    ("*", "Selected Meshes"): "选中的网格",
+    ("*", "Clean all selected meshes"): "清理所有选中的网格",
+    ("*", "Clean every mesh in the scene"): "清理场景中的所有网格",
+    ("*", "Threshold"): "阈值",
+    ("*", "Snap vertices that move less than this distance back to the basis"): "将移动小于此距离的顶点吸附回基础位置",
+    ("*", "Remove Empty Keys"): "删除空键",
+    ("*", "Remove shape keys that have no displacement left after cleaning"): "删除清理后没有剩余位移的形态键",
+    ("*", "Export Library"): "导出库",
+    ("*", "Import Library"): "导入库",
+    ("*", "Export Shape Key Library"): "导出形态键库",
+    ("*", "Wildcard pattern for shape keys to export (e.g. mouth*, *_L)"): "要导出的形态键的通配符模式 (例如 mouth*, *_L)",
+    ("*", "Precision"): "精度",
+    ("*", "Float32"): "Float32",
+    ("*", "Store deltas at full precision"): "以完整精度存储差值",
+    ("*", "Float16"): "Float16",
+    ("*", "Store deltas at half precision, halving the file size"): "以半精度存储差值，使文件大小减半",
+    ("*", "Import Shape Key Library"): "导入形态键库",
+    ("*", "Wildcard pattern for library shape keys to import (e.g. mouth*, *_L)"): "要导入的库形态键的通配符模式 (例如 mouth*, *_L)",
+    ("*", "Overwrite shape keys with the same name instead of adding new ones"): "覆盖同名的形态键而不是新增",
+    ("*", "Ignore Topology"): "忽略拓扑",
+    ("*", "Import even if the edges differ from the exported mesh, as long as the vertex count matches"): "只要顶点数相同，即使边与导出的网格不同也导入",
+    ("*", "Create Corrective Shape Key"): "创建校正形态键",
+    ("*", "Target"): "目标",
+    ("*", "Where the corrected shape is taken from"): "校正形状的来源",
+    ("*", "A shape key sculpted as the full corrected pose"): "按完整校正姿态雕刻的形态键",
+    ("*", "Evaluated Pose"): "求值后的姿态",
+    ("*", "The current pose with shape keys, modifiers and armature evaluated"): "已对形态键、修改器和骨架求值的当前姿态",
+    ("*", "Another mesh with the same vertex count"): "顶点数相同的另一个网格",
+    ("*", "Target Shape Key"): "目标形态键",
+    ("*", "Sculpted shape key holding the corrected pose"): "包含校正姿态的雕刻形态键",
+    ("*", "Target Object"): "目标物体",
+    ("*", "Mesh holding the corrected pose"): "包含校正姿态的网格",
+    ("*", "Name of the corrective key, empty joins the driving key names"): "校正键的名称，留空则连接驱动键名称",
+    ("*", "Ignore corrections smaller than this distance"): "忽略小于此距离的校正",
+    ("*", "Add Driver"): "添加驱动器",
+    ("*", "Drive the corrective by the product of the driving key values"): "以驱动键值的乘积驱动校正键",
+    ("*", "Driving Keys:"): "驱动键:",
+    ("*", "Please select at least one driving shape key"): "请至少选择一个驱动形态键",
+    ("*", "Driving key weights must not be zero"): "驱动键权重不能为零",
+    ("*", "Please choose a target for the corrected pose"): "请为校正姿态选择目标",
+    ("*", "Bake Pose to Shape Key"): "将姿态烘焙为形态键",
+    ("*", "Name of the baked key, frame numbers are appended for a frame range"): "烘焙键的名称，帧范围时会附加帧号",
+    ("*", "Frame Range"): "帧范围",
+    ("*", "Bake one numbered key per frame instead of only the current pose"): "每帧烘焙一个编号键，而不仅是当前姿态",
+    ("*", "Start"): "开始",
+    ("*", "First frame to bake"): "要烘焙的第一帧",
+    ("*", "End"): "结束",
+    ("*", "Last frame to bake"): "要烘焙的最后一帧",
+    ("*", "Step"): "步长",
+    ("*", "Bake every n-th frame"): "每隔 n 帧烘焙",
+    ("*", "End frame must not be before the start frame"): "结束帧不能早于开始帧",
 }
 
 # 전체 번역 딕셔너리
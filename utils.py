@@ -111,6 +111,46 @@ def setup_shape_key_driver(armature, bone_name, shape_key, transform_type, multi
     except Exception as e:
         return False, str(e)
     
+def setup_corrective_driver(shape_key, driving_names, weights=None):
+    """Drive a corrective shape key by the product of its driving keys' values
+
+    Args:
+        shape_key: Corrective shape key to be controlled
+        driving_names: Names of the driving shape keys on the same Key
+        weights: Driving key values the corrective was captured at, the
+            product is divided by them so the corrective reaches 1.0 there
+    """
+    try:
+        # 기존 드라이버 제거
+        if shape_key.id_data.animation_data:
+            for driver in shape_key.id_data.animation_data.drivers:
+                if driver.data_path == f'key_blocks["{shape_key.name}"].value':
+                    shape_key.id_data.animation_data.drivers.remove(driver)
+
+        driver = shape_key.driver_add('value').driver
+        driver.type = 'SCRIPTED'
+        for i, name in enumerate(driving_names):
+            var = driver.variables.new()
+            var.name = f"key_{i}"
+            var.type = 'SINGLE_PROP'
+
+            target = var.targets[0]
+            target.id_type = 'KEY'
+            target.id = shape_key.id_data
+            target.data_path = f'key_blocks["{name}"].value'
+
+        # 곱으로 조합할 때만 활성화, 캡처한 값에서 1.0
+        expression = " * ".join(f"key_{i}" for i in range(len(driving_names)))
+        scale = math.prod(weights) if weights else 1.0
+        if abs(scale - 1.0) > 1e-6:
+            expression = f"{expression} / {scale:.6g}"
+        driver.expression = expression
+
+        return True, ""
+
+    except Exception as e:
+        return False, str(e)
+
 def get_available_meshes(context):
     """Returns visible mesh objects with shape keys"""
     meshes = [obj for obj in context.scene.objects 